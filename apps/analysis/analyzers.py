@@ -1,132 +1,140 @@
 import os
-from datetime import datetime
 from decimal import Decimal
 
-import matplotlib
 import pandas as pd
 from django.conf import settings
 
 from apps.transaction.models import Transaction
+from apps.transaction.repositories import TransactionRepository
+from apps.utils.dates import local_day_range
 
+from . import chart_cache, rendering
 from .models import Analysis
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-
 
 class Analyzer:
     """
     거래 데이터 기반 분석기.
     """
 
+    # 결과 형식: png/svg는 차트 이미지를 그리고, json은 집계 시리즈만 저장 (렌더링 없음)
+    OUTPUT_FORMATS = ("png", "svg", "json")
+
     def __init__(self, user):
         self.user = user
 
     def get_transactions_in_period(self, start_date, end_date):
+        # 반열린 구간 [start, end)로 비교해야 (account, occurred_at) 인덱스 range scan 가능
+        period_start, period_end = local_day_range(start_date, end_date)
         return (
             Transaction.objects.filter(
                 account__user=self.user,
-                occurred_at__date__gte=start_date,
-                occurred_at__date__lte=end_date,
+                occurred_at__gte=period_start,
+                occurred_at__lt=period_end,
             )
             .select_related("account")
             .order_by("occurred_at")
         )
 
-    def create_dataframe(self, transactions):
-        data = [
-            {
-                "date": transaction.occurred_at.date(),
-                "amount": transaction.amount,
-                "direction": transaction.direction,
-                "method": transaction.method,
-                "description": transaction.description,
-                "account_name": transaction.account.name,
-                "balance_after": transaction.balance_after,
-            }
-            for transaction in transactions
-        ]
-        return pd.DataFrame(data)
-
-    def analyze_total_expense(self, df, start_date, end_date):
-        expense_df = df[df["direction"] == "expense"]
-        daily_expense = expense_df.groupby("date")["amount"].sum().reset_index()
-
-        plt.figure(figsize=(10, 6))
-        plt.plot(daily_expense["date"], daily_expense["amount"], marker="o")
-        plt.title(f"총 지출 분석 ({start_date} ~ {end_date})")
-        plt.xlabel("날짜")
-        plt.ylabel("지출 금액")
-        plt.xticks(rotation=45)
-        plt.grid(True, alpha=0.3)
-
-        return plt, f"총 지출: {self.format_currency(expense_df['amount'].sum())}"
-
-    def analyze_total_income(self, df, start_date, end_date):
-        income_df = df[df["direction"] == "income"]
-        daily_income = income_df.groupby("date")["amount"].sum().reset_index()
-
-        plt.figure(figsize=(10, 6))
-        plt.bar(daily_income["date"].astype(str), daily_income["amount"], color="green", alpha=0.7)
-        plt.title(f"총 수입 분석 ({start_date} ~ {end_date})")
-        plt.xlabel("날짜")
-        plt.ylabel("수입 금액")
-        plt.xticks(rotation=45)
-        plt.grid(True, alpha=0.3, axis="y")
-
-        return plt, f"총 수입: {self.format_currency(income_df['amount'].sum())}"
-
-    def analyze_category_expense(self, df, start_date, end_date):
-        expense_df = df[df["direction"] == "expense"]
-        category_expense = expense_df.groupby("method")["amount"].sum().reset_index()
-
-        plt.figure(figsize=(10, 6))
-        plt.pie(category_expense["amount"], labels=category_expense["method"], autopct="%1.1f%%")
-        plt.title(f"카테고리별 지출 분석 ({start_date} ~ {end_date})")
+    def create_aggregated_dataframe(self, analysis_type, start_date, end_date):
+        """
+        분석 유형에 필요한 집계를 DB(GROUP BY)에서 끝내고 집계 결과 행만 DataFrame으로 만듦
+        - 거래 수와 무관하게 행 수는 일수/결제수단 수/계좌 수 수준으로 작음
+        """
+        if analysis_type == "total_expense":
+            rows = TransactionRepository.get_daily_totals(
+                self.user, "expense", start_date, end_date
+            )
+            columns = ["date", "amount"]
+        elif analysis_type == "total_income":
+            rows = TransactionRepository.get_daily_totals(self.user, "income", start_date, end_date)
+            columns = ["date", "amount"]
+        elif analysis_type == "category_expense":
+            rows = TransactionRepository.get_method_totals(
+                self.user, "expense", start_date, end_date
+            )
+            columns = ["method", "amount"]
+        elif analysis_type == "account_balance":
+            rows = TransactionRepository.get_latest_balances(self.user, start_date, end_date)
+            rows = [
+                {"account_name": row["account__name"], "balance_after": row["balance_after"]}
+                for row in rows
+            ]
+            columns = ["account_name", "balance_after"]
+        else:
+            raise ValueError(f"지원하지 않는 분석 유형: {analysis_type}")
+
+        return pd.DataFrame(list(rows), columns=columns)
+
+    def analyze_total_expense(self, daily_expense, start_date, end_date):
+        spec = {
+            "kind": "line",
+            "title": f"총 지출 분석 ({start_date} ~ {end_date})",
+            "xlabel": "날짜",
+            "ylabel": "지출 금액",
+            "x": list(daily_expense["date"]),
+            "y": self._to_floats(daily_expense["amount"]),
+        }
+        return spec, f"총 지출: {self.format_currency(daily_expense['amount'].sum())}"
+
+    def analyze_total_income(self, daily_income, start_date, end_date):
+        spec = {
+            "kind": "bar",
+            "title": f"총 수입 분석 ({start_date} ~ {end_date})",
+            "xlabel": "날짜",
+            "ylabel": "수입 금액",
+            "x": [str(day) for day in daily_income["date"]],
+            "y": self._to_floats(daily_income["amount"]),
+            "color": "green",
+            "grid_axis": "y",
+        }
+        return spec, f"총 수입: {self.format_currency(daily_income['amount'].sum())}"
+
+    def analyze_category_expense(self, category_expense, start_date, end_date):
+        spec = {
+            "kind": "pie",
+            "title": f"카테고리별 지출 분석 ({start_date} ~ {end_date})",
+            "x": list(category_expense["method"]),
+            "y": self._to_floats(category_expense["amount"]),
+        }
 
         if category_expense.empty:
-            return plt, "카테고리별 지출 없음"
+            return spec, "카테고리별 지출 없음"
 
         breakdown = ", ".join(
             f"{row['method']}: {self.format_currency(row['amount'])}"
             for _, row in category_expense.iterrows()
         )
-        return plt, f"카테고리별 지출 - {breakdown}"
-
-    def analyze_account_balance(self, df, start_date, end_date):
-        latest_balances = (
-            df.sort_values("date").groupby("account_name").last()["balance_after"].reset_index()
-        )
-
-        plt.figure(figsize=(10, 6))
-        plt.bar(
-            latest_balances["account_name"],
-            latest_balances["balance_after"],
-            color="blue",
-            alpha=0.7,
-        )
-        plt.title(f"계좌별 잔액 분석 ({end_date} 기준)")
-        plt.xlabel("계좌명")
-        plt.ylabel("잔액")
-        plt.xticks(rotation=45)
-        plt.grid(True, alpha=0.3, axis="y")
-
-        return plt, f"총 잔액: {self.format_currency(latest_balances['balance_after'].sum())}"
+        return spec, f"카테고리별 지출 - {breakdown}"
+
+    def analyze_account_balance(self, latest_balances, start_date, end_date):
+        spec = {
+            "kind": "bar",
+            "title": f"계좌별 잔액 분석 ({end_date} 기준)",
+            "xlabel": "계좌명",
+            "ylabel": "잔액",
+            "x": list(latest_balances["account_name"]),
+            "y": self._to_floats(latest_balances["balance_after"]),
+            "color": "blue",
+            "grid_axis": "y",
+        }
+        return spec, f"총 잔액: {self.format_currency(latest_balances['balance_after'].sum())}"
 
-    def save_plot_image(self, plot, filename):
-        image_path = os.path.join(settings.MEDIA_ROOT, "analysis_images", filename)
+    def submit_chart(self, spec, filename):
+        # 렌더링 풀에 차트 작성을 맡기고 (MEDIA_ROOT 기준 경로, Future) 반환
+        image_path = os.path.join(settings.MEDIA_ROOT, chart_cache.IMAGE_DIR, filename)
         os.makedirs(os.path.dirname(image_path), exist_ok=True)
-        plot.savefig(image_path, bbox_inches="tight", dpi=150)
-        plot.close()
-        return f"analysis_images/{filename}"
+        return f"{chart_cache.IMAGE_DIR}/{filename}", rendering.submit_render(spec, image_path)
 
-    def run_analysis(self, analysis_type, period_type, start_date, end_date):
+    def start_analysis(self, analysis_type, period_type, start_date, end_date, output="png"):
+        """
+        분석 1건 준비: 집계 → 캐시 확인 → 필요하면 렌더링 제출까지 하고 job(dict) 반환
+        여러 사용자의 job을 먼저 만든 뒤 finish_analysis로 모으면 렌더링이 동시에 진행됨
+        """
         transactions = self.get_transactions_in_period(start_date, end_date)
         if not transactions.exists():
             raise ValueError("분석할 거래 내역이 없습니다.")
 
-        df = self.create_dataframe(transactions)
-
         analysis_methods = {
             "total_expense": self.analyze_total_expense,
             "total_income": self.analyze_total_income,
@@ -136,23 +144,101 @@ class Analyzer:
 
         if analysis_type not in analysis_methods:
             raise ValueError(f"지원하지 않는 분석 유형: {analysis_type}")
+        if output not in self.OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식: {output}")
 
-        plot, description = analysis_methods[analysis_type](df, start_date, end_date)
+        df = self.create_aggregated_dataframe(analysis_type, start_date, end_date)
+        fingerprint = chart_cache.fingerprint(
+            self.user.id, analysis_type, period_type, start_date, end_date, df, output
+        )
+        job = {
+            "analysis_type": analysis_type,
+            "period_type": period_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "output": output,
+            "fingerprint": fingerprint,
+            "cached": None,
+            "future": None,
+            "image_path": None,
+        }
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{analysis_type}_{period_type}_{timestamp}.png"
-        image_path = self.save_plot_image(plot, filename)
+        # 같은 입력으로 만든 차트가 있으면 matplotlib을 호출하지 않고 재사용
+        cached = chart_cache.find_cached_analysis(
+            self.user, fingerprint, needs_image=output != "json"
+        )
+        if cached is not None and not cached.is_deleted:
+            job["cached"] = cached
+            return job
+        if cached is not None:
+            # 휴지통에 있는 분석과 같은 결과: 이미지/설명/시리즈만 재사용해서 새 레코드 생성
+            job["description"] = cached.description
+            job["image_path"] = cached.result_image.name or None
+            job["result_data"] = cached.result_data
+            return job
+
+        spec, job["description"] = analysis_methods[analysis_type](df, start_date, end_date)
+        job["result_data"] = self.series_payload(spec)
+        if output != "json":
+            filename = os.path.basename(
+                chart_cache.image_name(analysis_type, fingerprint, ext=output)
+            )
+            job["image_path"], job["future"] = self.submit_chart(spec, filename)
+            job["spec"] = spec
+        return job
+
+    def finish_analysis(self, job):
+        # 렌더링 완료를 기다린 뒤 Analysis 레코드 생성
+        analysis = self.build_analysis(job)
+        if analysis.pk is None:
+            analysis.save()
+        return analysis
+
+    def build_analysis(self, job):
+        """
+        렌더링 완료를 기다린 뒤 저장 전 Analysis 반환 (캐시 재사용이면 기존 레코드)
+        배치 작업은 이렇게 모은 레코드를 bulk_create로 한 번에 저장함
+        """
+        if job["cached"] is not None:
+            return job["cached"]
+
+        if job["future"] is not None:
+            rendering.wait_render(
+                job["future"],
+                job["spec"],
+                os.path.join(settings.MEDIA_ROOT, job["image_path"]),
+            )
 
-        return Analysis.objects.create(
+        return Analysis(
             user=self.user,
-            about=analysis_type,
-            type=period_type,
-            period_start=start_date,
-            period_end=end_date,
-            description=description,
-            result_image=image_path,
+            about=job["analysis_type"],
+            type=job["period_type"],
+            period_start=job["start_date"],
+            period_end=job["end_date"],
+            description=job["description"],
+            result_image=job["image_path"],
+            output=job["output"],
+            result_data=job["result_data"],
+            fingerprint=job["fingerprint"],
         )
 
+    def run_analysis(self, analysis_type, period_type, start_date, end_date, output="png"):
+        job = self.start_analysis(analysis_type, period_type, start_date, end_date, output)
+        return self.finish_analysis(job)
+
+    @staticmethod
+    def series_payload(spec):
+        # 차트 spec을 JSON으로 저장/응답할 수 있는 간결한 시리즈로 변환 (날짜는 ISO 문자열)
+        payload = {key: value for key, value in spec.items() if key not in ("x", "y")}
+        payload["x"] = [str(value) for value in spec["x"]]
+        payload["y"] = spec["y"]
+        return payload
+
+    @staticmethod
+    def _to_floats(series):
+        # Decimal 시리즈를 렌더링 프로세스로 보내기 좋은 float 리스트로 변환
+        return [float(value) for value in series]
+
     @staticmethod
     def format_currency(value):
         if isinstance(value, Decimal):
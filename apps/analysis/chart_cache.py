@@ -0,0 +1,92 @@
+import hashlib
+import os
+
+from django.conf import settings
+
+from apps.utils.dates import to_date
+
+from .models import Analysis
+
+# 차트 모양(제목, 색상, dpi 등)을 바꾸면 올려서 기존 캐시 이미지를 무효화
+CHART_CACHE_VERSION = 1
+
+IMAGE_DIR = "analysis_images"
+
+
+def fingerprint(user_id, analysis_type, period_type, start_date, end_date, df, output="png"):
+    """
+    차트 입력의 내용 기반 키: (사용자, 분석 유형, 기간, 출력 형식, 집계 결과 데이터) 해시
+    - 같은 데이터면 같은 키 → 같은 이미지 파일명을 쓰므로 렌더링을 건너뛸 수 있음
+    """
+    digest = hashlib.sha256()
+    header = (
+        f"v{CHART_CACHE_VERSION}|{user_id}|{analysis_type}|{period_type}|"
+        f"{to_date(start_date)}|{to_date(end_date)}|{output}\n"
+    )
+    digest.update(header.encode())
+    digest.update(df.to_csv(index=False).encode())
+    return digest.hexdigest()
+
+
+def image_name(analysis_type, key, ext="png"):
+    # MEDIA_ROOT 기준 상대 경로 (Analysis.result_image에 그대로 저장)
+    # result_image(max_length=100)에 들어가도록 해시 앞 32자(128bit)만 사용
+    return f"{IMAGE_DIR}/{analysis_type}_{key[:32]}.{ext}"
+
+
+def image_exists(name):
+    return bool(name) and os.path.exists(os.path.join(settings.MEDIA_ROOT, name))
+
+
+def find_cached_analysis(user, key, needs_image=True):
+    """
+    같은 지문으로 만든 분석 레코드 조회 (휴지통 포함, 살아있는 레코드 우선)
+    - 이미지 파일이 지워진 레코드는 재사용하지 않음 (json 형식은 이미지 확인 생략)
+    """
+    candidates = Analysis.all_objects.filter(user=user, fingerprint=key).order_by(
+        "-deleted_at", "-id"
+    )
+    for analysis in candidates:
+        if not needs_image or image_exists(analysis.result_image.name):
+            return analysis
+    return None
+
+
+def evict_orphaned_images(max_bytes=None):
+    """
+    analysis_images 디렉터리가 max_bytes를 넘으면, 어떤 Analysis도(휴지통 포함) 참조하지 않는
+    이미지를 오래된 순서로 지워서 한도 아래로 맞춤. 참조 중인 이미지는 지우지 않음
+    """
+    if max_bytes is None:
+        max_bytes = settings.ANALYSIS_IMAGE_CACHE_MAX_BYTES
+
+    image_dir = os.path.join(settings.MEDIA_ROOT, IMAGE_DIR)
+    if not os.path.isdir(image_dir):
+        return {"deleted": 0, "freed_bytes": 0, "total_bytes": 0}
+
+    files = []
+    total = 0
+    with os.scandir(image_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+                total += stat.st_size
+
+    deleted = freed = 0
+    if total > max_bytes:
+        referenced = set(
+            Analysis.all_objects.exclude(result_image="")
+            .exclude(result_image__isnull=True)
+            .values_list("result_image", flat=True)
+        )
+        for _, name, size in sorted(files):
+            if total - freed <= max_bytes:
+                break
+            if f"{IMAGE_DIR}/{name}" in referenced:
+                continue
+            os.remove(os.path.join(image_dir, name))
+            deleted += 1
+            freed += size
+
+    return {"deleted": deleted, "freed_bytes": freed, "total_bytes": total - freed}
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analysis", "0002_analysis_deleted_at_analysis_deleted_by"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="fingerprint",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=64),
+        ),
+    ]
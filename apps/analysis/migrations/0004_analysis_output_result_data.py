@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("analysis", "0003_analysis_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="analysis",
+            name="output",
+            field=models.CharField(
+                choices=[("png", "PNG 이미지"), ("svg", "SVG 이미지"), ("json", "JSON 시리즈")],
+                default="png",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="analysis",
+            name="result_data",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
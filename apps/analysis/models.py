@@ -15,6 +15,12 @@ class Analysis(TrashableModel):
         ("monthly", "매월"),
     ]
 
+    OUTPUT_CHOICES = [
+        ("png", "PNG 이미지"),
+        ("svg", "SVG 이미지"),
+        ("json", "JSON 시리즈"),
+    ]
+
     ANALYSIS_ABOUT_CHOICES = [
         ("total_expense", "총 지출"),
         ("total_income", "총 수입"),
@@ -29,6 +35,12 @@ class Analysis(TrashableModel):
     period_end = models.DateField()
     description = models.TextField()
     result_image = models.ImageField(upload_to="analysis_images/", blank=True, null=True)
+    # 결과 형식. json이면 이미지 없이 result_data만 저장 (프론트에서 직접 차트를 그림)
+    output = models.CharField(max_length=10, choices=OUTPUT_CHOICES, default="png")
+    # 차트에 쓰인 집계 시리즈 {"kind", "title", "x", "y", ...} (모든 형식에서 저장)
+    result_data = models.JSONField(blank=True, null=True)
+    # 차트 입력(사용자, 유형, 기간, 집계 데이터) 해시. 같은 입력이면 이미지/레코드 재사용
+    fingerprint = models.CharField(max_length=64, blank=True, default="", db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
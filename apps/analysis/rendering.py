@@ -0,0 +1,184 @@
+"""
+분석 차트 렌더링
+
+- pyplot 전역 상태 대신 Figure/FigureCanvasAgg 객체 API만 사용 → 스레드/프로세스 어디서 그려도 안전
+- 입력은 집계가 끝난 시리즈(ChartSpec dict)라서 프로세스 간에 그대로 pickle 가능
+- ANALYSIS_RENDER_WORKERS > 0 이면 matplotlib/한글 폰트를 미리 올려둔 전용 프로세스 풀에서 렌더링
+- Celery prefork 자식처럼 자식 프로세스를 만들 수 없는 daemon 프로세스에서는 스레드 풀을 한 번만 만들어 재사용
+"""
+
+import io
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import current_process, get_context
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 설치된 폰트 중 처음 찾은 한글 폰트를 사용 (Dockerfile: fonts-nanum)
+KOREAN_FONT_CANDIDATES = (
+    "NanumGothic",
+    "NanumBarunGothic",
+    "Noto Sans CJK KR",
+    "Noto Sans KR",
+    "AppleGothic",
+    "Malgun Gothic",
+)
+
+_pool = None
+# 프로세스 풀을 만들 수 없는 프로세스인지 (한 번 확인되면 프로세스가 끝날 때까지 스레드 풀 사용)
+_processes_unavailable = False
+_matplotlib_ready = False
+_matplotlib_lock = threading.Lock()
+
+
+def setup_matplotlib():
+    # matplotlib 백엔드/폰트 설정은 프로세스당 한 번만 (폰트 목록 조회가 비쌈)
+    with _matplotlib_lock:
+        _setup_matplotlib()
+
+
+def _setup_matplotlib():
+    global _matplotlib_ready
+    if _matplotlib_ready:
+        return
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib import font_manager
+
+    available = {font.name for font in font_manager.fontManager.ttflist}
+    for name in KOREAN_FONT_CANDIDATES:
+        if name in available:
+            matplotlib.rcParams["font.family"] = name
+            break
+    matplotlib.rcParams["axes.unicode_minus"] = False
+    _matplotlib_ready = True
+
+
+def _warm_up():
+    # 풀 워커 initializer: import + 폰트 캐시 + Agg 첫 렌더 비용을 미리 지불
+    setup_matplotlib()
+    draw({"kind": "bar", "title": "워밍업", "x": ["a"], "y": [1]}).savefig(
+        io.BytesIO(), format="png"
+    )
+
+
+def draw(spec):
+    """
+    ChartSpec(dict) → Figure
+    - kind: "line" | "bar" | "pie"
+    - x, y: 집계된 시리즈 (pie는 x가 라벨)
+    - title, xlabel, ylabel, color, grid_axis("both"/"y"), rotate_xticks
+    """
+    setup_matplotlib()
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    kind = spec["kind"]
+    if kind == "line":
+        ax.plot(spec["x"], spec["y"], marker="o")
+    elif kind == "bar":
+        ax.bar(spec["x"], spec["y"], color=spec.get("color"), alpha=0.7)
+    elif kind == "pie":
+        ax.pie(spec["y"], labels=spec["x"], autopct="%1.1f%%")
+    else:
+        raise ValueError(f"지원하지 않는 차트 종류: {kind}")
+
+    ax.set_title(spec["title"])
+    if kind != "pie":
+        ax.set_xlabel(spec.get("xlabel", ""))
+        ax.set_ylabel(spec.get("ylabel", ""))
+        ax.tick_params(axis="x", labelrotation=45 if spec.get("rotate_xticks", True) else 0)
+        ax.grid(True, alpha=0.3, axis=spec.get("grid_axis", "both"))
+    return fig
+
+
+def render_to_file(spec, path, dpi=150):
+    draw(spec).savefig(path, bbox_inches="tight", dpi=dpi)
+    return path
+
+
+def get_pool():
+    """
+    렌더링 전용 풀 (프로세스당 1개, 처음 쓸 때 생성)
+    - spawn 컨텍스트 프로세스 풀: Celery/Django 프로세스의 스레드·DB 커넥션을 물려받지 않음
+    - daemon 프로세스(Celery prefork 자식)는 자식 프로세스를 만들 수 없으므로 스레드 풀
+      (Figure/FigureCanvasAgg 객체 API라 스레드에서 그려도 안전)
+    - ANALYSIS_RENDER_WORKERS=0 이면 None (현재 프로세스에서 렌더링)
+    """
+    global _pool, _processes_unavailable
+    workers = settings.ANALYSIS_RENDER_WORKERS
+    if workers <= 0:
+        return None
+    if _pool is None:
+        if current_process().daemon:
+            _processes_unavailable = True
+        if _processes_unavailable:
+            _pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="chart-render", initializer=_warm_up
+            )
+        else:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=get_context("spawn"), initializer=_warm_up
+            )
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
+
+
+def _render_inline(spec, path, dpi):
+    future = Future()
+    try:
+        future.set_result(render_to_file(spec, path, dpi))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def submit_render(spec, path, dpi=150):
+    """
+    차트 렌더링 예약 → Future[path]
+    여러 건을 먼저 제출한 뒤 결과를 기다리면 풀 워커 수만큼 동시에 렌더링됨
+    """
+    global _processes_unavailable
+    pool = get_pool()
+    if pool is None:
+        return _render_inline(spec, path, dpi)
+
+    try:
+        return pool.submit(render_to_file, spec, path, dpi)
+    except AssertionError as exc:
+        # 자식 프로세스를 만들 수 없는 환경: 이후로는 스레드 풀만 사용 (매번 프로세스 풀을 다시 만들지 않음)
+        logger.warning("Render process pool unavailable, using threads: %s", exc)
+        _processes_unavailable = True
+        shutdown_pool()
+        return get_pool().submit(render_to_file, spec, path, dpi)
+    except (BrokenProcessPool, RuntimeError) as exc:
+        # 풀 프로세스가 죽었거나 종료 중: 현재 프로세스에서 렌더링 (다음 제출 때 풀을 새로 만듦)
+        logger.warning("Render pool unavailable, rendering inline: %s", exc)
+        shutdown_pool()
+        return _render_inline(spec, path, dpi)
+
+
+def wait_render(future, spec, path, dpi=150):
+    # 렌더링 결과 대기. 풀 워커가 비정상 종료되면 풀을 버리고 현재 프로세스에서 다시 그림
+    try:
+        return future.result()
+    except BrokenProcessPool as exc:
+        logger.warning("Render pool broken, rendering inline: %s", exc)
+        shutdown_pool()
+        return render_to_file(spec, path, dpi)
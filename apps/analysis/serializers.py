@@ -11,3 +11,4 @@ class AnalysisSerializer(serializers.ModelSerializer):
     class Meta:
         model = Analysis
         fields = "__all__"
+        read_only_fields = ["output", "result_data", "fingerprint"]
@@ -6,11 +6,16 @@ from apps.notification.models import Notification
 from .models import Analysis
 
 
+def build_analysis_notification(analysis):
+    # 분석 완료 알림 (저장 전). 배치 작업은 모아서 bulk_create로 저장함
+    about_label = analysis.get_about_display()
+    period_label = analysis.get_type_display()
+    message = f"{period_label} {about_label} 분석이 완료되었습니다. 그래프를 확인하세요."
+    return Notification(user_id=analysis.user_id, message=message, is_read=False)
+
+
 @receiver(post_save, sender=Analysis)
 def create_analysis_notification(sender, instance, created, **kwargs):
     if not created:
         return
-    about_label = instance.get_about_display()
-    period_label = instance.get_type_display()
-    message = f"{period_label} {about_label} 분석이 완료되었습니다. 그래프를 확인하세요."
-    Notification.objects.create(user=instance.user, message=message, is_read=False)
+    build_analysis_notification(instance).save()
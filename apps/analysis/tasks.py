@@ -1,48 +1,207 @@
 from datetime import timedelta
 
-from celery import shared_task
+from celery import chord, shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 
+from apps.core.response_cache import bump_versions
 from apps.members.models import User
+from apps.notification.services import bulk_create_notifications
+from apps.transaction.repositories import TransactionRepository
 
+from . import chart_cache
 from .analyzers import Analyzer
+from .models import Analysis
+from .signals import build_analysis_notification
+
+logger = get_task_logger(__name__)
+
+# 실패한 사용자만 다시 시도할 때의 대기 시간(초)
+CHUNK_RETRY_COUNTDOWN = 60
+
+
+def _iter_user_id_chunks(user_counts, chunk_size, stats):
+    # (사용자 id, 거래 수)를 서버 사이드 커서(iterator)로 읽으면서 chunk_size 단위로 묶음
+    chunk = []
+    for user_id, tx_count in user_counts.iterator(chunk_size=chunk_size):
+        stats["users"] += 1
+        stats["transactions"] += tx_count
+        chunk.append(user_id)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bulk_write_analyses(analyses):
+    """
+    청크에서 만든 Analysis와 완료 알림을 트랜잭션 하나에서 bulk_create
+    - 사용자마다 INSERT 2번 + 커밋 대신 청크당 INSERT 2번 + 커밋 1번
+    - bulk_create는 post_save를 보내지 않으므로 시그널이 하던 알림 생성(analysis.signals)과
+      응답 캐시 버전 증가(core.signals)를 여기서 직접 함
+    """
+    with transaction.atomic():
+        Analysis.objects.bulk_create(analyses)
+        bulk_create_notifications([build_analysis_notification(a) for a in analyses])
+        for user_id in {analysis.user_id for analysis in analyses}:
+            bump_versions(user_id, Analysis._meta.model_name)
+
+
+def _fan_out_analysis(analysis_type, period_type, start_date, end_date):
+    """
+    사용자 id 청크마다 run_analysis_chunk 태스크를 만들고(group),
+    모든 청크가 끝나면 summarize_analysis_chunks가 전체 결과를 합침(chord)
+    - 워커 수만큼 청크가 병렬로 처리되므로 워커를 늘리면 전체 시간이 줄어듦
+    - 기간 내 거래가 있는 사용자만 한 번의 집계 쿼리로 골라서 보냄
+      (거래 없는 사용자마다 exists() 쿼리 + ValueError 처리를 하지 않도록)
+    """
+    chunk_size = settings.ANALYSIS_FANOUT_CHUNK_SIZE
+    user_counts = TransactionRepository.get_active_user_counts(start_date, end_date)
+    stats = {"users": 0, "transactions": 0}
+    header = [
+        run_analysis_chunk.s(
+            chunk, analysis_type, period_type, start_date.isoformat(), end_date.isoformat()
+        )
+        for chunk in _iter_user_id_chunks(user_counts, chunk_size, stats)
+    ]
+    result = {
+        "analysis_type": analysis_type,
+        "chunks": len(header),
+        "dispatched_users": stats["users"],
+        "skipped_users": User.objects.count() - stats["users"],
+        "transactions": stats["transactions"],
+    }
+    if header:
+        result["summary_id"] = chord(header)(
+            summarize_analysis_chunks.s(analysis_type, period_type)
+        ).id
+    return result
 
 
 @shared_task
 def run_weekly_expense_analysis():
-    users = User.objects.all()
     end_date = timezone.now().date()
     start_date = end_date - timedelta(days=7)
-
-    for user in users:
-        try:
-            analyzer = Analyzer(user)
-            analyzer.run_analysis("total_expense", "weekly", start_date, end_date)
-        except Exception as exc:
-            print(f"Error analyzing user {user.email}: {exc}")
+    return _fan_out_analysis("total_expense", "weekly", start_date, end_date)
 
 
 @shared_task
 def run_monthly_income_analysis():
-    users = User.objects.all()
     today = timezone.now().date()
     end_date = today.replace(day=1) - timedelta(days=1)
     start_date = end_date.replace(day=1)
+    return _fan_out_analysis("total_income", "monthly", start_date, end_date)
+
+
+@shared_task(bind=True, max_retries=2)
+def run_analysis_chunk(
+    self, user_ids, analysis_type, period_type, start_date, end_date, carry=None
+):
+    """
+    사용자 id 청크 하나를 순서대로 분석
+    - ANALYSIS_BULK_WRITE면 결과와 완료 알림을 청크 끝에서 bulk_create로 한 번에 저장
+    - 분석할 거래가 없는 사용자(ValueError)는 skipped로 집계
+    - 그 외 오류가 난 사용자만 모아서 재시도, 재시도 횟수를 넘기면 failed로 결과에 남김
+    """
+    result = carry or {"succeeded": 0, "skipped": 0, "failed_user_ids": []}
+    failed = []
+    users = list(User.objects.filter(id__in=user_ids).order_by("id"))
+
+    def progress(done):
+        if self.request.id:
+            self.update_state(
+                state="PROGRESS",
+                meta={"done": done, "total": len(user_ids), "failed": len(failed)},
+            )
 
+    # 1단계: 사용자별 집계 + 렌더링 제출 (렌더링은 풀에서 동시에 진행)
+    jobs = []
     for user in users:
+        analyzer = Analyzer(user)
+        try:
+            job = analyzer.start_analysis(analysis_type, period_type, start_date, end_date)
+        except ValueError:
+            result["skipped"] += 1
+            continue
+        except Exception as exc:
+            logger.warning("Error analyzing user %s: %s", user.id, exc)
+            failed.append(user.id)
+            continue
+        jobs.append((analyzer, job))
+
+    # 2단계: 렌더링 완료 순서대로 레코드 생성 (ANALYSIS_BULK_WRITE면 모아 두었다가 3단계에서 저장)
+    bulk_write = settings.ANALYSIS_BULK_WRITE
+    pending = []
+    done = len(users) - len(jobs)
+    progress(done)
+    for analyzer, job in jobs:
         try:
-            analyzer = Analyzer(user)
-            analyzer.run_analysis("total_income", "monthly", start_date, end_date)
+            if bulk_write:
+                analysis = analyzer.build_analysis(job)
+                if analysis.pk is None:
+                    pending.append(analysis)
+                else:
+                    result["succeeded"] += 1
+            else:
+                analyzer.finish_analysis(job)
+                result["succeeded"] += 1
         except Exception as exc:
-            print(f"Error analyzing user {user.email}: {exc}")
+            logger.warning("Error analyzing user %s: %s", analyzer.user.id, exc)
+            failed.append(analyzer.user.id)
+        done += 1
+        progress(done)
+
+    # 3단계: 모은 레코드 저장. 실패하면 이번에 저장하려던 사용자 전체를 재시도 대상으로 넘김
+    if pending:
+        try:
+            _bulk_write_analyses(pending)
+            result["succeeded"] += len(pending)
+        except Exception as exc:
+            logger.warning("Error saving analyses for %s users: %s", len(pending), exc)
+            failed.extend(analysis.user_id for analysis in pending)
+
+    if failed and self.request.retries < self.max_retries:
+        raise self.retry(
+            args=[failed, analysis_type, period_type, start_date, end_date],
+            kwargs={"carry": result},
+            countdown=CHUNK_RETRY_COUNTDOWN,
+        )
+
+    result["failed_user_ids"] = failed
+    return result
+
+
+@shared_task
+def summarize_analysis_chunks(chunk_results, analysis_type, period_type):
+    # chord 콜백: 청크별 결과를 합쳐서 배치 전체 요약을 남김
+    summary = {
+        "analysis_type": analysis_type,
+        "period_type": period_type,
+        "chunks": len(chunk_results),
+        "succeeded": sum(r["succeeded"] for r in chunk_results),
+        "skipped": sum(r["skipped"] for r in chunk_results),
+        "failed_user_ids": [uid for r in chunk_results for uid in r["failed_user_ids"]],
+    }
+    summary["failed"] = len(summary["failed_user_ids"])
+    logger.info("Analysis fan-out finished: %s", summary)
+    return summary
+
+
+@shared_task
+def evict_analysis_images():
+    # 참조되지 않는 차트 이미지 정리 (디렉터리 크기가 한도를 넘을 때만 삭제)
+    return chart_cache.evict_orphaned_images()
 
 
 @shared_task
-def run_user_analysis(user_id, analysis_type, period_type, start_date, end_date):
+def run_user_analysis(user_id, analysis_type, period_type, start_date, end_date, output="png"):
     try:
         user = User.objects.get(id=user_id)
         analyzer = Analyzer(user)
-        analysis = analyzer.run_analysis(analysis_type, period_type, start_date, end_date)
+        analysis = analyzer.run_analysis(analysis_type, period_type, start_date, end_date, output)
         return f"Analysis completed for user {user.email}: {analysis.id}"
     except User.DoesNotExist:
         return f"User {user_id} not found"
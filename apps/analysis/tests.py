@@ -1,6 +1,8 @@
-from datetime import datetime
+import tempfile
+from datetime import datetime, timedelta
+from unittest import mock
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -11,7 +13,56 @@ from apps.members.models import User
 from .models import Analysis
 
 
-class AnalysisModelTest(TestCase):
+class TempMediaRootMixin:
+    """
+    차트 이미지를 실제 media/ 대신 테스트 클래스마다 만드는 임시 MEDIA_ROOT에 씀
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        media_root = cls.enterClassContext(tempfile.TemporaryDirectory())
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media_root))
+        super().setUpClass()
+
+
+def _render_in_daemon(directory, results):
+    # daemon 자식 프로세스에서 실행: 제출할 때마다 같은 풀을 쓰고 경고 없이 렌더링되는지 기록
+    import logging
+    import os
+
+    from . import rendering
+
+    warnings = []
+    handler = logging.Handler(logging.WARNING)
+    handler.emit = lambda record: warnings.append(record.getMessage())
+    rendering.logger.addHandler(handler)
+    rendering._pool = None
+    rendering._processes_unavailable = False
+
+    pools, paths = [], []
+    for batch in range(2):
+        futures = []
+        for index in range(2):
+            name = f"chart-{batch}-{index}.png"
+            spec = {"kind": "bar", "title": name, "x": ["a", "b"], "y": [1, index + 2]}
+            path = os.path.join(directory, name)
+            futures.append((rendering.submit_render(spec, path), spec, path))
+            paths.append(name)
+        pools.append(rendering._pool)
+        for future, spec, path in futures:
+            rendering.wait_render(future, spec, path)
+    rendering.shutdown_pool()
+    results.put(
+        {
+            "pools": [type(pool).__name__ for pool in pools],
+            "same_pool": pools[0] is pools[1],
+            "warnings": warnings,
+            "paths": paths,
+        }
+    )
+
+
+class AnalysisModelTest(TempMediaRootMixin, TestCase):
     """
     Analysis 모델 동작 테스트.
     """
@@ -48,7 +99,7 @@ class AnalysisModelTest(TestCase):
         self.assertEqual(str(analysis), expected_str)
 
 
-class AnalysisAPITest(APITestCase):
+class AnalysisAPITest(TempMediaRootMixin, APITestCase):
     """
     Analysis API 동작 테스트.
     """
@@ -161,7 +212,7 @@ class AnalysisAPITest(APITestCase):
         self.assertEqual(Analysis.objects.count(), 0)
 
 
-class AnalyzerTest(TestCase):
+class AnalyzerTest(TempMediaRootMixin, TestCase):
     """
     Analyzer 동작 테스트.
     """
@@ -215,15 +266,32 @@ class AnalyzerTest(TestCase):
         transactions = analyzer.get_transactions_in_period("2024-01-01", "2024-01-31")
         self.assertEqual(transactions.count(), 2)
 
-    def test_create_dataframe(self):
+    def test_create_aggregated_dataframe_matches_row_level(self):
         from .analyzers import Analyzer
 
         analyzer = Analyzer(self.user)
-        transactions = analyzer.get_transactions_in_period("2024-01-01", "2024-01-31")
-        df = analyzer.create_dataframe(transactions)
-        self.assertEqual(len(df), 2)
-        self.assertIn("date", df.columns)
-        self.assertIn("amount", df.columns)
+        expected = {}
+        for transaction in analyzer.get_transactions_in_period("2024-01-01", "2024-01-31"):
+            if transaction.direction == "expense":
+                expected[transaction.method] = (
+                    expected.get(transaction.method, 0) + transaction.amount
+                )
+
+        df = analyzer.create_aggregated_dataframe("category_expense", "2024-01-01", "2024-01-31")
+        self.assertEqual(dict(zip(df["method"], df["amount"])), expected)
+
+        df = analyzer.create_aggregated_dataframe("total_income", "2024-01-01", "2024-01-31")
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df["amount"].sum(), 100000)
+
+    def test_create_aggregated_dataframe_latest_balance(self):
+        from .analyzers import Analyzer
+
+        analyzer = Analyzer(self.user)
+        df = analyzer.create_aggregated_dataframe("account_balance", "2024-01-01", "2024-01-31")
+        self.assertEqual(list(df["account_name"]), ["테스트 계좌"])
+        # 기간 내 마지막 거래(1/15 지출)의 잔액
+        self.assertEqual(df["balance_after"].iloc[0], 950000)
 
     def test_run_analysis_total_expense(self):
         from .analyzers import Analyzer
@@ -236,9 +304,391 @@ class AnalyzerTest(TestCase):
         self.assertIsNotNone(analysis.result_image)
         self.assertIn("총 지출", analysis.description)
 
+    def test_run_analysis_reuses_cached_chart(self):
+        from .analyzers import Analyzer
+
+        analyzer = Analyzer(self.user)
+        first = analyzer.run_analysis("total_expense", "monthly", "2024-01-01", "2024-01-31")
+        self.assertTrue(first.fingerprint)
+
+        # 입력 데이터가 같으면 렌더링 없이 기존 레코드/이미지를 그대로 반환
+        with mock.patch("apps.analysis.rendering.submit_render") as submit_render:
+            second = analyzer.run_analysis("total_expense", "monthly", "2024-01-01", "2024-01-31")
+        submit_render.assert_not_called()
+        self.assertEqual(second.id, first.id)
+
+        # 휴지통으로 보낸 뒤 다시 실행하면 이미지만 재사용한 새 레코드
+        first.trash(self.user)
+        with mock.patch("apps.analysis.rendering.submit_render") as submit_render:
+            third = analyzer.run_analysis("total_expense", "monthly", "2024-01-01", "2024-01-31")
+        submit_render.assert_not_called()
+        self.assertNotEqual(third.id, first.id)
+        self.assertEqual(third.result_image.name, first.result_image.name)
+
+    def test_run_analysis_rerenders_when_data_changes(self):
+        from apps.transaction.models import Transaction
+
+        from .analyzers import Analyzer
+
+        analyzer = Analyzer(self.user)
+        first = analyzer.run_analysis("total_expense", "monthly", "2024-01-01", "2024-01-31")
+        Transaction.objects.create(
+            account=self.account,
+            amount=7000,
+            balance_after=943000,
+            direction="expense",
+            method="교통",
+            occurred_at=timezone.make_aware(datetime(2024, 1, 20, 8, 0)),
+        )
+        second = analyzer.run_analysis("total_expense", "monthly", "2024-01-01", "2024-01-31")
+
+        self.assertNotEqual(second.fingerprint, first.fingerprint)
+        self.assertNotEqual(second.result_image.name, first.result_image.name)
+
+    def test_image_name_fits_result_image_field(self):
+        from . import chart_cache
+
+        # 가장 긴 분석 유형 + 전체 해시 지문으로 만든 실제 경로가 그대로 저장되는지 확인
+        about = max((key for key, _ in Analysis.ANALYSIS_ABOUT_CHOICES), key=len)
+        name = chart_cache.image_name(about, "f" * 64)
+        self.assertTrue(name.startswith(f"{chart_cache.IMAGE_DIR}/{about}_"))
+        analysis = Analysis.objects.create(
+            user=self.user,
+            about=about,
+            type="monthly",
+            period_start="2024-01-01",
+            period_end="2024-01-31",
+            description="카테고리별 지출",
+            result_image=name,
+        )
+        analysis.refresh_from_db()
+        self.assertEqual(analysis.result_image.name, name)
+
+    def test_run_analysis_json_output_skips_rendering(self):
+        from .analyzers import Analyzer
+
+        analyzer = Analyzer(self.user)
+        with mock.patch("apps.analysis.rendering.submit_render") as submit_render:
+            analysis = analyzer.run_analysis(
+                "total_expense", "monthly", "2024-01-01", "2024-01-31", output="json"
+            )
+        submit_render.assert_not_called()
+        self.assertEqual(analysis.output, "json")
+        self.assertFalse(analysis.result_image)
+        self.assertEqual(analysis.result_data["kind"], "line")
+        self.assertEqual(analysis.result_data["x"], ["2024-01-15"])
+        self.assertEqual(analysis.result_data["y"], [50000.0])
+
+        # 같은 입력이면 json 결과도 재사용
+        again = analyzer.run_analysis(
+            "total_expense", "monthly", "2024-01-01", "2024-01-31", output="json"
+        )
+        self.assertEqual(again.id, analysis.id)
+
+    def test_run_analysis_svg_output(self):
+        import os
+
+        from django.conf import settings
+
+        from .analyzers import Analyzer
+
+        analysis = Analyzer(self.user).run_analysis(
+            "category_expense", "monthly", "2024-01-01", "2024-01-31", output="svg"
+        )
+        self.assertTrue(analysis.result_image.name.endswith(".svg"))
+        with open(os.path.join(settings.MEDIA_ROOT, analysis.result_image.name), "rb") as f:
+            self.assertIn(b"<svg", f.read(512))
+        self.assertEqual(analysis.result_data["x"], ["식비"])
+
+    def test_run_view_json_output_returns_series(self):
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        payload = {
+            "about": "total_income",
+            "type": "monthly",
+            "period_start": "2024-01-01",
+            "period_end": "2024-01-31",
+            "output": "json",
+        }
+        response = client.post(reverse("analysis-run"), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["result_data"]["y"], [100000.0])
+        self.assertIsNone(response.data["result_image"])
+
+        payload["output"] = "gif"
+        response = client.post(reverse("analysis-run"), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_render_pool_writes_chart_image(self):
+        import os
+
+        from . import rendering
+
+        spec = {"kind": "bar", "title": "수입", "x": ["2024-01-01"], "y": [100000.0]}
+        with tempfile.TemporaryDirectory() as tmp, self.settings(ANALYSIS_RENDER_WORKERS=1):
+            self.addCleanup(rendering.shutdown_pool)
+            path = os.path.join(tmp, "chart.png")
+            future = rendering.submit_render(spec, path)
+            self.assertEqual(rendering.wait_render(future, spec, path), path)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(8), b"\x89PNG\r\n\x1a\n")
+
+    def test_render_pool_in_daemonic_process_reuses_thread_pool(self):
+        import multiprocessing
+        import os
+
+        # Celery prefork 자식처럼 daemon 프로세스 안에서 차트 여러 장을 두 번에 나눠 렌더링
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        with tempfile.TemporaryDirectory() as tmp, self.settings(ANALYSIS_RENDER_WORKERS=2):
+            child = context.Process(target=_render_in_daemon, args=(tmp, results), daemon=True)
+            child.start()
+            result = results.get(timeout=120)
+            child.join(timeout=30)
+            self.assertEqual(child.exitcode, 0)
+            self.assertEqual(result["pools"], ["ThreadPoolExecutor"] * 2)
+            self.assertTrue(result["same_pool"])
+            self.assertEqual(result["warnings"], [])
+            for name in result["paths"]:
+                with open(os.path.join(tmp, name), "rb") as f:
+                    self.assertEqual(f.read(8), b"\x89PNG\r\n\x1a\n")
+
+    def test_evict_orphaned_images_keeps_referenced(self):
+        import os
+
+        from . import chart_cache
+
+        with tempfile.TemporaryDirectory() as media_root, self.settings(MEDIA_ROOT=media_root):
+            image_dir = os.path.join(media_root, chart_cache.IMAGE_DIR)
+            os.makedirs(image_dir)
+            for index, name in enumerate(["orphan_old.png", "orphan_new.png", "kept.png"]):
+                path = os.path.join(image_dir, name)
+                with open(path, "wb") as f:
+                    f.write(b"x" * 100)
+                os.utime(path, (index, index))
+            Analysis.objects.create(
+                user=self.user,
+                about="total_expense",
+                type="monthly",
+                period_start="2024-01-01",
+                period_end="2024-01-31",
+                description="참조 중",
+                result_image=f"{chart_cache.IMAGE_DIR}/kept.png",
+            )
+
+            # 한도 안이면 아무것도 지우지 않음
+            self.assertEqual(chart_cache.evict_orphaned_images(max_bytes=300)["deleted"], 0)
+
+            # 오래된 orphan부터 지우고, 참조 중인 이미지는 한도를 넘어도 남김
+            result = chart_cache.evict_orphaned_images(max_bytes=200)
+            self.assertEqual(result["deleted"], 1)
+            self.assertEqual(sorted(os.listdir(image_dir)), ["kept.png", "orphan_new.png"])
+
+            chart_cache.evict_orphaned_images(max_bytes=0)
+            self.assertEqual(os.listdir(image_dir), ["kept.png"])
+
     def test_run_analysis_no_transactions(self):
         from .analyzers import Analyzer
 
         analyzer = Analyzer(self.user)
         with self.assertRaises(ValueError):
             analyzer.run_analysis("total_expense", "monthly", "2023-01-01", "2023-01-31")
+
+
+class AnalysisFanOutTaskTest(TempMediaRootMixin, TestCase):
+    """
+    주간/월간 배치 분석 청크 fan-out 테스트.
+    """
+
+    def setUp(self):
+        from apps.bank_account.models import Account
+        from apps.transaction.models import Transaction
+        from budget.celery import app
+
+        self.active = User.objects.create_user(
+            email="active@example.com", password="testpass123", name="Active"
+        )
+        self.idle = User.objects.create_user(
+            email="idle@example.com", password="testpass123", name="Idle"
+        )
+        account = Account.objects.create(
+            user=self.active, name="계좌", source_type="bank", balance=0
+        )
+        Transaction.objects.create(
+            account=account,
+            amount=1000,
+            balance_after=0,
+            direction="expense",
+            method="card",
+            occurred_at=timezone.now() - timedelta(days=1),
+        )
+        self.today = timezone.localdate()
+
+        # 워커 없이 group/chord를 현재 프로세스에서 바로 실행
+        self.celery_app = app
+        self.celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, self.celery_app.conf, "task_always_eager", False)
+
+    def _run_chunk(self, user_ids):
+        from .tasks import run_analysis_chunk
+
+        start = (self.today - timedelta(days=7)).isoformat()
+        return run_analysis_chunk.apply(
+            args=[user_ids, "total_expense", "weekly", start, self.today.isoformat()]
+        ).get()
+
+    def _add_active_user(self, email):
+        from apps.bank_account.models import Account
+        from apps.transaction.models import Transaction
+
+        user = User.objects.create_user(email=email, password="testpass123", name="Active")
+        account = Account.objects.create(user=user, name="계좌", source_type="bank", balance=0)
+        Transaction.objects.create(
+            account=account,
+            amount=2000,
+            balance_after=0,
+            direction="expense",
+            method="card",
+            occurred_at=timezone.now() - timedelta(days=1),
+        )
+        return user
+
+    def _count_inserts(self, queries, table):
+        return sum(q["sql"].startswith(f'INSERT INTO "{table}"') for q in queries)
+
+    @override_settings(CACHE_SHARED=True)
+    def test_chunk_bulk_writes_analyses_and_notifications(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from apps.core.response_cache import get_version
+        from apps.notification.models import Notification
+        from apps.notification.services import get_unread_count
+
+        other = self._add_active_user("active2@example.com")
+        version = get_version(self.active.id, "analysis")
+        self.assertEqual(get_unread_count(self.active.id), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as ctx:
+                result = self._run_chunk([self.active.id, other.id, self.idle.id])
+
+        self.assertEqual(result, {"succeeded": 2, "skipped": 1, "failed_user_ids": []})
+        # 사용자 수와 관계없이 청크당 INSERT 한 번씩
+        self.assertEqual(self._count_inserts(ctx.captured_queries, "analysis_analysis"), 1)
+        self.assertEqual(self._count_inserts(ctx.captured_queries, "notification_notification"), 1)
+        for user in (self.active, other):
+            self.assertEqual(Analysis.objects.filter(user=user).count(), 1)
+            notification = Notification.objects.get(user=user)
+            self.assertIn("매주 총 지출 분석이 완료되었습니다", notification.message)
+        # post_save 없이도 읽지 않은 알림 카운터와 응답 캐시 버전이 갱신됨
+        self.assertEqual(get_unread_count(self.active.id), 1)
+        self.assertNotEqual(get_version(self.active.id, "analysis"), version)
+
+    @override_settings(ANALYSIS_BULK_WRITE=False)
+    def test_chunk_without_bulk_write_saves_per_user(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from apps.notification.models import Notification
+
+        other = self._add_active_user("active2@example.com")
+        with CaptureQueriesContext(connection) as ctx:
+            result = self._run_chunk([self.active.id, other.id])
+
+        self.assertEqual(result["succeeded"], 2)
+        self.assertEqual(self._count_inserts(ctx.captured_queries, "analysis_analysis"), 2)
+        self.assertEqual(Notification.objects.filter(user__in=[self.active, other]).count(), 2)
+
+    def test_chunk_retries_users_when_bulk_write_fails(self):
+        from . import tasks
+
+        original = tasks._bulk_write_analyses
+        calls = []
+
+        def flaky(analyses):
+            calls.append([analysis.user_id for analysis in analyses])
+            if len(calls) == 1:
+                raise RuntimeError("db down")
+            return original(analyses)
+
+        with mock.patch.object(tasks, "_bulk_write_analyses", side_effect=flaky):
+            result = self._run_chunk([self.active.id, self.idle.id])
+
+        self.assertEqual(calls, [[self.active.id], [self.active.id]])
+        self.assertEqual(result, {"succeeded": 1, "skipped": 1, "failed_user_ids": []})
+        self.assertEqual(Analysis.objects.filter(user=self.active).count(), 1)
+
+    def test_user_analysis_creates_notification_via_signal(self):
+        from apps.notification.models import Notification
+
+        from .tasks import run_user_analysis
+
+        start = (self.today - timedelta(days=7)).isoformat()
+        run_user_analysis(self.active.id, "total_expense", "weekly", start, self.today.isoformat())
+        self.assertEqual(Analysis.objects.filter(user=self.active).count(), 1)
+        self.assertEqual(Notification.objects.filter(user=self.active).count(), 1)
+
+    def test_chunk_counts_succeeded_and_skipped(self):
+        result = self._run_chunk([self.active.id, self.idle.id])
+        self.assertEqual(result, {"succeeded": 1, "skipped": 1, "failed_user_ids": []})
+        self.assertEqual(Analysis.objects.filter(user=self.active).count(), 1)
+
+    def test_chunk_retries_only_failed_users(self):
+        from .analyzers import Analyzer
+
+        original = Analyzer.start_analysis
+        calls = []
+
+        def flaky(analyzer, *args):
+            calls.append(analyzer.user.id)
+            if calls.count(analyzer.user.id) == 1 and analyzer.user == self.active:
+                raise RuntimeError("render failed")
+            return original(analyzer, *args)
+
+        with mock.patch.object(Analyzer, "start_analysis", autospec=True, side_effect=flaky):
+            result = self._run_chunk([self.active.id, self.idle.id])
+
+        # 재시도 때는 실패한 사용자만 다시 실행되고, 첫 시도의 skipped 집계는 유지됨
+        self.assertEqual(calls, [self.active.id, self.idle.id, self.active.id])
+        self.assertEqual(result, {"succeeded": 1, "skipped": 1, "failed_user_ids": []})
+
+    def test_chunk_reports_users_failing_after_retries(self):
+        from .analyzers import Analyzer
+
+        with mock.patch.object(Analyzer, "start_analysis", side_effect=RuntimeError("boom")):
+            result = self._run_chunk([self.active.id])
+        self.assertEqual(result["failed_user_ids"], [self.active.id])
+
+    @override_settings(ANALYSIS_FANOUT_CHUNK_SIZE=1)
+    def test_weekly_job_dispatches_only_active_users(self):
+        from .tasks import run_weekly_expense_analysis, summarize_analysis_chunks
+
+        with mock.patch.object(
+            summarize_analysis_chunks, "run", wraps=summarize_analysis_chunks.run
+        ) as summarize:
+            result = run_weekly_expense_analysis()
+
+        # 기간 내 거래가 없는 사용자는 태스크로 보내지 않고 skipped_users로만 집계
+        self.assertEqual(result["chunks"], 1)
+        self.assertEqual(result["dispatched_users"], 1)
+        self.assertEqual(result["skipped_users"], 1)
+        self.assertEqual(result["transactions"], 1)
+        chunk_results = summarize.call_args.args[0]
+        self.assertEqual(chunk_results, [{"succeeded": 1, "skipped": 0, "failed_user_ids": []}])
+        self.assertEqual(Analysis.objects.filter(type="weekly").count(), 1)
+
+    def test_monthly_job_without_activity_dispatches_nothing(self):
+        from apps.transaction.models import Transaction
+
+        from .tasks import run_monthly_income_analysis
+
+        Transaction.all_objects.all().delete()
+        with self.assertNumQueries(2):
+            result = run_monthly_income_analysis()
+
+        self.assertEqual(result["chunks"], 0)
+        self.assertEqual(result["skipped_users"], 2)
+        self.assertNotIn("summary_id", result)
@@ -6,8 +6,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.response_cache import cached_response
 from apps.trashcan.services import TrashService
 
+from .analyzers import Analyzer
 from .models import Analysis
 from .serializers import AnalysisSerializer
 from .tasks import run_user_analysis
@@ -171,6 +173,7 @@ class AnalysisListView(generics.ListAPIView):
         },
         tags=["분석 관리"],
     )
+    @cached_response("analysis")
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
@@ -187,11 +190,16 @@ class AnalysisRunView(APIView):
     분석 실행 요청 API
 
     분석 유형과 기간 정보를 받아 비동기 분석 작업을 시작합니다.
+    output=json이면 렌더링 없이 바로 집계 시리즈를 만들어 응답합니다.
     """
 
     @swagger_auto_schema(
         operation_summary="분석 실행 요청",
-        operation_description="분석 유형과 기간 정보를 받아 비동기 분석 작업을 시작합니다.",
+        operation_description=(
+            "분석 유형과 기간 정보를 받아 비동기 분석 작업을 시작합니다.\n"
+            "output=png(기본)/svg는 차트 이미지를 비동기로 생성하고(202), "
+            "output=json은 이미지 없이 집계 시리즈(result_data)를 바로 반환합니다(201)."
+        ),
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
             required=["about", "type", "period_start", "period_end"],
@@ -204,9 +212,15 @@ class AnalysisRunView(APIView):
                 "period_end": openapi.Schema(
                     type=openapi.TYPE_STRING, format=openapi.FORMAT_DATE, description="종료 날짜"
                 ),
+                "output": openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    enum=list(Analyzer.OUTPUT_FORMATS),
+                    description="결과 형식 (기본 png)",
+                ),
             },
         ),
         responses={
+            201: openapi.Response("JSON 시리즈 분석 완료", AnalysisSerializer),
             202: openapi.Response(
                 "분석 작업 시작됨",
                 openapi.Schema(
@@ -224,12 +238,29 @@ class AnalysisRunView(APIView):
         period_type = request.data.get("type")
         period_start = request.data.get("period_start")
         period_end = request.data.get("period_end")
+        output = request.data.get("output") or "png"
 
         if not all([analysis_type, period_type, period_start, period_end]):
             return Response(
                 {"detail": "about, type, period_start, period_end 값이 필요합니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        if output not in Analyzer.OUTPUT_FORMATS:
+            return Response(
+                {"detail": f"output은 {', '.join(Analyzer.OUTPUT_FORMATS)} 중 하나여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if output == "json":
+            # 집계 쿼리만 필요하므로 요청 안에서 바로 처리 (래스터화 없음)
+            try:
+                analysis = Analyzer(request.user).run_analysis(
+                    analysis_type, period_type, period_start, period_end, output
+                )
+            except ValueError as exc:
+                return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            serializer = AnalysisSerializer(analysis, context={"request": request})
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         task = run_user_analysis.delay(
             request.user.id,
@@ -237,6 +268,7 @@ class AnalysisRunView(APIView):
             period_type,
             period_start,
             period_end,
+            output,
         )
         return Response({"task_id": task.id}, status=status.HTTP_202_ACCEPTED)
 
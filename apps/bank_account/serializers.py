@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from apps.utils.serialization import FastReadSerializer
+
 from .models import Account
 
 
@@ -39,6 +41,12 @@ class AccountResponseSerializer(serializers.ModelSerializer):
         ]
 
 
+# 계정 목록 응답용 빠른 직렬화 (AccountResponseSerializer와 같은 JSON)
+class AccountFastReadSerializer(FastReadSerializer):
+    model = Account
+    fields = AccountResponseSerializer.Meta.fields
+
+
 # 계정 수정 요청 데이터 스펙 (Request Body)
 class AccountUpdateRequestSerializer(serializers.Serializer):
     name = serializers.CharField(required=False)
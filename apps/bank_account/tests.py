@@ -4,6 +4,7 @@ from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from apps.bank_account.models import Account
+from apps.bank_account.serializers import AccountResponseSerializer
 from apps.members.models import User
 
 
@@ -70,6 +71,23 @@ class AccountAPITests(APITestCase):
             returned_ids, set(Account.objects.filter(user=self.user).values_list("id", flat=True))
         )
 
+    # 빠른 목록 직렬화가 AccountResponseSerializer와 같은 JSON을 만드는지 확인
+    def test_list_matches_response_serializer(self):
+        Account.objects.create(
+            user=self.user,
+            name="Card",
+            source_type="card",
+            balance=Decimal("-12.5"),
+            card_company="카드사",
+            billing_day=14,
+        )
+        response = self.client.get(reverse("accounts-list"))
+        expected = AccountResponseSerializer(Account.objects.filter(user=self.user), many=True).data
+        self.assertEqual(
+            sorted(response.json(), key=lambda item: item["id"]),
+            sorted(expected, key=lambda item: item["id"]),
+        )
+
     # 계좌 생성 시 소유자 설정과 201 응답을 확인
     def test_create_account_sets_owner_and_returns_201(self):
         # 계좌 생성 엔드포인트 URL 생성
@@ -5,10 +5,15 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.response import Response
 
+from apps.core.response_cache import cached_response
 from apps.trashcan.services import TrashService
 
 from .models import Account
-from .serializers import AccountCreateRequestSerializer, AccountResponseSerializer
+from .serializers import (
+    AccountCreateRequestSerializer,
+    AccountFastReadSerializer,
+    AccountResponseSerializer,
+)
 
 
 class AccountViewSet(viewsets.ModelViewSet):
@@ -108,8 +113,10 @@ class AccountViewSet(viewsets.ModelViewSet):
         },
         tags=["계좌 관리"],
     )
+    @cached_response("account")
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        # values() dict를 바로 직렬화 (AccountResponseSerializer와 같은 JSON)
+        return Response(AccountFastReadSerializer.serialize(self.get_queryset()))
 
     @swagger_auto_schema(
         operation_summary="계좌 상세 조회",
@@ -5,6 +5,5 @@ class BudgetConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.budget"
 
-
-def ready(self):
-    from . import signals  # noqa: F401
+    def ready(self):
+        from . import checks, signals  # noqa: F401
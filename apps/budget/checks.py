@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register()
+def check_budget_alert_batch_cache(app_configs, **kwargs):
+    """
+    BUDGET_ALERT_ASYNC의 사용자별 배치 윈도우(cache.add)는 모든 웹 워커가 같은 캐시를 봐야 함
+    - 로컬 메모리 캐시면 워커마다 같은 사용자/윈도우의 평가 태스크를 따로 예약해서 합쳐지지 않음
+    """
+    if settings.BUDGET_ALERT_ASYNC and not settings.CACHE_SHARED:
+        return [
+            Warning(
+                "BUDGET_ALERT_ASYNC=1인데 공유 캐시가 없어 예산 알림 평가가 워커별로 따로 예약됩니다.",
+                hint="CACHE_URL(redis://...)을 설정해 모든 웹 워커가 같은 캐시를 쓰게 하세요.",
+                id="budget.W001",
+            )
+        ]
+    return []
@@ -0,0 +1,46 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from apps.budget.models import Budget, BudgetSpend
+from apps.budget.services import calculate_spent_for_budget, rebuild_budget_spend
+
+
+class Command(BaseCommand):
+    help = "예산 지출 카운터(budget_spends)를 거래 전체 집계로 다시 계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="특정 사용자 예산만 재계산")
+        parser.add_argument("--budget-id", type=int, help="특정 예산만 재계산")
+        parser.add_argument(
+            "--dry-run", action="store_true", help="값을 바꾸지 않고 어긋난 예산만 출력"
+        )
+
+    def handle(self, *args, **options):
+        budgets = Budget.objects.filter(deleted_at__isnull=True).order_by("id")
+        if options.get("user_id"):
+            budgets = budgets.filter(user_id=options["user_id"])
+        if options.get("budget_id"):
+            budgets = budgets.filter(id=options["budget_id"])
+
+        current = dict(
+            BudgetSpend.objects.filter(budget__in=budgets).values_list("budget_id", "spent")
+        )
+
+        checked = fixed = 0
+        for budget in budgets.iterator():
+            checked += 1
+            expected = calculate_spent_for_budget(budget)
+            stored = current.get(budget.id)
+            if stored is not None and Decimal(stored) == expected:
+                continue
+
+            fixed += 1
+            self.stdout.write(f"budget={budget.id} stored={stored} expected={expected}")
+            if options["dry_run"]:
+                continue
+
+            rebuild_budget_spend(budget)
+
+        label = "어긋난 예산" if options["dry_run"] else "재계산한 예산"
+        self.stdout.write(self.style.SUCCESS(f"검사 {checked}건, {label} {fixed}건"))
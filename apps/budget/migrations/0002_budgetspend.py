@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("budget", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BudgetSpend",
+            fields=[
+                (
+                    "budget",
+                    models.OneToOneField(
+                        db_column="budget_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="spend",
+                        serialize=False,
+                        to="budget.budget",
+                    ),
+                ),
+                ("spent", models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "budget_spends",
+            },
+        ),
+    ]
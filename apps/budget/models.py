@@ -32,6 +32,28 @@ class Budget(models.Model):
         db_table = "budgets"
 
 
+class BudgetSpend(models.Model):
+    """
+    예산별 누적 지출 카운터(materialized)
+    - 거래 생성/삭제/복구/수정 시 같은 DB 트랜잭션 안에서 증분(delta) 갱신
+    - 알림 평가 시 SUM 집계 대신 이 값을 O(1)로 조회
+    - 어긋나면 rebuild_budget_spend 명령으로 재계산
+    """
+
+    budget = models.OneToOneField(
+        Budget,
+        on_delete=models.CASCADE,
+        db_column="budget_id",
+        primary_key=True,
+        related_name="spend",
+    )
+    spent = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "budget_spends"
+
+
 class BudgetAlertRule(models.Model):
     budget = models.ForeignKey(
         Budget, on_delete=models.CASCADE, db_column="budget_id", related_name="alert_rules"
@@ -3,18 +3,24 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import partial
 from typing import Optional
 
 from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import F, Q, Sum
 from django.utils import timezone
 
+from apps.utils.dates import local_day_range, to_date
+
 from .models import (
     Budget,
     BudgetAlertEvent,
     BudgetAlertRule,
     BudgetScopeType,
+    BudgetSpend,
     ThresholdType,
 )
 
@@ -57,22 +63,27 @@ def _tx_date(tx) -> Optional[timezone.datetime.date]:
             else transacted_on.date()
         )
 
-    # occurred_at이 aware datetime이라면 .date() 가능
+    # aware datetime은 UTC로 저장되므로 현재 타임존 기준 날짜로 변환
+    if timezone.is_aware(occurred_at):
+        return timezone.localdate(occurred_at)
     return occurred_at.date()
 
 
-def calculate_spent_for_budget(budget: Budget) -> Decimal:
+def build_spent_queryset(budget: Budget):
     """
-    budget 기간(period_start~period_end) 내의 '지출(expense)' 합계를 계산.
+    budget 기간(period_start~period_end) 내의 '지출(expense)' 거래 QuerySet.
     scope_type에 따라 account 단위 필터링까지 적용.
+    집계 대상이 될 수 없는 scope면 None 반환.
     """
     Transaction = _get_transaction_model()
 
     # Transaction 모델은 user_id가 없고 account FK를 통해 user에 연결됨
+    # 기간은 반열린 datetime 구간으로 비교 (occurred_at__date 캐스팅은 인덱스를 못 탐)
+    period_start, period_end = local_day_range(budget.period_start, budget.period_end)
     qs = Transaction.objects.filter(
         account__user_id=budget.user_id,
-        occurred_at__date__gte=budget.period_start,
-        occurred_at__date__lte=budget.period_end,
+        occurred_at__gte=period_start,
+        occurred_at__lt=period_end,
         direction="expense",
     )
 
@@ -89,26 +100,188 @@ def calculate_spent_for_budget(budget: Budget) -> Decimal:
         if any(f.name == "category" for f in Transaction._meta.fields):
             qs = qs.filter(category_id=budget.scope_ref_id)
         else:
-            return Decimal("0")
+            return None
 
     elif budget.scope_type == BudgetScopeType.TAG:
         # TransactionTag 모델이 실제로 존재할 때만
         try:
             TransactionTag = _get_transaction_tag_model()
         except Exception:
-            return Decimal("0")
+            return None
         tx_ids = TransactionTag.objects.filter(tag_id=budget.scope_ref_id).values_list(
             "transaction_id", flat=True
         )
         qs = qs.filter(id__in=tx_ids)
 
     else:
+        return None
+
+    return qs
+
+
+def calculate_spent_for_budget(budget: Budget) -> Decimal:
+    """
+    budget 기간 내의 '지출(expense)' 합계를 계산.
+    """
+    qs = build_spent_queryset(budget)
+    if qs is None:
         return Decimal("0")
 
     agg = qs.aggregate(total=Sum("amount"))
     return agg["total"] or Decimal("0")
 
 
+# ---------------------------------------------------------------------------
+# 누적 지출 카운터(BudgetSpend)
+# ---------------------------------------------------------------------------
+
+
+def _tx_user_id(tx) -> Optional[int]:
+    # Transaction 모델은 tx.user_id가 없으므로 account로 user 추출
+    user_id = getattr(tx, "user_id", None)
+    if user_id is None:
+        account = getattr(tx, "account", None)
+        user_id = getattr(account, "user_id", None)
+    return user_id
+
+
+def _budget_ids_for_spend(*, user_id: int, account_id: int, tx_date) -> list[int]:
+    """
+    해당 거래가 지출 합계에 포함되는 예산 id 목록.
+    build_spent_queryset과 같은 기준(ALL / ACCOUNT scope)만 카운터로 관리.
+    """
+    return list(
+        Budget.objects.filter(
+            user_id=user_id,
+            deleted_at__isnull=True,
+            period_start__lte=tx_date,
+            period_end__gte=tx_date,
+        )
+        .filter(
+            Q(scope_type=BudgetScopeType.ALL)
+            | Q(scope_type=BudgetScopeType.ACCOUNT, scope_ref_id=account_id)
+        )
+        .values_list("id", flat=True)
+    )
+
+
+def apply_spend_delta(*, user_id: int, account_id: int, occurred_at, delta: Decimal) -> int:
+    """
+    거래 하나의 지출 변화량(delta)을 관련 예산 카운터에 반영.
+    - UPDATE ... SET spent = spent + delta 로 처리해서 동시 요청에도 값이 유실되지 않음
+    - UPDATE만 수행: 카운터 row는 예산 생성 시(create_budget_spend)나 재계산 명령에서만 만듦
+    - 호출 측 DB 트랜잭션 안에서 실행되어야 거래 변경과 함께 커밋/롤백됨
+    """
+    if not delta:
+        return 0
+    tx_date = to_date(occurred_at)
+    budget_ids = _budget_ids_for_spend(user_id=user_id, account_id=account_id, tx_date=tx_date)
+    if not budget_ids:
+        return 0
+    return BudgetSpend.objects.filter(budget_id__in=budget_ids).update(
+        spent=F("spent") + delta, updated_at=timezone.now()
+    )
+
+
+def record_transaction_spend(tx, sign: int = 1) -> int:
+    """
+    거래 생성/복구(sign=1), 삭제(sign=-1) 시 지출 카운터 갱신.
+    지출(expense)이 아닌 거래는 무시.
+    """
+    if not is_expense(tx):
+        return 0
+    user_id = _tx_user_id(tx)
+    if not user_id:
+        return 0
+    return apply_spend_delta(
+        user_id=user_id,
+        account_id=tx.account_id,
+        occurred_at=tx.occurred_at,
+        delta=Decimal(tx.amount) * sign,
+    )
+
+
+def apply_spend_batch(*, user_id: int, expenses) -> list[int]:
+    """
+    일괄 등록된 지출들을 예산 카운터에 한 번에 반영.
+    - expenses: (account_id, occurred_at, amount) 목록
+    - 기간이 겹치는 예산을 한 번만 조회해서 예산별 합계를 메모리에서 계산한 뒤 예산당 UPDATE 1번
+    - 변화량이 생긴 예산 id 목록을 반환 (알림 평가 대상)
+    """
+    expenses = [
+        (account_id, to_date(occurred_at), amount) for account_id, occurred_at, amount in expenses
+    ]
+    if not expenses:
+        return []
+    dates = [tx_date for _, tx_date, _ in expenses]
+    account_ids = {account_id for account_id, _, _ in expenses}
+    budgets = Budget.objects.filter(
+        user_id=user_id,
+        deleted_at__isnull=True,
+        period_start__lte=max(dates),
+        period_end__gte=min(dates),
+    ).filter(
+        Q(scope_type=BudgetScopeType.ALL)
+        | Q(scope_type=BudgetScopeType.ACCOUNT, scope_ref_id__in=account_ids)
+    )
+
+    deltas = {}
+    for budget in budgets.only("id", "period_start", "period_end", "scope_type", "scope_ref_id"):
+        delta = sum(
+            (
+                Decimal(amount)
+                for account_id, tx_date, amount in expenses
+                if budget.period_start <= tx_date <= budget.period_end
+                and (budget.scope_type == BudgetScopeType.ALL or budget.scope_ref_id == account_id)
+            ),
+            Decimal("0"),
+        )
+        if delta:
+            deltas[budget.id] = delta
+
+    now = timezone.now()
+    for budget_id, delta in deltas.items():
+        BudgetSpend.objects.filter(budget_id=budget_id).update(
+            spent=F("spent") + delta, updated_at=now
+        )
+    return list(deltas)
+
+
+def create_budget_spend(budget: Budget) -> BudgetSpend:
+    """
+    예산 생성 시 카운터 row 생성 (post_save).
+    새 예산은 커밋 전까지 다른 트랜잭션에 보이지 않으므로 그 사이 거래는 아래 집계에만 반영되고,
+    커밋 후 거래는 apply_spend_delta의 UPDATE로 반영됨 (거래 경로에서 row를 만들지 않음)
+    """
+    return BudgetSpend.objects.create(budget=budget, spent=calculate_spent_for_budget(budget))
+
+
+def rebuild_budget_spend(budget: Budget) -> BudgetSpend:
+    """
+    전체 집계로 카운터를 다시 계산 (예산 수정, 재계산 명령에서 사용)
+    카운터 row를 먼저 잠근 뒤 집계해야 동시에 들어온 delta가 유실되거나 중복되지 않음.
+    카운터 도입 이전 예산처럼 row가 없으면 여기서 만듦.
+    """
+    with transaction.atomic():
+        spend, _ = BudgetSpend.objects.select_for_update().get_or_create(budget=budget)
+        spend.spent = calculate_spent_for_budget(budget)
+        spend.save(update_fields=["spent", "updated_at"])
+    return spend
+
+
+def get_budget_spent(budget: Budget) -> Decimal:
+    """
+    알림 평가용 지출 합계 조회 (카운터 O(1) 조회).
+    카운터가 없는 예산(도입 이전 데이터)은 전체 집계 값을 돌려주고 row는 만들지 않음
+    - 평가는 거래 경로에서도 실행되므로, 여기서 row를 만들면 커밋 전인 다른 거래의 delta가
+      유실되거나 중복될 수 있음 → rebuild_budget_spend 명령으로 채움
+    """
+    spent = BudgetSpend.objects.filter(budget_id=budget.id).values_list("spent", flat=True).first()
+    if spent is None:
+        spent = calculate_spent_for_budget(budget)
+    return Decimal(spent)
+
+
 def rule_should_trigger(spent: Decimal, budget_limit: Decimal, rule: BudgetAlertRule) -> bool:
     """
     ThresholdType은 모델 Enum/choices 기준으로 비교.
@@ -135,40 +308,149 @@ def rule_should_trigger(spent: Decimal, budget_limit: Decimal, rule: BudgetAlert
     return False
 
 
-def trigger_budget_alerts_for_transaction(tx) -> None:
+def _budgets_for_transaction(tx):
     """
-    실시간: 거래가 저장된 직후 호출될 함수
+    거래 날짜가 기간에 포함되는 사용자 예산 QuerySet (지출이 아니거나 날짜/사용자를 모르면 None)
     """
     if not is_expense(tx):
-        return
+        return None
 
     tx_date = _tx_date(tx)
     if not tx_date:
-        return
-
-    # Transaction 모델은 tx.user_id가 없으므로 account로 user 추출
-    user_id = getattr(tx, "user_id", None)
-    if user_id is None:
-        account = getattr(tx, "account", None)
-        user_id = getattr(account, "user_id", None)
+        return None
 
+    user_id = _tx_user_id(tx)
     if not user_id:
-        return
+        return None
 
-    # 이번 거래 날짜에 해당하는 예산만 검사
-    budgets = Budget.objects.filter(
+    return Budget.objects.filter(
         user_id=user_id,
         deleted_at__isnull=True,
         period_start__lte=tx_date,
         period_end__gte=tx_date,
     )
 
+
+def budget_ids_for_transaction(tx) -> list[int]:
+    # 비동기 모드에서 배치 태스크로 넘길 평가 대상 예산 id
+    budgets = _budgets_for_transaction(tx)
+    if budgets is None:
+        return []
+    return list(budgets.values_list("id", flat=True))
+
+
+def trigger_budget_alerts_for_transaction(tx) -> None:
+    """
+    실시간: 거래가 저장된 직후 호출될 함수
+    """
+    # 이번 거래 날짜에 해당하는 예산만 검사
+    budgets = _budgets_for_transaction(tx)
+    if budgets is None:
+        return
+
     for budget in budgets:
-        spent = calculate_spent_for_budget(budget)
-        limit = Decimal(budget.amount_limit)
+        evaluate_budget_alerts(budget)
+
+
+def evaluate_budget_alerts(budget: Budget) -> None:
+    # 예산 1건 평가: 카운터 O(1) 조회 후 룰 검사
+    spent = get_budget_spent(budget)
+    limit = Decimal(budget.amount_limit)
+
+    # 룰들을 트랜잭션+락으로 처리해서 "중복 알림" 방지
+    _check_and_trigger_rules_atomic(budget=budget, spent=spent, budget_limit=limit)
 
-        # 룰들을 트랜잭션+락으로 처리해서 "중복 알림" 방지
-        _check_and_trigger_rules_atomic(budget=budget, spent=spent, budget_limit=limit)
+
+def trigger_budget_alerts_for_user(user_id: int, budget_ids=None) -> int:
+    """
+    비동기 배치: 윈도우 동안 거래가 반영된 예산만 예산당 한 번씩 평가.
+    - 대상: budget_ids + 윈도우 안의 다른 이벤트가 표시해 둔 예산(_pending_key)
+    - 그 중 아직 울리지 않은(last_triggered_at이 없는) 활성 룰이 남은 예산만 평가
+      (이미 모두 울린 예산은 다시 평가해도 결과가 같으므로 제외)
+    - budget_ids=None(예산 id 없이 예약된 이전 메시지)이면 남은 예산 전체를 평가
+    """
+    # 윈도우를 먼저 닫아야 지금부터 커밋되는 거래가 새 태스크로 예약됨 (표시를 놓치지 않음)
+    cache.delete(_batch_key(user_id))
+
+    budgets = Budget.objects.filter(
+        user_id=user_id,
+        deleted_at__isnull=True,
+        alert_rules__is_enabled=True,
+        alert_rules__last_triggered_at__isnull=True,
+    ).distinct()
+
+    requested = None if budget_ids is None else set(budget_ids)
+    evaluated = 0
+    for budget in budgets:
+        # cache.delete는 키가 있었을 때만 True → 표시를 꺼내면서 확인 (동시 실행 태스크와 나눠 가짐)
+        pending = cache.delete(_pending_key(user_id, budget.id))
+        if requested is not None and budget.id not in requested and not pending:
+            continue
+        evaluate_budget_alerts(budget)
+        evaluated += 1
+    return evaluated
+
+
+def trigger_budget_alerts_for_budgets(user_id: int, budget_ids) -> int:
+    """
+    일괄 등록 후 영향받은 예산을 예산당 한 번씩 평가.
+    비동기 모드면 커밋 후 사용자 배치 태스크로 넘김 (영향받은 예산 id만 전달).
+    """
+    if not budget_ids:
+        return 0
+    if settings.BUDGET_ALERT_ASYNC:
+        transaction.on_commit(partial(enqueue_budget_alert_evaluation, user_id, list(budget_ids)))
+        return 0
+
+    evaluated = 0
+    for budget in Budget.objects.filter(id__in=budget_ids, deleted_at__isnull=True):
+        evaluate_budget_alerts(budget)
+        evaluated += 1
+    return evaluated
+
+
+# 평가 대기 표시 유지 시간(초): 태스크가 큐에서 늦게 실행돼도 표시가 먼저 사라지지 않도록 넉넉히
+PENDING_BUDGET_TIMEOUT = 60 * 60
+
+
+def _batch_key(user_id: int) -> str:
+    return f"budget-alert:batch:{user_id}"
+
+
+def _pending_key(user_id: int, budget_id: int) -> str:
+    return f"budget-alert:batch:{user_id}:budget:{budget_id}"
+
+
+def enqueue_budget_alert_evaluation(user_id: int, budget_ids) -> bool:
+    """
+    거래 커밋 후(on_commit) 호출: 사용자별로 BATCH 윈도우 동안 평가 태스크를 한 번만 예약.
+    - 영향받은 예산을 먼저 표시해 두고(_pending_key), 태스크는 표시된 예산만 평가
+    - cache.add는 키가 없을 때만 성공하므로 윈도우 안의 나머지 이벤트는 같은 태스크에 합쳐짐
+    - 태스크는 실행 시점의 카운터를 읽기 때문에 윈도우 안에 커밋된 거래는 모두 반영됨
+    - 브로커 장애 시 예약 표시를 지우고 동기 평가로 대체 (알림 누락 방지)
+    """
+    from .tasks import evaluate_budget_alerts_for_user
+
+    budget_ids = list(budget_ids)
+    if not budget_ids:
+        return False
+    cache.set_many(
+        {_pending_key(user_id, budget_id): 1 for budget_id in budget_ids},
+        timeout=PENDING_BUDGET_TIMEOUT,
+    )
+
+    window = getattr(settings, "BUDGET_ALERT_BATCH_WINDOW_SECONDS", 5)
+    if not cache.add(_batch_key(user_id), 1, timeout=window):
+        return False
+
+    try:
+        # 공유 캐시가 없으면 워커의 표시를 태스크가 못 보므로 이번 이벤트의 예산 id는 인자로도 넘김
+        evaluate_budget_alerts_for_user.apply_async(args=[user_id, budget_ids], countdown=window)
+    except Exception:
+        cache.delete(_batch_key(user_id))
+        trigger_budget_alerts_for_user(user_id, budget_ids)
+        return False
+    return True
 
 
 @transaction.atomic
@@ -208,6 +490,7 @@ def _check_and_trigger_rules_atomic(
         _send_notification_safely(
             user_id=budget.user_id,
             budget_id=budget.id,
+            budget_name=budget.name,
             rule_id=rule.id,
             spent=spent,
             budget_limit=budget_limit,
@@ -1,8 +1,21 @@
+from functools import partial
+
 from django.apps import apps
+from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from .services import trigger_budget_alerts_for_transaction
+from .models import Budget
+from .services import (
+    _tx_user_id,
+    budget_ids_for_transaction,
+    create_budget_spend,
+    enqueue_budget_alert_evaluation,
+    rebuild_budget_spend,
+    record_transaction_spend,
+    trigger_budget_alerts_for_transaction,
+)
 
 
 def _get_transaction_model():
@@ -18,4 +31,25 @@ def on_transaction_saved(sender, instance, created, **kwargs):
     if not created:
         return
 
+    # 지출 카운터를 먼저 갱신해야 알림 평가가 이번 거래까지 반영된 값을 읽음
+    if instance.deleted_at is None:
+        record_transaction_spend(instance)
+
+    if settings.BUDGET_ALERT_ASYNC:
+        # 커밋 이후 사용자 단위 배치 태스크로 넘김 (요청 경로에서는 카운터 갱신만 수행)
+        user_id = _tx_user_id(instance)
+        budget_ids = budget_ids_for_transaction(instance)
+        if user_id is not None and budget_ids:
+            transaction.on_commit(partial(enqueue_budget_alert_evaluation, user_id, budget_ids))
+        return
+
     trigger_budget_alerts_for_transaction(instance)
+
+
+@receiver(post_save, sender=Budget)
+def on_budget_saved(sender, instance, created, **kwargs):
+    # 예산 생성 시 카운터 row를 만들고, 수정(기간, scope 변경 등) 시 전체 집계로 다시 맞춤
+    if created:
+        create_budget_spend(instance)
+        return
+    rebuild_budget_spend(instance)
@@ -0,0 +1,10 @@
+from celery import shared_task
+
+from .services import trigger_budget_alerts_for_user
+
+
+@shared_task
+def evaluate_budget_alerts_for_user(user_id, budget_ids=None):
+    # 배치 윈도우 동안 쌓인 거래 이벤트를 사용자 단위로 한 번에 평가 (영향받은 예산만)
+    evaluated = trigger_budget_alerts_for_user(user_id, budget_ids)
+    return {"user_id": user_id, "evaluated_budgets": evaluated}
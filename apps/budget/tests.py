@@ -1 +1,374 @@
-# Create your tests here.
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from apps.bank_account.models import Account
+from apps.members.models import User
+from apps.notification.models import Notification
+from apps.transaction.models import Transaction
+
+from .models import Budget, BudgetAlertRule, BudgetScopeType, BudgetSpend, ThresholdType
+from .services import (
+    calculate_spent_for_budget,
+    get_budget_spent,
+    trigger_budget_alerts_for_budgets,
+)
+from .tasks import evaluate_budget_alerts_for_user
+
+
+# 예산 지출 카운터(BudgetSpend) 증분 갱신을 검증하는 테스트 클래스
+class BudgetSpendLedgerTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="budget@example.com",
+            password="testpass123",
+            name="Budget User",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name="Main Account",
+            source_type="bank",
+            balance=Decimal("100000.00"),
+        )
+        self.other_account = Account.objects.create(
+            user=self.user,
+            name="Card",
+            source_type="card",
+            balance=Decimal("0.00"),
+        )
+        self.budget = Budget.objects.create(
+            user=self.user,
+            name="1월 전체 예산",
+            period_start=date(2026, 1, 1),
+            period_end=date(2026, 1, 31),
+            amount_limit=Decimal("1000.00"),
+            scope_type=BudgetScopeType.ALL,
+        )
+        self.client.force_authenticate(self.user)
+
+    def _create_tx(self, amount, direction="expense", account=None, month=1, day=15):
+        url = reverse("transactions-list")
+        payload = {
+            "account": (account or self.account).id,
+            "amount": str(amount),
+            "direction": direction,
+            "method": "card",
+            "description": "test",
+            "occurred_at": timezone.make_aware(datetime(2026, month, day, 12, 0)).isoformat(),
+        }
+        response = self.client.post(url, payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        return response.data["id"]
+
+    def _stored_spent(self, budget=None):
+        return BudgetSpend.objects.get(budget=budget or self.budget).spent
+
+    # 예산 생성 시 카운터 row가 만들어지고, 지출 거래만 누적되는지 확인
+    def test_create_expense_increments_spend(self):
+        self.assertEqual(self._stored_spent(), Decimal("0"))
+
+        self._create_tx("300.00")
+        self._create_tx("500.00", direction="income")
+        # 기간 밖(2월) 지출은 포함되지 않음
+        self._create_tx("70.00", month=2, day=1)
+
+        self.assertEqual(self._stored_spent(), Decimal("300.00"))
+        self.assertEqual(self._stored_spent(), calculate_spent_for_budget(self.budget))
+
+    # 삭제/복구 시 카운터가 차감/재반영되는지 확인
+    def test_soft_delete_and_restore_adjust_spend(self):
+        tx_id = self._create_tx("250.00")
+
+        response = self.client.delete(reverse("transactions-detail", args=[tx_id]))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self._stored_spent(), Decimal("0"))
+
+        response = self.client.post(reverse("transactions-restore", args=[tx_id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._stored_spent(), Decimal("250.00"))
+
+    # 금액/방향/날짜 수정 시 카운터가 보정되는지 확인
+    def test_partial_update_adjusts_spend(self):
+        tx_id = self._create_tx("100.00")
+        url = reverse("transactions-detail", args=[tx_id])
+
+        self.client.patch(url, {"amount": "180.00"}, format="json")
+        self.assertEqual(self._stored_spent(), Decimal("180.00"))
+
+        self.client.patch(url, {"direction": "income"}, format="json")
+        self.assertEqual(self._stored_spent(), Decimal("0"))
+
+        self.client.patch(url, {"direction": "expense"}, format="json")
+        self.assertEqual(self._stored_spent(), Decimal("180.00"))
+
+        # 예산 기간 밖으로 날짜를 옮기면 빠짐
+        moved = timezone.make_aware(datetime(2026, 2, 3, 9, 0)).isoformat()
+        self.client.patch(url, {"occurred_at": moved}, format="json")
+        self.assertEqual(self._stored_spent(), Decimal("0"))
+        self.assertEqual(self._stored_spent(), calculate_spent_for_budget(self.budget))
+
+    # 계좌 scope 예산은 해당 계좌 지출만 누적되는지 확인
+    def test_account_scope_counts_only_matching_account(self):
+        account_budget = Budget.objects.create(
+            user=self.user,
+            name="카드 예산",
+            period_start=date(2026, 1, 1),
+            period_end=date(2026, 1, 31),
+            amount_limit=Decimal("500.00"),
+            scope_type=BudgetScopeType.ACCOUNT,
+            scope_ref_id=self.other_account.id,
+        )
+
+        self._create_tx("40.00")
+        self._create_tx("60.00", account=self.other_account)
+
+        self.assertEqual(self._stored_spent(account_budget), Decimal("60.00"))
+        self.assertEqual(self._stored_spent(), Decimal("100.00"))
+
+    # 알림 규칙이 카운터 값 기준으로 딱 한 번만 트리거되는지 확인
+    def test_alert_rule_uses_spend_counter_and_fires_once(self):
+        rule = BudgetAlertRule.objects.create(
+            budget=self.budget,
+            threshold_type=ThresholdType.PERCENT,
+            threshold_value=Decimal("80"),
+        )
+
+        self._create_tx("700.00")
+        rule.refresh_from_db()
+        self.assertIsNone(rule.last_triggered_at)
+
+        self._create_tx("200.00")
+        rule.refresh_from_db()
+        triggered_at = rule.last_triggered_at
+        self.assertIsNotNone(triggered_at)
+
+        self._create_tx("50.00")
+        rule.refresh_from_db()
+        self.assertEqual(rule.last_triggered_at, triggered_at)
+        # 룰이 울리면 예산 알림이 한 건 저장됨
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+
+    # 카운터가 어긋났을 때 재계산 명령으로 복구되는지 확인
+    def test_rebuild_command_fixes_drift(self):
+        self._create_tx("120.00")
+        # 시그널을 우회한 직접 생성 + 카운터 훼손
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=self.account,
+                    amount=Decimal("30.00"),
+                    balance_after=Decimal("0"),
+                    direction="expense",
+                    method="cash",
+                    occurred_at=timezone.make_aware(datetime(2026, 1, 20, 8, 0)),
+                )
+            ]
+        )
+        BudgetSpend.objects.filter(budget=self.budget).update(spent=Decimal("1"))
+
+        out = StringIO()
+        call_command("rebuild_budget_spend", "--dry-run", stdout=out)
+        self.assertEqual(self._stored_spent(), Decimal("1"))
+
+        call_command("rebuild_budget_spend", stdout=out)
+        self.assertEqual(self._stored_spent(), Decimal("150.00"))
+
+    # 예산 생성 시 이미 있던 지출까지 집계해서 카운터 row가 만들어지는지 확인
+    def test_budget_creation_seeds_counter_with_existing_spend(self):
+        self._create_tx("90.00")
+        february = Budget.objects.create(
+            user=self.user,
+            name="2월 전체 예산",
+            period_start=date(2026, 2, 1),
+            period_end=date(2026, 2, 28),
+            amount_limit=Decimal("1000.00"),
+            scope_type=BudgetScopeType.ALL,
+        )
+        self._create_tx("40.00", month=2, day=3)
+
+        self.assertEqual(self._stored_spent(), Decimal("90.00"))
+        self.assertEqual(self._stored_spent(february), Decimal("40.00"))
+
+    # 카운터 row가 없는 예산(도입 이전)은 거래/평가 경로에서 row를 만들지 않고 집계 값으로 평가
+    def test_missing_counter_is_not_created_on_transaction_path(self):
+        self._create_tx("90.00")
+        BudgetSpend.objects.filter(budget=self.budget).delete()
+
+        self._create_tx("20.00")
+        self.assertEqual(get_budget_spent(self.budget), Decimal("110.00"))
+        self.assertFalse(BudgetSpend.objects.filter(budget=self.budget).exists())
+
+        call_command("rebuild_budget_spend", stdout=StringIO())
+        self.assertEqual(self._stored_spent(), Decimal("110.00"))
+
+
+# 알림 평가를 Celery 배치 태스크로 넘기는 비동기 모드 테스트
+@override_settings(BUDGET_ALERT_ASYNC=True, BUDGET_ALERT_BATCH_WINDOW_SECONDS=5)
+class BudgetAlertAsyncTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="alert-async@example.com",
+            password="testpass123",
+            name="Async User",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name="Main Account",
+            source_type="bank",
+            balance=Decimal("100000.00"),
+        )
+        self.budget = Budget.objects.create(
+            user=self.user,
+            name="1월 전체 예산",
+            period_start=date(2026, 1, 1),
+            period_end=date(2026, 1, 31),
+            amount_limit=Decimal("1000.00"),
+            scope_type=BudgetScopeType.ALL,
+        )
+        self.rule = BudgetAlertRule.objects.create(
+            budget=self.budget,
+            threshold_type=ThresholdType.PERCENT,
+            threshold_value=Decimal("80"),
+        )
+        self.client.force_authenticate(self.user)
+
+    def _create_tx(self, amount):
+        payload = {
+            "account": self.account.id,
+            "amount": str(amount),
+            "direction": "expense",
+            "method": "card",
+            "description": "test",
+            "occurred_at": timezone.make_aware(datetime(2026, 1, 15, 12, 0)).isoformat(),
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("transactions-list"), payload, format="json")
+        self.assertEqual(response.status_code, 201)
+
+    # 윈도우 안의 여러 거래는 태스크 1건으로 합쳐지고, 요청 경로에서는 평가하지 않음
+    def test_transactions_in_window_enqueue_single_task(self):
+        with mock.patch.object(evaluate_budget_alerts_for_user, "apply_async") as apply_async:
+            self._create_tx("500.00")
+            self._create_tx("400.00")
+            self._create_tx("50.00")
+
+        apply_async.assert_called_once_with(args=[self.user.id, [self.budget.id]], countdown=5)
+        self.rule.refresh_from_db()
+        self.assertIsNone(self.rule.last_triggered_at)
+        # 카운터는 요청 경로에서 그대로 갱신됨
+        self.assertEqual(BudgetSpend.objects.get(budget=self.budget).spent, Decimal("950.00"))
+
+    # 태스크 실행 시 룰은 한 번만 트리거되고, 재실행해도 중복 알림이 없음
+    def test_task_triggers_rule_exactly_once(self):
+        with mock.patch.object(evaluate_budget_alerts_for_user, "apply_async"):
+            self._create_tx("900.00")
+
+        result = evaluate_budget_alerts_for_user(self.user.id)
+        self.assertEqual(result["evaluated_budgets"], 1)
+        self.rule.refresh_from_db()
+        triggered_at = self.rule.last_triggered_at
+        self.assertIsNotNone(triggered_at)
+
+        result = evaluate_budget_alerts_for_user(self.user.id)
+        self.assertEqual(result["evaluated_budgets"], 0)
+        self.rule.refresh_from_db()
+        self.assertEqual(self.rule.last_triggered_at, triggered_at)
+
+    def _create_budget_with_rule(self, name, period_start, period_end):
+        budget = Budget.objects.create(
+            user=self.user,
+            name=name,
+            period_start=period_start,
+            period_end=period_end,
+            amount_limit=Decimal("1000.00"),
+            scope_type=BudgetScopeType.ALL,
+        )
+        rule = BudgetAlertRule.objects.create(
+            budget=budget, threshold_type=ThresholdType.PERCENT, threshold_value=Decimal("80")
+        )
+        return budget, rule
+
+    # 태스크는 이번 배치에서 거래가 반영된 예산만 평가 (관련 없는 과거 초과 예산은 그대로)
+    def test_task_evaluates_only_affected_budgets(self):
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    account=self.account,
+                    amount=Decimal("2000.00"),
+                    balance_after=Decimal("0"),
+                    direction="expense",
+                    method="card",
+                    occurred_at=timezone.make_aware(datetime(2025, 12, 10, 12, 0)),
+                )
+            ]
+        )
+        _, december_rule = self._create_budget_with_rule(
+            "12월 예산", date(2025, 12, 1), date(2025, 12, 31)
+        )
+
+        with mock.patch.object(evaluate_budget_alerts_for_user, "apply_async") as apply_async:
+            self._create_tx("900.00")
+
+        result = evaluate_budget_alerts_for_user(*apply_async.call_args.kwargs["args"])
+        self.assertEqual(result["evaluated_budgets"], 1)
+        self.rule.refresh_from_db()
+        december_rule.refresh_from_db()
+        self.assertIsNotNone(self.rule.last_triggered_at)
+        self.assertIsNone(december_rule.last_triggered_at)
+
+    # 윈도우 안에 합쳐진 다른 예산의 이벤트도 같은 태스크에서 평가됨
+    def test_coalesced_events_evaluate_each_affected_budget(self):
+        _, weekly_rule = self._create_budget_with_rule(
+            "1월 셋째 주 예산", date(2026, 1, 15), date(2026, 1, 21)
+        )
+        with mock.patch.object(evaluate_budget_alerts_for_user, "apply_async") as apply_async:
+            self._create_tx("100.00")
+            self._create_tx("800.00")
+
+        apply_async.assert_called_once()
+        result = evaluate_budget_alerts_for_user(*apply_async.call_args.kwargs["args"])
+        self.assertEqual(result["evaluated_budgets"], 2)
+        self.rule.refresh_from_db()
+        weekly_rule.refresh_from_db()
+        self.assertIsNotNone(self.rule.last_triggered_at)
+        self.assertIsNotNone(weekly_rule.last_triggered_at)
+
+    # 일괄 등록 경로도 영향받은 예산 id를 태스크로 넘김
+    def test_bulk_evaluation_passes_affected_budget_ids(self):
+        with mock.patch.object(evaluate_budget_alerts_for_user, "apply_async") as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(
+                    trigger_budget_alerts_for_budgets(self.user.id, [self.budget.id]), 0
+                )
+
+        apply_async.assert_called_once_with(args=[self.user.id, [self.budget.id]], countdown=5)
+
+    # 브로커 장애로 예약에 실패하면 동기 평가로 대체
+    def test_enqueue_failure_falls_back_to_sync(self):
+        with mock.patch.object(
+            evaluate_budget_alerts_for_user, "apply_async", side_effect=ConnectionError
+        ):
+            self._create_tx("850.00")
+
+        self.rule.refresh_from_db()
+        self.assertIsNotNone(self.rule.last_triggered_at)
+
+    # 공유 캐시 없이 비동기 모드를 켜면 워커별로 따로 예약되므로 시스템 체크 경고
+    def test_system_check_warns_without_shared_cache(self):
+        from .checks import check_budget_alert_batch_cache
+
+        warnings = check_budget_alert_batch_cache(None)
+        self.assertEqual([warning.id for warning in warnings], ["budget.W001"])
+        with override_settings(CACHE_SHARED=True):
+            self.assertEqual(check_budget_alert_batch_cache(None), [])
+        with override_settings(BUDGET_ALERT_ASYNC=False):
+            self.assertEqual(check_budget_alert_batch_cache(None), [])
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from apps.utils.serialization import FastReadSerializer
+
 from .models import Category
 
 
@@ -14,3 +16,9 @@ class CategoryReadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "kind", "sort_order", "parent", "created_at"]
+
+
+# 목록 응답용 빠른 직렬화 (CategoryReadSerializer와 같은 JSON)
+class CategoryFastReadSerializer(FastReadSerializer):
+    model = Category
+    fields = CategoryReadSerializer.Meta.fields
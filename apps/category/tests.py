@@ -1 +1,32 @@
+from rest_framework.test import APITestCase
 
+from apps.members.models import User
+
+from .models import Category
+from .serializers import CategoryReadSerializer
+
+
+# 카테고리 목록 API를 검증하는 테스트 클래스
+class CategoryListTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="category@example.com",
+            password="testpass123",
+            name="Category User",
+        )
+        self.client.force_authenticate(self.user)
+
+    # 빠른 목록 직렬화가 CategoryReadSerializer와 같은 JSON을 만드는지 확인
+    def test_list_matches_read_serializer(self):
+        food = Category.objects.create(user=self.user, name="식비", kind=Category.Kind.EXPENSE)
+        Category.objects.create(
+            user=self.user, name="외식", kind=Category.Kind.EXPENSE, parent=food, sort_order=2
+        )
+        Category.objects.create(user=self.user, name="급여", kind=Category.Kind.INCOME)
+
+        response = self.client.get("/api/categories/")
+        self.assertEqual(response.status_code, 200)
+        expected = CategoryReadSerializer(
+            Category.objects.filter(user=self.user).order_by("name"), many=True
+        ).data
+        self.assertEqual(response.json(), expected)
@@ -5,12 +5,17 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.response_cache import cached_response
 from apps.trashcan.services import TrashService
 from apps.trashcan.views import RestoreAPIView, TrashListAPIView
 
 from .models import Category
 from .repositories import CategoryRepository
-from .serializers import CategoryCreateUpdateSerializer, CategoryReadSerializer
+from .serializers import (
+    CategoryCreateUpdateSerializer,
+    CategoryFastReadSerializer,
+    CategoryReadSerializer,
+)
 
 
 class CategoryListCreateView(APIView):
@@ -57,9 +62,10 @@ class CategoryListCreateView(APIView):
         },
         tags=["카테고리 관리"],
     )
+    @cached_response("category")
     def get(self, request):
         qs = CategoryRepository.list_alive(request.user.id)
-        return Response(CategoryReadSerializer(qs, many=True).data)
+        return Response(CategoryFastReadSerializer.serialize(qs))
 
     @swagger_auto_schema(
         operation_summary="카테고리 생성",
@@ -182,6 +188,7 @@ class CategoryTrashListView(TrashListAPIView):
 
 class CategoryRestoreView(RestoreAPIView):
     model = Category
+    lookup_url_kwarg = "category_id"
 
     @swagger_auto_schema(
         operation_summary="카테고리 복원",
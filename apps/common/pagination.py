@@ -0,0 +1,96 @@
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    (시각 필드, id) 복합 키 기준 최신순 키셋(커서) 페이지네이션 공통 베이스
+
+    - 하위 클래스는 ordering = ("-<시각 필드>", "-id") 만 지정하면 됨
+    - 커서에는 마지막으로 본 행의 (시각, id)만 담기 때문에
+      OFFSET 없이 WHERE 조건으로 바로 다음 페이지를 찾음 (몇 번째 페이지든 비용 동일)
+    - 같은 시각의 행이 많아도 id로 순서가 고정되어 커서가 흔들리지 않음
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = None
+
+    # 커서 position 구분자 ("<시각 ISO>|<id>")
+    position_separator = "|"
+
+    @property
+    def position_field(self):
+        return self.ordering[0].lstrip("-")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+        field = self.position_field
+
+        if self.cursor is not None and self.cursor.position is not None:
+            value, pk = self._parse_position(self.cursor.position)
+            if reverse:
+                # 이전 페이지: 커서보다 "새로운" 행
+                queryset = queryset.filter(
+                    Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk})
+                )
+            else:
+                # 다음 페이지: 커서보다 "오래된" 행
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk})
+                )
+
+        order_by = (field, "id") if reverse else self.ordering
+
+        # 한 건 더 읽어서 다음 페이지 존재 여부 판단 (COUNT 쿼리 불필요)
+        results = list(queryset.order_by(*order_by)[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_previous = has_more
+            self.has_next = self.cursor is not None
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def _get_position_from_instance(self, instance, ordering):
+        field = self.position_field
+        if isinstance(instance, dict):
+            value, pk = instance[field], instance["id"]
+        else:
+            value, pk = getattr(instance, field), instance.id
+        return f"{value.isoformat()}{self.position_separator}{pk}"
+
+    def _parse_position(self, position):
+        try:
+            raw_value, raw_pk = position.rsplit(self.position_separator, 1)
+            return datetime.fromisoformat(raw_value), int(raw_pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
@@ -0,0 +1,29 @@
+"""
+orjson 기반 JSON 파서
+
+요청 본문 파싱만 orjson으로 처리하고, 실패하면 DRF JSONParser로 다시 파싱해서
+오류 응답(ParseError 메시지)과 결과를 DRF와 같게 유지. orjson이 없으면 DRF 기본 구현 사용.
+"""
+
+import io
+
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("_", "-") not in ("utf-8", "utf8"):
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # 오류 메시지와 64비트 초과 정수 처리를 DRF와 같게 맞추기 위해 기본 파서로 다시 시도
+            return super().parse(io.BytesIO(body), media_type, parser_context)
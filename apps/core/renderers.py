@@ -0,0 +1,41 @@
+"""
+orjson 기반 JSON 렌더러
+
+DRF JSONRenderer와 같은 바이트를 만들면서 직렬화만 orjson(C 구현)으로 처리.
+- datetime/date/time/UUID는 orjson이 직접 처리 (UTC는 DRF처럼 "Z")
+- Decimal 등 orjson이 모르는 타입은 DRF JSONEncoder.default로 넘겨 같은 값으로 변환
+- indent 요청(Browsable API 등), orjson이 표현 못 하는 값(64비트 초과 정수 등),
+  orjson 미설치 환경에서는 DRF 기본 구현으로 처리
+- 알려진 차이: 지수 표기 float 형식(1e+16 vs 1e16), NaN/Infinity(DRF는 500, orjson은 null)
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없으면 DRF 기본 json 모듈 사용
+    orjson = None
+
+_encoder = JSONEncoder()
+
+if orjson is not None:
+    _DUMPS_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_encoder.default, option=_DUMPS_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF와 같이 \u2028, \u2029는 이스케이프 (JavaScript 문자열로 안전하게)
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
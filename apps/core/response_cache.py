@@ -0,0 +1,113 @@
+"""
+사용자별 조회 응답 캐시 + ETag
+
+목록 API 응답(response.data)을 (사용자, 리소스, 버전, 요청 경로) 키로 캐시함.
+리소스 버전은 사용자·리소스마다 하나씩 두고, 쓰기 경로에서 올림(bump_versions).
+버전이 바뀌면 키가 달라지므로 이전 응답은 지우지 않아도 다시 읽히지 않음 (만료 시간에 자연 정리).
+
+- ETag는 키에서 만들기 때문에 If-None-Match가 맞으면 DB/캐시 본문 조회 없이 304 응답
+- 리소스 이름은 모델의 model_name ("account", "category", "tag", "analysis")
+- 버전 키가 캐시에서 밀려나도 time_ns()로 다시 시작하므로 예전 버전과 겹치지 않음
+- 적중/미스는 cache_stats의 "response:<리소스>" 네임스페이스에 기록 (304도 적중)
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.utils.cache import cache_stats
+
+
+def _version_key(user_id, resource):
+    return f"resp:ver:{user_id}:{resource}"
+
+
+def get_version(user_id, resource):
+    key = _version_key(user_id, resource)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def _bump(user_id, resources):
+    for resource in resources:
+        key = _version_key(user_id, resource)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_versions(user_id, *resources):
+    """
+    사용자 리소스 버전 올리기 (쓰기 경로에서 호출)
+    - 바로 한 번 올리고, 트랜잭션 안이면 커밋 후 한 번 더 올림
+      (커밋 전에 다른 요청이 예전 데이터를 새 버전으로 캐시하는 경우를 막기 위함)
+    """
+    if user_id is None or not resources:
+        return
+    _bump(user_id, resources)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(user_id, resources))
+
+
+def _digest(request, user_id, resource, version):
+    # 같은 사용자·리소스·버전이라도 쿼리스트링/응답 포맷이 다르면 다른 응답
+    raw = f"{user_id}:{resource}:{version}:{request.accepted_renderer.format}:{request.get_full_path()}"
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+def cached_response(resource):
+    """
+    GET 핸들러(APIView.get, ViewSet.list 등)에 붙이는 데코레이터
+    - 200 응답의 data만 캐시하고, 렌더링은 요청마다 수행
+    - Cache-Control: private, no-cache → 브라우저는 저장하되 매번 ETag로 재검증
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            timeout = settings.RESPONSE_CACHE_TIMEOUT
+            user_id = getattr(request.user, "id", None)
+            if timeout <= 0 or user_id is None:
+                return view_method(self, request, *args, **kwargs)
+
+            version = get_version(user_id, resource)
+            digest = _digest(request, user_id, resource, version)
+            etag = f'"{digest}"'
+            headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+            if_none_match = request.headers.get("If-None-Match")
+            if if_none_match:
+                etags = parse_etags(if_none_match)
+                if etag in etags or "*" in etags:
+                    cache_stats.record(f"response:{resource}", "hit")
+                    return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            key = f"resp:data:{user_id}:{resource}:{digest}"
+            data = cache.get(key)
+            cache_stats.record(f"response:{resource}", "miss" if data is None else "hit")
+            if data is None:
+                response = view_method(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                cache.set(key, response.data, timeout=timeout)
+            else:
+                response = Response(data)
+            for name, value in headers.items():
+                response[name] = value
+            return response
+
+        return wrapper
+
+    return decorator
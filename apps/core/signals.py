@@ -0,0 +1,26 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .response_cache import bump_versions
+
+# 조회 응답을 캐시하는 리소스 (생성/수정/삭제 시 사용자 버전을 올림)
+# 휴지통 이동/복구는 queryset.update라 시그널이 없으므로 TrashService에서 직접 올림
+CACHED_MODELS = (
+    "bank_account.Account",
+    "category.Category",
+    "tag.Tag",
+    "analysis.Analysis",
+)
+
+
+def bump_model_version(sender, instance, **kwargs):
+    bump_versions(instance.user_id, sender._meta.model_name)
+
+
+def connect_signals():
+    for label in CACHED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(bump_model_version, sender=model, dispatch_uid=f"resp-cache-{label}")
+        post_delete.connect(
+            bump_model_version, sender=model, dispatch_uid=f"resp-cache-del-{label}"
+        )
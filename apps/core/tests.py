@@ -1 +1,296 @@
-# Create your tests here.
+import io
+import os
+import runpy
+import threading
+import uuid
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from apps.bank_account.models import Account
+from apps.members.models import User
+from apps.tag.models import Tag
+from apps.transaction.services import create_transaction
+from apps.utils.cache import cache_stats, get_or_set, memoize
+
+from .parsers import FastJSONParser
+from .renderers import FastJSONRenderer
+
+
+# orjson 렌더러/파서가 DRF 기본 구현과 같은 결과를 내는지 검증하는 테스트 클래스
+class FastJSONTests(SimpleTestCase):
+    def _render_both(self, data, accepted_media_type="application/json"):
+        return (
+            FastJSONRenderer().render(data, accepted_media_type, {}),
+            JSONRenderer().render(data, accepted_media_type, {}),
+        )
+
+    # 거래 목록 형태의 응답과 특수 타입들이 바이트 단위로 같은지 확인
+    def test_render_is_byte_identical(self):
+        seoul = timezone.get_fixed_timezone(540)
+        payload = {
+            "next": None,
+            "results": [
+                {
+                    "id": 1,
+                    "amount": "12000.00",
+                    "raw_amount": Decimal("1234.5600"),
+                    "occurred_at": datetime(2026, 1, 8, 12, 30, 0, 123456, tzinfo=seoul),
+                    "utc_at": datetime(2026, 1, 8, 3, 30, tzinfo=dt_timezone.utc),
+                    "naive_at": datetime(2026, 1, 8, 12, 30),
+                    "date": date(2026, 1, 8),
+                    "time": time(9, 15, 30),
+                    "duration": timedelta(minutes=90),
+                    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                    "description": '점심\u2028줄바꿈\n\u2029"인용" \\ 🍜',
+                    "label": gettext_lazy("예산"),
+                    "tags": [{"id": 3, "name": "식비", "color": ""}],
+                    "ratio": 0.1,
+                    "flags": (True, False, None),
+                }
+            ],
+            "by_day": {1: 10, 2: 20},
+        }
+        fast, default = self._render_both(payload)
+        self.assertEqual(fast, default)
+
+    # indent 요청과 64비트 초과 정수는 DRF 기본 구현으로 처리되는지 확인
+    def test_fallbacks_match_default(self):
+        fast, default = self._render_both({"a": [1, 2]}, "application/json; indent=4")
+        self.assertEqual(fast, default)
+        fast, default = self._render_both({"big": 2**70})
+        self.assertEqual(fast, default)
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    # 파싱 결과와 잘못된 JSON의 오류 메시지가 DRF와 같은지 확인
+    def test_parse_matches_default(self):
+        body = '{"amount": 1.5, "name": "식비", "ids": [1, 2], "big": 1180591620717411303424}'
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body.encode())),
+            JSONParser().parse(io.BytesIO(body.encode())),
+        )
+
+        for invalid in (b'{"a": ', b'{"a": NaN}'):
+            with self.assertRaises(ParseError) as fast_error:
+                FastJSONParser().parse(io.BytesIO(invalid))
+            with self.assertRaises(ParseError) as default_error:
+                JSONParser().parse(io.BytesIO(invalid))
+            self.assertEqual(str(fast_error.exception), str(default_error.exception))
+
+
+def process_cache(location):
+    # 프로세스 하나의 default 캐시로 바꿈 (LOCATION이 같으면 Redis처럼 공유, 다르면 프로세스 로컬 메모리)
+    return override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": location,
+            }
+        }
+    )
+
+
+def load_base_settings(**env):
+    # 환경 변수만 바꿔서 config/settings/base.py를 다시 평가한 값
+    path = os.path.join(settings.BASE_DIR, "config", "settings", "base.py")
+    with mock.patch.dict(os.environ, env):
+        os.environ.pop("RESPONSE_CACHE_TIMEOUT", None)
+        return runpy.run_path(path)
+
+
+# 사용자별 목록 응답 캐시와 ETag 재검증, 쓰기 경로의 버전 갱신을 검증하는 테스트 클래스
+@override_settings(RESPONSE_CACHE_TIMEOUT=300, CACHE_SHARED=True)
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="cache@example.com",
+            password="testpass123",
+            name="Cache User",
+        )
+        self.client.force_authenticate(self.user)
+        self.tag = Tag.objects.create(user=self.user, name="식비")
+
+    # 변경이 없으면 두 번째 조회는 DB 쿼리 없이 같은 본문/ETag를 돌려주는지 확인
+    def test_repeated_read_is_served_from_cache(self):
+        first = self.client.get("/api/tags/")
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/tags/")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    # If-None-Match가 현재 ETag와 같으면 본문 없이 304
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get("/api/tags/")["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    # 생성/휴지통 이동/복구 후에는 새 목록과 새 ETag를 돌려주는지 확인
+    def test_writes_invalidate_cached_list(self):
+        etag = self.client.get("/api/tags/")["ETag"]
+
+        created = self.client.post("/api/tags/", {"name": "교통"}, format="json")
+        self.assertEqual(created.status_code, 201)
+        response = self.client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["name"] for row in response.json()], ["교통", "식비"])
+
+        self.client.delete(f"/api/tags/{self.tag.id}/")
+        response = self.client.get("/api/tags/")
+        self.assertEqual([row["name"] for row in response.json()], ["교통"])
+
+        self.client.post(f"/api/tags/{self.tag.id}/restore/")
+        response = self.client.get("/api/tags/")
+        self.assertEqual([row["name"] for row in response.json()], ["교통", "식비"])
+
+    # 거래 생성으로 계좌 잔액이 바뀌면 계좌 목록 캐시도 갱신되는지 확인
+    def test_create_transaction_invalidates_account_list(self):
+        account = Account.objects.create(
+            user=self.user, name="주거래", source_type="bank", balance=Decimal("1000")
+        )
+        self.assertEqual(self.client.get("/api/accounts/").json()[0]["balance"], "1000.00")
+
+        create_transaction(
+            self.user,
+            account_id=account.id,
+            amount="300",
+            direction="expense",
+            method="card",
+            description="점심",
+            occurred_at=timezone.now(),
+        )
+        self.assertEqual(self.client.get("/api/accounts/").json()[0]["balance"], "700.00")
+
+    # 다른 사용자의 캐시 응답을 받지 않는지 확인
+    def test_cache_is_per_user(self):
+        self.client.get("/api/tags/")
+        other = User.objects.create_user(
+            email="cache-other@example.com", password="testpass123", name="Other"
+        )
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get("/api/tags/").json(), [])
+
+
+# 쓰기와 읽기가 서로 다른 캐시 인스턴스(다른 gunicorn 워커, Celery)를 거칠 때를 검증하는 테스트 클래스
+class ResponseCacheAcrossProcessesTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="cache-proc@example.com", password="testpass123", name="Cache User"
+        )
+        self.client.force_authenticate(self.user)
+        Tag.objects.create(user=self.user, name="식비")
+
+    def read_tags(self, location):
+        with process_cache(location):
+            return [row["name"] for row in self.client.get("/api/tags/").json()]
+
+    def create_tag(self, location, name):
+        # 다른 프로세스의 쓰기: 그 프로세스의 캐시에서만 버전을 올림
+        with process_cache(location):
+            Tag.objects.create(user=self.user, name=name)
+
+    # 공유 캐시(같은 저장소)면 다른 인스턴스에서 올린 버전이 읽는 쪽 캐시도 무효화하는지 확인
+    @override_settings(RESPONSE_CACHE_TIMEOUT=300, CACHE_SHARED=True)
+    def test_shared_cache_sees_writes_from_other_process(self):
+        self.assertEqual(self.read_tags("shared"), ["식비"])
+        self.create_tag("shared", "교통")
+        self.assertEqual(self.read_tags("shared"), ["교통", "식비"])
+
+    # 프로세스 로컬 캐시에서 응답 캐시를 켜면 다른 프로세스의 쓰기가 반영되지 않음 (기본값이 꺼져 있는 이유)
+    @override_settings(RESPONSE_CACHE_TIMEOUT=300)
+    def test_local_memory_cache_serves_stale_list(self):
+        self.assertEqual(self.read_tags("web-worker"), ["식비"])
+        self.create_tag("celery-worker", "교통")
+        self.assertEqual(self.read_tags("web-worker"), ["식비"])
+
+    # CACHE_URL이 없으면 응답 캐시가 기본으로 꺼지고, 다른 프로세스의 쓰기가 바로 보이는지 확인
+    def test_response_cache_is_off_without_shared_cache(self):
+        local = load_base_settings(CACHE_URL="")
+        self.assertFalse(local["CACHE_SHARED"])
+        self.assertEqual(local["RESPONSE_CACHE_TIMEOUT"], 0)
+        shared = load_base_settings(CACHE_URL="redis://cache:6379/1")
+        self.assertTrue(shared["CACHE_SHARED"])
+        self.assertEqual(shared["RESPONSE_CACHE_TIMEOUT"], 300)
+
+        with override_settings(RESPONSE_CACHE_TIMEOUT=local["RESPONSE_CACHE_TIMEOUT"]):
+            self.assertEqual(self.read_tags("web-worker"), ["식비"])
+            self.create_tag("celery-worker", "교통")
+            self.assertEqual(self.read_tags("web-worker"), ["교통", "식비"])
+
+
+# 공통 캐시 헬퍼(memoize, single-flight get_or_set, 카운터)를 검증하는 테스트 클래스
+class CacheHelperTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        cache_stats.reset()
+
+    # 같은 인자는 한 번만 계산하고, invalidate 후에는 다시 계산하는지 확인
+    def test_memoize_caches_per_arguments(self):
+        calls = []
+
+        @memoize("test:square", timeout=60)
+        def square(value):
+            calls.append(value)
+            return value * value
+
+        self.assertEqual([square(3), square(3), square(4)], [9, 9, 16])
+        self.assertEqual(calls, [3, 4])
+        self.assertEqual(cache_stats.snapshot()["test:square"], {"hit": 1, "miss": 2, "wait": 0})
+
+        square.invalidate(3)
+        square(3)
+        self.assertEqual(calls, [3, 4, 3])
+
+    # None 결과도 캐시해서 다시 계산하지 않는지 확인
+    def test_none_is_cached(self):
+        calls = []
+
+        def producer():
+            calls.append(1)
+
+        self.assertIsNone(get_or_set("test:none", producer, 60))
+        self.assertIsNone(get_or_set("test:none", producer, 60))
+        self.assertEqual(len(calls), 1)
+
+    # 동시에 미스가 나도 계산은 한 번만 하고 나머지는 그 결과를 받는지 확인
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        started = threading.Barrier(5)
+        results = []
+
+        def producer():
+            calls.append(1)
+            threading.Event().wait(0.2)
+            return "value"
+
+        def worker():
+            started.wait()
+            results.append(get_or_set("test:flight", producer, 60, namespace="test:flight"))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["value"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache_stats.snapshot()["test:flight"]["wait"], 4)
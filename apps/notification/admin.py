@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from .models import Notification
+from .services import reset_unread_count
 
 
 @admin.register(Notification)
@@ -18,12 +19,14 @@ class NotificationAdmin(admin.ModelAdmin):
 
     def mark_as_read(self, request, queryset):
         queryset.update(is_read=True)
+        reset_unread_count(*queryset.order_by().values_list("user_id", flat=True).distinct())
         self.message_user(request, f"{queryset.count()}개의 알림을 읽음으로 표시했습니다.")
 
     mark_as_read.short_description = "선택된 알림을 읽음으로 표시"
 
     def mark_as_unread(self, request, queryset):
         queryset.update(is_read=False)
+        reset_unread_count(*queryset.order_by().values_list("user_id", flat=True).distinct())
         self.message_user(request, f"{queryset.count()}개의 알림을 읽지 않음으로 표시했습니다.")
 
     mark_as_unread.short_description = "선택된 알림을 읽지 않음으로 표시"
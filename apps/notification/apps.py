@@ -7,3 +7,6 @@ class NotificationConfig(AppConfig):
     """
 
     name = "apps.notification"
+
+    def ready(self):
+        from . import signals  # noqa: F401
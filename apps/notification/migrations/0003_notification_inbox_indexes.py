@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notification", "0002_notification_deleted_at_notification_deleted_by"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["user", "-created_at", "-id"],
+                name="notif_alive_user_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True), ("is_read", False)),
+                fields=["user", "-created_at", "-id"],
+                name="notif_unread_user_created_idx",
+            ),
+        ),
+    ]
@@ -14,10 +14,36 @@ class Notification(TrashableModel):
     message = models.TextField()
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # 중복 방지 키 (예: 예산 알림은 사용자·예산·룰·시간 구간의 해시). 같은 키는 한 번만 저장됨
+    dedup_key = models.CharField(max_length=64, null=True, blank=True, editable=False)
 
     #  soft delete 기본 매니저
     objects = SoftDeleteManager()
     all_objects = models.Manager()
 
+    class Meta:
+        indexes = [
+            # 알림함 목록 (살아있는 알림 최신순 키셋 커서)
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notif_alive_user_created_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 읽지 않은 알림 목록/개수 (폴링 대상이라 읽은 알림은 인덱스에서 제외)
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notif_unread_user_created_idx",
+                condition=models.Q(is_read=False, deleted_at__isnull=True),
+            ),
+        ]
+        constraints = [
+            # 중복 확인 = 유니크 인덱스 조회 1번, 동시에 보내도 INSERT 하나만 성공
+            models.UniqueConstraint(
+                fields=["dedup_key"],
+                name="notif_dedup_key_uniq",
+                condition=models.Q(dedup_key__isnull=False),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.email} - {self.message[:50]}"
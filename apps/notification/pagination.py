@@ -0,0 +1,14 @@
+from apps.common.pagination import KeysetCursorPagination
+
+
+class NotificationCursorPagination(KeysetCursorPagination):
+    """
+    알림함 목록용 키셋(커서) 페이지네이션
+
+    - (created_at, id) 복합 키 기준 최신순 정렬 → 읽지 않은 알림 부분 인덱스를 그대로 탐
+    - 커서 처리는 KeysetCursorPagination 참고
+    """
+
+    page_size = 20
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
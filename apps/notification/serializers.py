@@ -10,4 +10,30 @@ class NotificationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Notification
-        fields = "__all__"
+        exclude = ["dedup_key"]
+
+
+class NotificationBulkSelectSerializer(serializers.Serializer):
+    """
+    알림 일괄 처리 대상 선택 (조건은 AND, 아무것도 없으면 전체).
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=1000,
+    )
+    # 화면에 보인 가장 최신 알림 id (이 id 이하만 처리, 그 뒤에 도착한 알림은 제외)
+    up_to_id = serializers.IntegerField(min_value=1, required=False)
+
+
+class NotificationBulkDeleteSerializer(NotificationBulkSelectSerializer):
+    """
+    알림 일괄 삭제 대상 선택 (실수로 전체 삭제되지 않도록 조건 필수).
+    """
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("ids 또는 up_to_id 중 하나는 필요합니다.")
+        return attrs
@@ -1,22 +1,202 @@
+import hashlib
+from collections import Counter
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
+from apps.budget.models import ThresholdType
 from apps.notification.models import Notification
+from apps.notification.stream import publish_many
+from apps.utils.cache import get_or_set
 
 
-def send_budget_alert(user, message):
+def budget_alert_dedup_key(user_id, budget_id, rule_id, now=None):
+    """
+    예산 알림 중복 방지 키: (사용자, 예산, 룰, BUDGET_ALERT_DEDUP_MINUTES 시간 구간)의 해시
+    - 메시지 문자열 대신 알림 식별자로 비교하므로 문구가 바뀌어도 같은 알림으로 봄
+    - 고정 구간이라 경계를 사이에 둔 두 알림은 N분 안이어도 키가 다름
+      → 마지막 전송 기준 N분(sliding window)은 send_budget_alert의 캐시 키가 막고,
+        이 키는 캐시를 공유하지 않는 워커끼리도 같은 구간 안에서는 한 건만 저장되도록 하는 DB 안전장치
+    - 0 이하면 중복 방지 안 함(None)
+    """
     dedup_minutes = getattr(settings, "BUDGET_ALERT_DEDUP_MINUTES", 5)
-    since = timezone.now() - timedelta(minutes=dedup_minutes)
+    if dedup_minutes <= 0:
+        return None
+    bucket = int(
+        (now or timezone.now()).timestamp() // timedelta(minutes=dedup_minutes).total_seconds()
+    )
+    raw = f"budget-alert:{user_id}:{budget_id}:{rule_id}:{bucket}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _budget_alert_sent_key(user_id, budget_id, rule_id):
+    return f"budget-alert:sent:{user_id}:{budget_id}:{rule_id}"
+
 
-    if Notification.objects.filter(
-        user=user,
-        message=message,
-        created_at__gte=since,
-    ).exists():
+def _budget_alert_message(budget_name, spent, budget_limit, threshold_type, threshold_value):
+    if threshold_type == ThresholdType.PERCENT:
+        threshold = f"{threshold_value.normalize():f}%"
+    else:
+        threshold = f"{threshold_value:,.0f}원"
+    return (
+        f"'{budget_name}' 예산 지출이 {threshold}에 도달했습니다. "
+        f"(지출 {spent:,.0f}원 / 한도 {budget_limit:,.0f}원)"
+    )
+
+
+def send_budget_alert(
+    *,
+    user_id,
+    budget_id,
+    rule_id,
+    spent,
+    budget_limit,
+    threshold_type,
+    threshold_value,
+    budget_name="",
+):
+    """
+    예산 알림 저장 (budget 서비스의 룰 트리거 payload를 그대로 받음)
+    - 마지막 전송 후 BUDGET_ALERT_DEDUP_MINUTES 동안은 cache.add(SET NX + TTL)가 실패하므로 조회 없이 None 반환
+    - 그 다음 dedup_key 유니크 인덱스에 INSERT를 시도하고, 충돌하면 이미 보낸 알림으로 보고 None 반환
+    - 확인과 저장이 INSERT 하나라 여러 워커가 동시에 보내도 한 건만 저장됨
+    - 호출자가 트랜잭션 안일 수 있으므로 충돌은 savepoint 안에서 처리
+    """
+    dedup_key = budget_alert_dedup_key(user_id, budget_id, rule_id)
+    sent_key = _budget_alert_sent_key(user_id, budget_id, rule_id)
+    if dedup_key is not None:
+        dedup_seconds = settings.BUDGET_ALERT_DEDUP_MINUTES * 60
+        if not cache.add(sent_key, 1, timeout=dedup_seconds):
+            return None
+
+    message = _budget_alert_message(
+        budget_name, spent, budget_limit, threshold_type, threshold_value
+    )
+    try:
+        with transaction.atomic():
+            return Notification.objects.create(
+                user_id=user_id, message=message, dedup_key=dedup_key
+            )
+    except IntegrityError:
         return None
+    except Exception:
+        # 저장하지 못했으면 다음 평가에서 다시 보낼 수 있도록 표시를 지움
+        if dedup_key is not None:
+            cache.delete(sent_key)
+        raise
+
+
+# 읽지 않은 알림 개수 카운터
+# - 폴링(unread-count)은 캐시 키 하나만 읽음. 키가 없을 때만 부분 인덱스로 COUNT
+# - 생성/읽음/휴지통 이동처럼 개수가 바뀌는 경로에서 커밋 후 incr/decr
+# - 키가 없으면 증감은 건너뜀 (다음 조회 때 다시 셈), 어긋나도 만료 시간이 지나면 보정됨
+# - 공유 캐시(CACHE_SHARED)가 아니면 카운터를 쓰지 않고 매번 COUNT
+#   (Celery에서 만든 알림의 증감이 웹 워커의 로컬 메모리 캐시에는 반영되지 않기 때문)
+
+
+def _unread_count_key(user_id):
+    return f"notif:unread:{user_id}"
+
+
+def _count_unread(user_id):
+    return Notification.objects.filter(
+        user_id=user_id, is_read=False, deleted_at__isnull=True
+    ).count()
+
+
+def get_unread_count(user_id):
+    if not settings.CACHE_SHARED:
+        return _count_unread(user_id)
+    count = get_or_set(
+        _unread_count_key(user_id),
+        lambda: _count_unread(user_id),
+        settings.NOTIFICATION_UNREAD_COUNT_TIMEOUT,
+        namespace="notification:unread",
+    )
+    return max(count, 0)
+
+
+def _apply_unread_delta(user_id, delta):
+    try:
+        cache.incr(_unread_count_key(user_id), delta)
+    except ValueError:
+        pass
+
+
+def adjust_unread_count(user_id, delta):
+    # 롤백된 변경이 카운터에 반영되지 않도록 커밋 후 적용 (트랜잭션 밖이면 바로 적용)
+    if delta and settings.CACHE_SHARED:
+        transaction.on_commit(lambda: _apply_unread_delta(user_id, delta))
+
+
+def reset_unread_count(*user_ids):
+    # 이전 상태를 알 수 없는 일괄 변경(어드민 액션, 복구 등)은 카운터를 지우고 다시 셈
+    keys = [_unread_count_key(user_id) for user_id in user_ids]
+    if keys and settings.CACHE_SHARED:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def bulk_create_notifications(notifications, batch_size=None):
+    """
+    알림 여러 건을 bulk_create로 저장
+    - bulk_create는 post_save를 보내지 않으므로 시그널이 하던 일을 여기서 함
+      (읽지 않은 알림 카운터는 사용자별로 한 번 증가, 커밋 후 실시간 스트림 전달)
+    """
+    created = Notification.objects.bulk_create(notifications, batch_size=batch_size)
+    unread = Counter(
+        notification.user_id
+        for notification in created
+        if not notification.is_read and notification.deleted_at is None
+    )
+    for user_id, count in unread.items():
+        adjust_unread_count(user_id, count)
+    transaction.on_commit(lambda: publish_many(created))
+    return created
+
+
+def _bulk_target(user_id, ids=None, up_to_id=None):
+    qs = Notification.objects.filter(user_id=user_id, deleted_at__isnull=True)
+    if ids is not None:
+        qs = qs.filter(id__in=ids)
+    if up_to_id is not None:
+        qs = qs.filter(id__lte=up_to_id)
+    return qs
+
+
+def bulk_mark_read(user_id, ids=None, up_to_id=None):
+    """
+    알림 일괄 읽음 처리 (UPDATE 1번, 바뀐 행 수 반환)
+    - is_read=False 조건이라 바뀐 행 수 = 줄어든 읽지 않은 알림 수
+    """
+    updated = _bulk_target(user_id, ids, up_to_id).filter(is_read=False).update(is_read=True)
+    adjust_unread_count(user_id, -updated)
+    return updated
+
+
+def bulk_soft_delete(user_id, ids=None, up_to_id=None):
+    """
+    알림 일괄 휴지통 이동 (UPDATE 1번, 바뀐 행 수 반환)
+    - 지워진 행 중 읽지 않은 알림 수는 따로 세지 않고 카운터를 다시 세도록 함
+    """
+    deleted = _bulk_target(user_id, ids, up_to_id).update(deleted_at=timezone.now())
+    if deleted:
+        reset_unread_count(user_id)
+    return deleted
+
 
-    notif = Notification.objects.create(user=user, message=message)
-    print(f"{user}에게 알림 전송: {message}")
-    return notif
+def mark_read(notification):
+    """
+    알림 읽음 처리
+    - is_read=False 조건부 UPDATE라 같은 알림을 동시에 읽음 처리해도 카운터는 한 번만 줄어듦
+    """
+    if not notification.is_read:
+        updated = Notification.objects.filter(pk=notification.pk, is_read=False).update(
+            is_read=True
+        )
+        if updated:
+            adjust_unread_count(notification.user_id, -1)
+        notification.is_read = True
+    return notification
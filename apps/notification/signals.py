@@ -0,0 +1,31 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Notification
+from .services import adjust_unread_count, reset_unread_count
+from .stream import publish
+
+# 이 필드가 바뀌면 읽지 않은 알림 개수가 달라질 수 있음
+UNREAD_COUNT_FIELDS = {"user", "is_read", "deleted_at"}
+
+
+@receiver(post_save, sender=Notification)
+def update_unread_count(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        if not instance.is_read and instance.deleted_at is None:
+            adjust_unread_count(instance.user_id, 1)
+        # 실시간 스트림 연결에 새 알림 전달 (롤백된 알림은 보내지 않도록 커밋 후)
+        transaction.on_commit(partial(publish, instance))
+        return
+    if update_fields is not None and not UNREAD_COUNT_FIELDS & set(update_fields):
+        return
+    # 수정 전 상태를 모르므로 증감 대신 다시 세도록 함
+    reset_unread_count(instance.user_id)
+
+
+@receiver(post_delete, sender=Notification)
+def clear_unread_count(sender, instance, **kwargs):
+    reset_unread_count(instance.user_id)
@@ -0,0 +1,229 @@
+"""
+실시간 알림 스트림 (SSE)
+
+- hub(NotificationHub): 프로세스 안의 스트림 연결을 사용자별로 관리하고 새 알림을 나눠 줌
+- publish(): 알림 생성 커밋 후 호출
+  - NOTIFICATION_PUBSUB_URL이 있으면 Redis 채널 하나로 PUBLISH.
+    ASGI 프로세스마다 구독 태스크 하나가 받아서 자기 연결들에 나눠 줌 (Celery 워커에서 생긴 알림도 전달)
+  - 없으면 같은 프로세스의 연결에만 바로 전달
+- 연결마다 크기 제한 큐(NOTIFICATION_STREAM_QUEUE_SIZE)를 둠. 느린 클라이언트 때문에 메모리가 계속 늘지 않고,
+  넘치면 resync 이벤트를 보내고 닫음 (클라이언트는 목록을 다시 조회)
+- 이벤트 id = 알림 id. 재접속 시 Last-Event-ID 이후 알림을 DB에서 다시 보냄
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+from django.conf import settings
+
+try:
+    import redis
+    import redis.asyncio as aioredis
+except ImportError:  # Redis 없이 단일 프로세스로만 전달
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# 연결이 끊겼을 때 EventSource가 재접속하기까지 기다리는 시간(ms)
+RETRY_MS = 3000
+
+
+def pubsub_enabled():
+    return bool(settings.NOTIFICATION_PUBSUB_URL) and redis is not None
+
+
+class Subscription:
+    """
+    스트림 연결 하나 (큐는 연결의 이벤트 루프 안에서만 건드림)
+    """
+
+    def __init__(self, user_id, loop, maxsize):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def push(self, payload):
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # 더 쌓지 않고 표시만 함 → 스트림이 resync를 보내고 닫음
+            self.overflowed = True
+
+
+class NotificationHub:
+    """
+    프로세스 단위 구독 관리 (사용자 id → 연결 집합)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+        self._listener = None
+
+    def subscribe(self, user_id):
+        loop = asyncio.get_running_loop()
+        subscription = Subscription(user_id, loop, settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+        with self._lock:
+            self._subscriptions[user_id].add(subscription)
+        if pubsub_enabled():
+            self._ensure_listener(loop)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def connection_count(self):
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def dispatch(self, user_id, payload):
+        """
+        사용자 연결들에 알림 전달 (어느 스레드에서 불러도 됨), 전달한 연결 수 반환
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.push, payload)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘 (종료 중인 워커)
+                self.unsubscribe(subscription)
+        return len(subscriptions)
+
+    def _ensure_listener(self, loop):
+        with self._lock:
+            if (
+                self._listener is None
+                or self._listener.done()
+                or self._listener.get_loop() is not loop
+            ):
+                self._listener = loop.create_task(self._listen())
+
+    async def _listen(self):
+        # Redis 채널 하나를 구독해서 받은 알림을 이 프로세스의 연결들에 나눠 줌 (끊기면 1초 후 재시도)
+        while True:
+            client = aioredis.from_url(settings.NOTIFICATION_PUBSUB_URL)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(settings.NOTIFICATION_PUBSUB_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        event = json.loads(message["data"])
+                        self.dispatch(event["user_id"], event["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("알림 pub/sub 구독이 끊겨 다시 연결합니다", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+
+hub = NotificationHub()
+
+
+@lru_cache(maxsize=1)
+def _redis_client(url):
+    return redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+
+
+def publish(notification):
+    """
+    새 알림을 스트림 연결들에 전달 (post_save 커밋 후 호출)
+    - 전달 실패가 알림 저장을 실패시키면 안 되므로 Redis 오류는 로그만 남김
+    """
+    publish_many([notification])
+
+
+def publish_many(notifications):
+    # 여러 알림 전달 (bulk_create 커밋 후 호출). Redis는 파이프라인 왕복 한 번으로 PUBLISH
+    from .serializers import NotificationSerializer
+
+    if not notifications:
+        return
+    events = [
+        (notification.user_id, data)
+        for notification, data in zip(
+            notifications, NotificationSerializer(notifications, many=True).data
+        )
+    ]
+    if not pubsub_enabled():
+        for user_id, data in events:
+            hub.dispatch(user_id, data)
+        return
+    try:
+        pipeline = _redis_client(settings.NOTIFICATION_PUBSUB_URL).pipeline(transaction=False)
+        for user_id, data in events:
+            message = json.dumps({"user_id": user_id, "data": data}, ensure_ascii=False)
+            pipeline.publish(settings.NOTIFICATION_PUBSUB_CHANNEL, message)
+        pipeline.execute()
+    except redis.RedisError:
+        logger.warning(
+            "알림 pub/sub 전송 실패: notifications=%s",
+            [notification.pk for notification in notifications],
+            exc_info=True,
+        )
+
+
+def format_event(data, event="notification", event_id=None):
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+async def event_stream(user_id, load_replay=None):
+    """
+    SSE 본문 생성기
+    - 구독을 먼저 걸고 load_replay()로 밀린 알림을 읽어야 그 사이에 생긴 알림을 놓치지 않음.
+      구독은 첫 전송 때 걸리므로 응답 전에 끊긴 연결은 구독을 남기지 않음
+    - replay(밀린 알림)를 먼저 보내고, 이후 큐에 들어오는 알림을 보냄
+    - NOTIFICATION_STREAM_HEARTBEAT_SECONDS 동안 알림이 없으면 주석 줄(": ping")을 보냄.
+      끊긴 연결은 이 전송이 실패하면서 정리됨
+    - NOTIFICATION_STREAM_MAX_SECONDS가 지나면 닫음 (클라이언트가 Last-Event-ID로 재접속)
+    """
+    loop = asyncio.get_running_loop()
+    heartbeat = settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+    max_seconds = settings.NOTIFICATION_STREAM_MAX_SECONDS
+    deadline = loop.time() + max_seconds if max_seconds > 0 else None
+    subscription = hub.subscribe(user_id)
+    try:
+        replay, resync = await load_replay() if load_replay else ([], False)
+        # 구독과 replay 양쪽에 들어 있는 알림은 한 번만 보냄
+        replayed = {data["id"] for data in replay}
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        if resync:
+            yield format_event({}, event="resync")
+        for data in replay:
+            yield format_event(data, event_id=data["id"])
+        while True:
+            if subscription.overflowed:
+                yield format_event({}, event="resync")
+                return
+            timeout = heartbeat
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                timeout = min(timeout, remaining)
+            try:
+                data = await asyncio.wait_for(subscription.queue.get(), timeout)
+            except TimeoutError:
+                yield b": ping\n\n"
+                continue
+            if data["id"] in replayed:
+                continue
+            yield format_event(data, event_id=data["id"])
+    finally:
+        hub.unsubscribe(subscription)
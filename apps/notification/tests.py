@@ -1,11 +1,23 @@
-from django.test import TestCase
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
 
+from apps.budget.models import ThresholdType
 from apps.members.models import User
 
 from .models import Notification
+from .services import budget_alert_dedup_key, send_budget_alert
+from .stream import hub
 
 
 class NotificationModelTest(TestCase):
@@ -61,9 +73,10 @@ class NotificationAPITest(APITestCase):
         url = reverse("notification-unread-list")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertFalse(response.data[0]["is_read"])
-        self.assertEqual(response.data[0]["user"], self.user.id)
+        results = response.data["results"]
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0]["is_read"])
+        self.assertEqual(results[0]["user"], self.user.id)
 
     def test_mark_notification_as_read(self):
         notification = Notification.objects.create(
@@ -116,3 +129,350 @@ class NotificationAPITest(APITestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Notification.objects.count(), 0)
+
+
+@override_settings(CACHE_SHARED=True)
+class NotificationInboxTest(APITestCase):
+    """
+    알림함 키셋 페이지네이션 / 읽지 않은 알림 개수 카운터 테스트.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="inbox@example.com", password="inboxtest123", name="Inbox User"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def create_notifications(self, count, **kwargs):
+        # 같은 created_at이 섞이도록 두 개씩 같은 시각으로 맞춤 (id로 순서 고정 확인)
+        base = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            notifications = [
+                Notification.objects.create(user=self.user, message=f"알림 {i}", **kwargs)
+                for i in range(count)
+            ]
+        for i, notification in enumerate(notifications):
+            Notification.objects.filter(pk=notification.pk).update(
+                created_at=base + timedelta(minutes=i // 2)
+            )
+        return notifications
+
+    def unread_count(self):
+        response = self.client.get(reverse("notification-unread-count"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["unread_count"]
+
+    def test_unread_list_cursor_pagination(self):
+        notifications = self.create_notifications(5)
+        self.create_notifications(2, is_read=True)
+        expected_ids = [n.id for n in reversed(notifications)]
+        url = reverse("notification-unread-list")
+
+        response = self.client.get(url, {"page_size": 2})
+        collected = [item["id"] for item in response.data["results"]]
+        while response.data["next"]:
+            response = self.client.get(response.data["next"])
+            collected.extend(item["id"] for item in response.data["results"])
+        self.assertEqual(collected, expected_ids)
+
+        response = self.client.get(response.data["previous"])
+        self.assertEqual([item["id"] for item in response.data["results"]], expected_ids[2:4])
+
+    def test_unread_count_tracks_create_read_delete_restore(self):
+        notifications = self.create_notifications(3)
+        self.create_notifications(1, is_read=True)
+        self.assertEqual(self.unread_count(), 4 - 1)
+
+        # 캐시된 카운터 조회는 DB를 읽지 않음
+        with self.assertNumQueries(0):
+            self.assertEqual(self.unread_count(), 3)
+
+        self.create_notifications(1)
+        self.assertEqual(self.unread_count(), 4)
+
+        url = reverse("notification-mark-read", kwargs={"pk": notifications[0].pk})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url)
+            self.client.patch(url)
+        self.assertEqual(self.unread_count(), 3)
+
+        url = reverse("notification-detail", kwargs={"pk": notifications[1].pk})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(url)
+        self.assertEqual(self.unread_count(), 2)
+
+        url = reverse("notification-restore", kwargs={"pk": notifications[1].pk})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url)
+        self.assertEqual(self.unread_count(), 3)
+
+        url = reverse("notification-detail", kwargs={"pk": notifications[2].pk})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url, {"is_read": True}, format="json")
+        self.assertEqual(self.unread_count(), 2)
+
+    def test_bulk_mark_read(self):
+        notifications = self.create_notifications(5)
+        other_user = User.objects.create_user(
+            email="bulk-other@example.com", password="othertest123", name="Other"
+        )
+        other = Notification.objects.create(user=other_user, message="다른 유저 알림")
+        self.assertEqual(self.unread_count(), 5)
+        url = reverse("notification-bulk-mark-read")
+
+        # id 목록 (다른 사용자 알림은 무시)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                url, {"ids": [notifications[0].id, other.id]}, format="json"
+            )
+        self.assertEqual(response.data, {"updated": 1})
+        self.assertEqual(self.unread_count(), 4)
+
+        # up_to_id: 이미 읽은 알림은 다시 세지 않음
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {"up_to_id": notifications[2].id}, format="json")
+        self.assertEqual(response.data, {"updated": 2})
+        self.assertEqual(self.unread_count(), 2)
+
+        # 조건 없으면 전체, UPDATE 1번
+        with self.captureOnCommitCallbacks(execute=True), self.assertNumQueries(1):
+            response = self.client.post(url, {}, format="json")
+        self.assertEqual(response.data, {"updated": 2})
+        self.assertEqual(self.unread_count(), 0)
+        other.refresh_from_db()
+        self.assertFalse(other.is_read)
+
+    def test_bulk_delete(self):
+        notifications = self.create_notifications(4)
+        self.assertEqual(self.unread_count(), 4)
+        url = reverse("notification-bulk-delete")
+
+        response = self.client.post(url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                url, {"ids": [notifications[0].id, notifications[1].id]}, format="json"
+            )
+        self.assertEqual(response.data, {"deleted": 2})
+        self.assertEqual(self.unread_count(), 2)
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(Notification.all_objects.filter(user=self.user).count(), 4)
+
+
+def process_cache(location):
+    # 프로세스 하나의 default 캐시로 바꿈 (LOCATION이 같으면 Redis처럼 공유, 다르면 프로세스 로컬 메모리)
+    return override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": location,
+            }
+        }
+    )
+
+
+class UnreadCountAcrossProcessesTest(APITestCase):
+    """
+    알림 생성(Celery)과 개수 조회(웹 워커)가 서로 다른 캐시 인스턴스를 쓸 때의 카운터 테스트.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="unread-proc@example.com", password="inboxtest123", name="Inbox User"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def unread_count(self, location):
+        with process_cache(location):
+            return self.client.get(reverse("notification-unread-count")).data["unread_count"]
+
+    def create_notification(self, location):
+        with process_cache(location), self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.create(user=self.user, message="예산 알림")
+
+    def test_local_memory_cache_counts_directly(self):
+        # 웹 워커 캐시에는 증감이 전달되지 않으므로 카운터 대신 매번 COUNT
+        self.assertEqual(self.unread_count("web-worker"), 0)
+        self.create_notification("celery-worker")
+        self.assertEqual(self.unread_count("web-worker"), 1)
+
+    @override_settings(CACHE_SHARED=True)
+    def test_shared_cache_counter_sees_other_process(self):
+        self.assertEqual(self.unread_count("shared"), 0)
+        self.create_notification("shared")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.unread_count("shared"), 1)
+
+
+class BudgetAlertDedupTest(TestCase):
+    """
+    예산 알림 중복 방지 키 테스트.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="alert@example.com", password="alerttest123", name="Alert User"
+        )
+
+    def send(self, rule_id=1):
+        return send_budget_alert(
+            user_id=self.user.id,
+            budget_id=10,
+            budget_name="1월 예산",
+            rule_id=rule_id,
+            spent=Decimal("850.00"),
+            budget_limit=Decimal("1000.00"),
+            threshold_type=ThresholdType.PERCENT,
+            threshold_value=Decimal("80.00"),
+        )
+
+    def test_same_rule_in_window_is_sent_once(self):
+        notification = self.send()
+        self.assertEqual(
+            notification.message,
+            "'1월 예산' 예산 지출이 80%에 도달했습니다. (지출 850원 / 한도 1,000원)",
+        )
+        self.assertIsNone(self.send())
+        self.assertIsNotNone(self.send(rule_id=2))
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 2)
+
+    def test_existing_key_blocks_insert(self):
+        # 다른 워커가 먼저 저장한 상황: 유니크 인덱스 충돌로 걸러짐
+        Notification.objects.create(
+            user=self.user,
+            message="먼저 저장된 알림",
+            dedup_key=budget_alert_dedup_key(self.user.id, 10, 1),
+        )
+        self.assertIsNone(self.send())
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+
+    def test_window_slides_across_bucket_boundary(self):
+        # 5분 구간 경계 10초 전/50초 후에 보낸 알림: dedup_key는 다르지만 마지막 전송 후 5분 안이라 막힘
+        boundary = timezone.make_aware(datetime(2026, 1, 15, 12, 5))
+        before, after = boundary - timedelta(seconds=10), boundary + timedelta(seconds=50)
+        self.assertNotEqual(
+            budget_alert_dedup_key(self.user.id, 10, 1, now=before),
+            budget_alert_dedup_key(self.user.id, 10, 1, now=after),
+        )
+        with mock.patch("apps.notification.services.timezone.now", return_value=before):
+            self.assertIsNotNone(self.send())
+        with mock.patch("apps.notification.services.timezone.now", return_value=after):
+            self.assertIsNone(self.send())
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+
+    def test_same_bucket_blocked_without_shared_cache(self):
+        # 다른 프로세스(캐시 표시 없음)에서 같은 구간에 다시 보내도 유니크 인덱스가 막음
+        now = timezone.make_aware(datetime(2026, 1, 15, 12, 1))
+        with mock.patch("apps.notification.services.timezone.now", return_value=now):
+            self.assertIsNotNone(self.send())
+            cache.clear()
+            self.assertIsNone(self.send())
+        self.assertEqual(Notification.objects.filter(user=self.user).count(), 1)
+
+    @override_settings(BUDGET_ALERT_DEDUP_MINUTES=0)
+    def test_dedup_disabled(self):
+        self.assertIsNotNone(self.send())
+        self.assertIsNotNone(self.send())
+
+
+@override_settings(NOTIFICATION_STREAM_HEARTBEAT_SECONDS=0.05, NOTIFICATION_STREAM_MAX_SECONDS=0)
+class NotificationStreamTest(TestCase):
+    """
+    실시간 알림 스트림(SSE) 테스트.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="stream@example.com", password="streamtest123", name="Stream User"
+        )
+        self.auth = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+        self.url = reverse("notification-stream")
+
+    def create_notification(self, message):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Notification.objects.create(user=self.user, message=message)
+
+    async def next_chunk(self, stream):
+        return (await asyncio.wait_for(anext(stream), timeout=5)).decode()
+
+    async def next_event(self, stream):
+        # heartbeat 주석 줄은 건너뜀
+        while (chunk := await self.next_chunk(stream)).startswith(":"):
+            pass
+        return chunk
+
+    async def test_stream_delivers_new_notification_and_heartbeat(self):
+        response = await self.async_client.get(self.url, headers=self.auth)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content
+        self.assertEqual(await self.next_chunk(stream), "retry: 3000\n\n")
+        self.assertEqual(await self.next_chunk(stream), ": ping\n\n")
+        self.assertEqual(hub.connection_count(), 1)
+
+        notification = await sync_to_async(self.create_notification)("분석 완료")
+        event = await self.next_event(stream)
+        self.assertTrue(event.startswith(f"id: {notification.id}\nevent: notification\n"))
+        self.assertIn('"message":"분석 완료"', event)
+
+        # 클라이언트가 끊으면(ASGI가 응답 태스크를 취소) 구독이 정리됨
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertEqual(hub.connection_count(), 0)
+
+    async def test_last_event_id_replays_missed_notifications(self):
+        first = await sync_to_async(self.create_notification)("첫 알림")
+        second = await sync_to_async(self.create_notification)("둘째 알림")
+        third = await sync_to_async(self.create_notification)("셋째 알림")
+
+        response = await self.async_client.get(
+            self.url, headers={**self.auth, "Last-Event-ID": str(first.id)}
+        )
+        stream = response.streaming_content
+        await self.next_chunk(stream)
+        self.assertTrue((await self.next_event(stream)).startswith(f"id: {second.id}\n"))
+        self.assertTrue((await self.next_event(stream)).startswith(f"id: {third.id}\n"))
+        await stream.aclose()
+
+        with override_settings(NOTIFICATION_STREAM_REPLAY_LIMIT=1):
+            response = await self.async_client.get(
+                self.url, headers={**self.auth, "Last-Event-ID": str(first.id)}
+            )
+            stream = response.streaming_content
+            await self.next_chunk(stream)
+            self.assertEqual(await self.next_event(stream), "event: resync\ndata: {}\n\n")
+            await stream.aclose()
+
+    @override_settings(NOTIFICATION_STREAM_QUEUE_SIZE=1)
+    async def test_slow_client_gets_resync_when_queue_is_full(self):
+        response = await self.async_client.get(self.url, headers=self.auth)
+        stream = response.streaming_content
+        await self.next_chunk(stream)
+        await sync_to_async(self.create_notification)("하나")
+        await sync_to_async(self.create_notification)("둘")
+        await asyncio.sleep(0)
+
+        # 큐가 넘치면 남은 알림 대신 resync를 보내고 종료 (클라이언트는 목록을 다시 조회)
+        self.assertEqual(await self.next_event(stream), "event: resync\ndata: {}\n\n")
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertEqual(hub.connection_count(), 0)
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_wsgi_returns_missed_notifications_and_closes(self):
+        first = self.create_notification("첫 알림")
+        second = self.create_notification("둘째 알림")
+        response = self.client.get(self.url, headers={**self.auth, "Last-Event-ID": str(first.id)})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        self.assertTrue(body.startswith("retry: 3000\n\n"))
+        self.assertIn(f"id: {second.id}\n", body)
+        self.assertNotIn(f"id: {first.id}\n", body)
@@ -12,6 +12,16 @@ urlpatterns = [
         views.UnreadNotificationListView.as_view(),
         name="notification-unread-list",
     ),
+    path(
+        "unread-count/",
+        views.UnreadNotificationCountView.as_view(),
+        name="notification-unread-count",
+    ),
+    path(
+        "stream/",
+        views.notification_stream,
+        name="notification-stream",
+    ),
     path(
         "<int:pk>/read/",
         views.NotificationMarkReadView.as_view(),
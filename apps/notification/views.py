@@ -1,15 +1,38 @@
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import generics, status, viewsets
+from rest_framework import exceptions, generics, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.auth import OptionalBearerJWTAuthentication
 from apps.trashcan.services import TrashService
 
 from .models import Notification
-from .serializers import NotificationSerializer
+from .pagination import NotificationCursorPagination
+from .serializers import (
+    NotificationBulkDeleteSerializer,
+    NotificationBulkSelectSerializer,
+    NotificationSerializer,
+)
+from .services import (
+    adjust_unread_count,
+    bulk_mark_read,
+    bulk_soft_delete,
+    get_unread_count,
+    mark_read,
+    reset_unread_count,
+)
+from .stream import RETRY_MS, event_stream, format_event
 
 
 class NotificationViewSet(viewsets.ModelViewSet):
@@ -23,12 +46,18 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     serializer_class = NotificationSerializer
 
+    # 목록 조회는 (created_at, id) 키셋 커서로 페이지 단위 응답
+    pagination_class = NotificationCursorPagination
+
     def get_queryset(self):
         return TrashService.list_alive(Notification, self.request.user.id)
 
     @swagger_auto_schema(
         operation_summary="알림 목록 조회",
-        operation_description="모든 알림을 조회합니다.",
+        operation_description=(
+            "알림을 최신순(created_at, id 내림차순)으로 페이지 단위 조회합니다. "
+            "다음/이전 페이지는 응답의 next/previous URL(cursor)을 사용합니다."
+        ),
         responses={
             200: openapi.Response("알림 목록 조회 성공", NotificationSerializer(many=True)),
             401: "인증 실패",
@@ -108,6 +137,9 @@ class NotificationViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         TrashService.soft_delete(Notification, request.user.id, instance.id)
+        # queryset.update라 시그널이 없으므로 카운터를 직접 줄임
+        if not instance.is_read:
+            adjust_unread_count(request.user.id, -1)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @swagger_auto_schema(
@@ -138,9 +170,64 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["post"], url_path="restore")
     def restore(self, request, *args, **kwargs):
         instance = TrashService.restore(Notification, request.user.id, kwargs.get("pk"))
+        reset_unread_count(request.user.id)
         serializer = NotificationSerializer(instance, context={"request": request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @swagger_auto_schema(
+        operation_summary="알림 일괄 읽음 처리",
+        operation_description=(
+            "ids(알림 id 목록)와 up_to_id(이 id 이하) 조건에 맞는 읽지 않은 알림을 한 번에 읽음 처리합니다. "
+            "조건이 없으면 모든 알림을 읽음 처리합니다."
+        ),
+        request_body=NotificationBulkSelectSerializer,
+        responses={
+            200: openapi.Response(
+                "알림 일괄 읽음 처리 성공",
+                openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={"updated": openapi.Schema(type=openapi.TYPE_INTEGER)},
+                ),
+            ),
+            400: "유효성 검증 실패",
+            401: "인증 실패",
+        },
+        tags=["알림 관리"],
+    )
+    @action(detail=False, methods=["post"], url_path="mark-read", url_name="bulk-mark-read")
+    def mark_read_many(self, request, *args, **kwargs):
+        serializer = NotificationBulkSelectSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated = bulk_mark_read(request.user.id, **serializer.validated_data)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="알림 일괄 삭제",
+        operation_description=(
+            "ids(알림 id 목록)와 up_to_id(이 id 이하) 조건에 맞는 알림을 한 번에 휴지통으로 이동합니다. "
+            "조건은 하나 이상 필요합니다."
+        ),
+        request_body=NotificationBulkDeleteSerializer,
+        responses={
+            200: openapi.Response(
+                "알림 일괄 삭제 성공",
+                openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={"deleted": openapi.Schema(type=openapi.TYPE_INTEGER)},
+                ),
+            ),
+            400: "유효성 검증 실패",
+            401: "인증 실패",
+        },
+        tags=["알림 관리"],
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-delete", url_name="bulk-delete")
+    def destroy_many(self, request, *args, **kwargs):
+        serializer = NotificationBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        deleted = bulk_soft_delete(request.user.id, **serializer.validated_data)
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
 
 class UnreadNotificationListView(generics.ListAPIView):
     """
@@ -152,6 +239,7 @@ class UnreadNotificationListView(generics.ListAPIView):
     """
 
     serializer_class = NotificationSerializer
+    pagination_class = NotificationCursorPagination
 
     def get_queryset(self):
         return Notification.objects.filter(
@@ -162,7 +250,10 @@ class UnreadNotificationListView(generics.ListAPIView):
 
     @swagger_auto_schema(
         operation_summary="읽지 않은 알림 목록 조회",
-        operation_description="사용자의 읽지 않은 알림만 조회합니다.",
+        operation_description=(
+            "사용자의 읽지 않은 알림만 최신순으로 페이지 단위 조회합니다. "
+            "개수만 필요하면 unread-count를 사용하세요."
+        ),
         responses={
             200: openapi.Response(
                 "읽지 않은 알림 목록 조회 성공", NotificationSerializer(many=True)
@@ -175,6 +266,36 @@ class UnreadNotificationListView(generics.ListAPIView):
         return super().get(request, *args, **kwargs)
 
 
+class UnreadNotificationCountView(APIView):
+    """
+    읽지 않은 알림 개수 조회 API
+
+    사용자별 카운터를 캐시에서 읽기 때문에 폴링해도 알림 테이블을 조회하지 않습니다.
+
+    인증: JWT Bearer 토큰 필요
+    """
+
+    @swagger_auto_schema(
+        operation_summary="읽지 않은 알림 개수 조회",
+        operation_description="사용자의 읽지 않은 알림 개수를 조회합니다.",
+        responses={
+            200: openapi.Response(
+                "읽지 않은 알림 개수 조회 성공",
+                openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={"unread_count": openapi.Schema(type=openapi.TYPE_INTEGER)},
+                ),
+            ),
+            401: "인증 실패",
+        },
+        tags=["알림 관리"],
+    )
+    def get(self, request):
+        return Response(
+            {"unread_count": get_unread_count(request.user.id)}, status=status.HTTP_200_OK
+        )
+
+
 class NotificationMarkReadView(APIView):
     """
     알림 읽음 처리 API
@@ -201,7 +322,82 @@ class NotificationMarkReadView(APIView):
             user=request.user,
             deleted_at__isnull=True,
         )
-        notification.is_read = True
-        notification.save(update_fields=["is_read"])
+        mark_read(notification)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+def _release_connection():
+    # 스트림이 열려 있는 동안 DB 연결(풀 슬롯)을 붙잡지 않도록 반환 (테스트 트랜잭션 안에서는 유지)
+    if not connection.in_atomic_block:
+        connection.close()
+
+
+def _authenticate(request):
+    try:
+        result = OptionalBearerJWTAuthentication().authenticate(request)
+    except exceptions.AuthenticationFailed:
+        result = None
+    finally:
+        _release_connection()
+    return result[0] if result else None
+
+
+def _replay(user_id, last_event_id):
+    """
+    Last-Event-ID 이후 밀린 알림 (최대 NOTIFICATION_STREAM_REPLAY_LIMIT건)
+    - 더 많이 밀렸으면 resync=True → 클라이언트가 목록을 다시 조회
+    """
+    limit = settings.NOTIFICATION_STREAM_REPLAY_LIMIT
+    try:
+        qs = Notification.objects.filter(user_id=user_id, id__gt=last_event_id).order_by("id")
+        rows = list(qs[: limit + 1])
+        return NotificationSerializer(rows[:limit], many=True).data, len(rows) > limit
+    finally:
+        _release_connection()
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    실시간 알림 스트림 API (SSE)
+
+    GET /api/notifications/stream/ 으로 연결하면 새 알림을 event: notification 으로 보냅니다.
+    Last-Event-ID 헤더(또는 last_event_id 쿼리)를 보내면 그 이후 밀린 알림부터 보냅니다.
+
+    - ASGI(SERVER_MODE=asgi)에서만 연결을 유지합니다. WSGI에서는 밀린 알림만 보내고 바로 닫으므로
+      EventSource의 재접속(retry) 간격으로 폴링하는 것과 같습니다.
+    - 인증: JWT Bearer 토큰 필요 (EventSource는 헤더를 못 보내므로 fetch 스트림 사용)
+    """
+    user = await sync_to_async(_authenticate)(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": str(exceptions.NotAuthenticated.default_detail)},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+
+    raw_last_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    last_event_id = int(raw_last_id) if raw_last_id and raw_last_id.isdigit() else None
+
+    if not isinstance(request, ASGIRequest):
+        replay, resync = [], False
+        if last_event_id is not None:
+            replay, resync = await sync_to_async(_replay)(user.id, last_event_id)
+        body = f"retry: {RETRY_MS}\n\n".encode()
+        if resync:
+            body += format_event({}, event="resync")
+        body += b"".join(format_event(data, event_id=data["id"]) for data in replay)
+        response = HttpResponse(body, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    load_replay = None
+    if last_event_id is not None:
+        load_replay = partial(sync_to_async(_replay), user.id, last_event_id)
+    response = StreamingHttpResponse(
+        event_stream(user.id, load_replay), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    # nginx 등 프록시가 응답을 모아 두지 않도록 함
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from apps.utils.serialization import FastReadSerializer
+
 from .models import Tag
 
 
@@ -14,3 +16,9 @@ class TagReadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = ["id", "name", "color", "created_at"]
+
+
+# 목록 응답용 빠른 직렬화 (TagReadSerializer와 같은 JSON)
+class TagFastReadSerializer(FastReadSerializer):
+    model = Tag
+    fields = TagReadSerializer.Meta.fields
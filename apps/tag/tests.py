@@ -1 +1,32 @@
-# Create your tests here.
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.members.models import User
+
+from .models import Tag
+from .serializers import TagReadSerializer
+
+
+# 태그 목록 API를 검증하는 테스트 클래스
+class TagListTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="tag@example.com",
+            password="testpass123",
+            name="Tag User",
+        )
+        self.client.force_authenticate(self.user)
+
+    # 빠른 목록 직렬화가 TagReadSerializer와 같은 JSON을 만들고 휴지통 태그는 빠지는지 확인
+    def test_list_matches_read_serializer(self):
+        Tag.objects.create(user=self.user, name="고정지출", color="#3366FF")
+        Tag.objects.create(user=self.user, name="식비")
+        Tag.objects.create(user=self.user, name="삭제됨", deleted_at=timezone.now())
+
+        response = self.client.get("/api/tags/")
+        self.assertEqual(response.status_code, 200)
+        expected = TagReadSerializer(
+            Tag.objects.filter(user=self.user, deleted_at__isnull=True).order_by("name"),
+            many=True,
+        ).data
+        self.assertEqual(response.json(), expected)
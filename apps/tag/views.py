@@ -5,12 +5,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.core.response_cache import cached_response
 from apps.trashcan.services import TrashService
 from apps.trashcan.views import RestoreAPIView, TrashListAPIView
 
 from .models import Tag
 from .repositories import TagRepository
-from .serializers import TagCreateUpdateSerializer, TagReadSerializer
+from .serializers import TagCreateUpdateSerializer, TagFastReadSerializer, TagReadSerializer
 
 
 class TagListCreateView(APIView):
@@ -55,9 +56,10 @@ class TagListCreateView(APIView):
         },
         tags=["태그 관리"],
     )
+    @cached_response("tag")
     def get(self, request):
         qs = TagRepository.list_alive(request.user.id)
-        return Response(TagReadSerializer(qs, many=True).data)
+        return Response(TagFastReadSerializer.serialize(qs))
 
     @swagger_auto_schema(
         operation_summary="태그 생성",
@@ -179,6 +181,7 @@ class TagTrashListView(TrashListAPIView):
 
 class TagRestoreView(RestoreAPIView):
     model = Tag
+    lookup_url_kwarg = "tag_id"
 
     @swagger_auto_schema(
         operation_summary="태그 복원",
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TransactionConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.transaction"
+
+    def ready(self):
+        from . import signals  # noqa: F401
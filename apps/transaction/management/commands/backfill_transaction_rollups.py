@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.transaction.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "일별 거래 집계(TransactionDailyRollup)를 거래 원본으로 다시 계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="특정 사용자 집계만 재계산")
+        parser.add_argument("--account-id", type=int, help="특정 계좌 집계만 재계산")
+
+    def handle(self, *args, **options):
+        created = rebuild_rollups(
+            user_id=options.get("user_id"), account_id=options.get("account_id")
+        )
+        self.stdout.write(self.style.SUCCESS(f"일별 집계 {created}건 생성"))
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.analysis.analyzers import Analyzer
+from apps.budget.models import Budget, BudgetScopeType
+from apps.budget.services import build_spent_queryset
+from apps.members.models import User
+from apps.transaction.models import Transaction
+from apps.transaction.pagination import TransactionCursorPagination
+from apps.transaction.repositories import TransactionRepository
+
+
+class Command(BaseCommand):
+    help = "거래 핫 쿼리들의 EXPLAIN ANALYZE 실행 계획 출력 (인덱스 사용 여부 확인용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="조회 대상 사용자 ID (기본: 첫 사용자)")
+        parser.add_argument("--days", type=int, default=30, help="조회 기간 일수 (기본 30일)")
+
+    def handle(self, *args, **options):
+        user = self._get_user(options.get("user_id"))
+        end_date = timezone.localdate()
+        start_date = end_date - timedelta(days=options["days"])
+
+        self.stdout.write(f"user={user.id} period={start_date}~{end_date}")
+
+        for title, queryset in self._hot_queries(user, start_date, end_date):
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n== {title}"))
+            self.stdout.write(queryset.explain(analyze=True, buffers=True))
+
+    def _get_user(self, user_id):
+        qs = User.objects.order_by("id")
+        user = qs.filter(id=user_id).first() if user_id else qs.first()
+        if user is None:
+            raise CommandError("대상 사용자가 없습니다.")
+        return user
+
+    def _hot_queries(self, user, start_date, end_date):
+        page_size = TransactionCursorPagination.page_size
+
+        # 1) 거래 목록 첫 페이지 (키셋 페이지네이션)
+        yield (
+            "GET /api/transactions/ (first page)",
+            Transaction.objects.filter(account__user=user).order_by(
+                *TransactionCursorPagination.ordering
+            )[: page_size + 1],
+        )
+
+        # 2) 분석 대상 기간 거래 조회
+        yield (
+            "Analyzer.get_transactions_in_period",
+            Analyzer(user).get_transactions_in_period(start_date, end_date),
+        )
+
+        # 3) 예산 지출 합계 (ALL scope 기준)
+        budget = Budget(
+            user=user,
+            period_start=start_date,
+            period_end=end_date,
+            amount_limit=0,
+            scope_type=BudgetScopeType.ALL,
+        )
+        yield (
+            "calculate_spent_for_budget",
+            build_spent_queryset(budget).values("direction").annotate(total=Sum("amount")),
+        )
+
+        # 4) 일별 요약
+        yield (
+            "TransactionRepository.get_daily_summary",
+            TransactionRepository.get_daily_summary(user, start_date, end_date),
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("transaction", "0003_transaction_deleted_at_transaction_deleted_by"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(fields=["account", "occurred_at"], name="tx_account_occurred_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["account", "direction", "occurred_at"],
+                name="tx_alive_acct_dir_occ_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["account", "-occurred_at", "-id"],
+                name="tx_alive_acct_occ_id_idx",
+            ),
+        ),
+    ]
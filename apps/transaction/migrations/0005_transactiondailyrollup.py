@@ -0,0 +1,108 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    # 기존 거래(휴지통 제외)로 일별 집계를 채움
+    Transaction = apps.get_model("transaction", "Transaction")
+    TransactionDailyRollup = apps.get_model("transaction", "TransactionDailyRollup")
+
+    grouped = (
+        Transaction.objects.filter(deleted_at__isnull=True)
+        .annotate(day=TruncDate("occurred_at"))
+        .values("account__user_id", "account_id", "day", "direction")
+        .annotate(
+            row_count=Count("id"),
+            row_total=Sum("amount"),
+            row_min=Min("amount"),
+            row_max=Max("amount"),
+        )
+        .order_by()
+    )
+    batch = []
+    for row in grouped.iterator(chunk_size=1000):
+        batch.append(
+            TransactionDailyRollup(
+                user_id=row["account__user_id"],
+                account_id=row["account_id"],
+                date=row["day"],
+                direction=row["direction"],
+                count=row["row_count"],
+                total=row["row_total"],
+                min_amount=row["row_min"],
+                max_amount=row["row_max"],
+            )
+        )
+        if len(batch) >= 1000:
+            TransactionDailyRollup.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        TransactionDailyRollup.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bank_account", "0001_initial"),
+        ("transaction", "0004_transaction_range_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "direction",
+                    models.CharField(
+                        choices=[
+                            ("income", "Income"),
+                            ("expense", "Expense"),
+                            ("transfer", "Transfer"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("total", models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ("min_amount", models.DecimalField(decimal_places=2, max_digits=14, null=True)),
+                ("max_amount", models.DecimalField(decimal_places=2, max_digits=14, null=True)),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="bank_account.account",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["user", "date"], name="tx_rollup_user_date_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "date", "direction"), name="tx_rollup_acct_date_dir_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
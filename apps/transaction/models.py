@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 
 from apps.bank_account.models import Account
@@ -33,5 +34,57 @@ class Transaction(TrashableModel):
     objects = SoftDeleteManager()
     all_objects = models.Manager()
 
+    class Meta:
+        indexes = [
+            # 휴지통 포함 계좌별 기간 조회 (trash, all_objects)
+            models.Index(fields=["account", "occurred_at"], name="tx_account_occurred_idx"),
+            # 살아있는 거래의 방향별 기간 조회 (예산 지출 합계, 분석)
+            models.Index(
+                fields=["account", "direction", "occurred_at"],
+                name="tx_alive_acct_dir_occ_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 살아있는 거래 최신순 목록 (키셋 페이지네이션)
+            models.Index(
+                fields=["account", "-occurred_at", "-id"],
+                name="tx_alive_acct_occ_id_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.account.name} - {self.amount} ({self.direction})"
+
+
+class TransactionDailyRollup(models.Model):
+    """
+    계좌별 일별 거래 집계(materialized)
+    - (계좌, 날짜, 방향)당 1행: 건수/합계/최소/최대 금액
+    - 살아있는(휴지통이 아닌) 거래만 반영, 생성/수정/삭제/복구 시 같은 DB 트랜잭션 안에서 증분 갱신
+    - 날짜는 TIME_ZONE 기준 로컬 날짜 (TruncDate와 동일)
+    - 어긋나면 backfill_transaction_rollups 명령으로 재계산
+    """
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name="daily_rollups")
+    date = models.DateField()
+    direction = models.CharField(max_length=10, choices=Transaction.DIRECTION_CHOICES)
+
+    count = models.PositiveIntegerField(default=0)
+    total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    min_amount = models.DecimalField(max_digits=14, decimal_places=2, null=True)
+    max_amount = models.DecimalField(max_digits=14, decimal_places=2, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "date", "direction"], name="tx_rollup_acct_date_dir_uniq"
+            ),
+        ]
+        indexes = [
+            # 사용자 단위 기간 요약 (대시보드, 분석, 배치 대상 선별)
+            models.Index(fields=["user", "date"], name="tx_rollup_user_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.account_id} {self.date} {self.direction}: {self.count}건 {self.total}"
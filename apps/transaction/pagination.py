@@ -0,0 +1,14 @@
+from apps.common.pagination import KeysetCursorPagination
+
+
+class TransactionCursorPagination(KeysetCursorPagination):
+    """
+    거래 목록용 키셋(커서) 페이지네이션
+
+    - (occurred_at, id) 복합 키 기준 최신순 정렬
+    - 커서 처리는 KeysetCursorPagination 참고
+    """
+
+    page_size = 50
+    max_page_size = 200
+    ordering = ("-occurred_at", "-id")
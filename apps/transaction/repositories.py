@@ -1,19 +1,47 @@
 from decimal import Decimal
 
-from django.db.models import Avg, Count, Max, Min, Q, Sum
-from django.db.models.functions import TruncDate, TruncMonth
+from django.db.models import (
+    Avg,
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    Max,
+    Min,
+    Prefetch,
+    Q,
+    Sum,
+)
+from django.db.models.functions import TruncMonth, TruncYear
 
-from .models import Transaction
+from apps.tag.models import Tag
+from apps.utils.dates import local_day_range, to_date
+
+from .models import Transaction, TransactionDailyRollup
 
 
 class TransactionRepository:
     # Transaction 모델에 대한 쿼리 최적화 패턴을 적용한 Repository
 
     @staticmethod
-    def get_transactions_optimized(user):
-        # select_related를 사용하여 연관된 account와 user를 한 번에 조회
-        return Transaction.objects.select_related("account", "account__user").filter(
-            account__user=user
+    def prefetch_tags():
+        # 응답용 태그 Prefetch: 휴지통에 없는 태그만, TagReadSerializer가 쓰는 컬럼만 조회
+        # 거래 목록 전체의 태그를 쿼리 1번으로 가져와서 거래별 N+1 조회를 없앰
+        return Prefetch(
+            "tags",
+            queryset=Tag.objects.filter(deleted_at__isnull=True)
+            .only("id", "name", "color", "created_at")
+            .order_by("id"),
+        )
+
+    @staticmethod
+    def get_transactions_optimized(user, include_deleted=False):
+        # select_related로 계좌(account_name)를, prefetch로 태그를 한 번에 조회
+        # include_deleted: 휴지통 거래까지 포함 (기본 매니저는 살아있는 거래만 반환)
+        manager = Transaction.all_objects if include_deleted else Transaction.objects
+        return (
+            manager.select_related("account")
+            .prefetch_related(TransactionRepository.prefetch_tags())
+            .filter(account__user=user)
         )
 
     @staticmethod
@@ -35,46 +63,115 @@ class TransactionRepository:
         )
 
     @staticmethod
-    def get_daily_summary(user, start_date=None, end_date=None):
-        # annotate + TruncDate를 사용하여 일별 거래 요약 조회
-        qs = Transaction.objects.filter(account__user=user)
-
+    def _rollups_in_period(user, start_date=None, end_date=None):
+        # 일별 집계 테이블 기간 필터 (date 컬럼이라 날짜 그대로 비교)
+        qs = TransactionDailyRollup.objects.filter(user=user)
         if start_date:
-            qs = qs.filter(occurred_at__gte=start_date)
+            qs = qs.filter(date__gte=to_date(start_date))
         if end_date:
-            qs = qs.filter(occurred_at__lte=end_date)
+            qs = qs.filter(date__lte=to_date(end_date))
+        return qs
 
+    @staticmethod
+    def _summarize_rollups(qs, key):
+        # 일별 집계 row를 key(날짜/월/연) 단위로 다시 합침 (원본 거래 대신 수백 row만 읽음)
+        # 반환 row: {key: date, total_count, total_income, total_expense, avg_amount(=합계/건수)}
         return (
-            qs.annotate(date=TruncDate("occurred_at"))
-            .values("date")
+            qs.values(key)
             .annotate(
-                total_count=Count("id"),
-                total_income=Sum("amount", filter=Q(direction="income"), default=Decimal("0")),
-                total_expense=Sum("amount", filter=Q(direction="expense"), default=Decimal("0")),
-                avg_amount=Avg("amount"),
+                total_count=Sum("count"),
+                total_income=Sum("total", filter=Q(direction="income"), default=Decimal("0")),
+                total_expense=Sum("total", filter=Q(direction="expense"), default=Decimal("0")),
+                avg_amount=ExpressionWrapper(
+                    Sum("total") / Sum("count"),
+                    output_field=DecimalField(max_digits=16, decimal_places=2),
+                ),
             )
+            .order_by(key)
+        )
+
+    @staticmethod
+    def get_daily_summary(user, start_date=None, end_date=None):
+        # 일별 거래 요약: 일별 집계 테이블(TransactionDailyRollup)에서 조회
+        qs = TransactionRepository._rollups_in_period(user, start_date, end_date)
+        return TransactionRepository._summarize_rollups(qs, "date")
+
+    @staticmethod
+    def _filter_period(qs, start_date=None, end_date=None):
+        # 날짜 구간은 반열린 datetime 구간 [start, end)로 변환해서 인덱스 range scan
+        period_start, period_end = local_day_range(start_date, end_date)
+        if period_start:
+            qs = qs.filter(occurred_at__gte=period_start)
+        if period_end:
+            qs = qs.filter(occurred_at__lt=period_end)
+        return qs
+
+    @staticmethod
+    def get_daily_totals(user, direction, start_date=None, end_date=None):
+        # 방향(수입/지출)별 일별 합계 (분석 차트용, 일별 집계 테이블에서 조회)
+        qs = TransactionRepository._rollups_in_period(user, start_date, end_date)
+        return (
+            qs.filter(direction=direction)
+            .values("date")
+            .annotate(amount=Sum("total"))
             .order_by("date")
         )
 
     @staticmethod
-    def get_monthly_summary(user, year=None):
-        # annotate + TruncMonth를 사용하여 월별 거래 요약 조회
-        qs = Transaction.objects.filter(account__user=user)
+    def get_method_totals(user, direction, start_date=None, end_date=None):
+        # 결제수단(method)별 합계: GROUP BY method
+        qs = TransactionRepository._filter_period(
+            Transaction.objects.filter(account__user=user, direction=direction),
+            start_date,
+            end_date,
+        )
+        return qs.values("method").annotate(amount=Sum("amount")).order_by("method")
 
-        if year:
-            qs = qs.filter(occurred_at__year=year)
+    @staticmethod
+    def get_latest_balances(user, start_date=None, end_date=None):
+        # 계좌별 기간 내 마지막 거래의 잔액: DISTINCT ON (account_id) (PostgreSQL 전용)
+        qs = TransactionRepository._filter_period(
+            Transaction.objects.filter(account__user=user), start_date, end_date
+        )
+        return (
+            qs.order_by("account_id", "-occurred_at", "-id")
+            .distinct("account_id")
+            .values("account_id", "account__name", "balance_after")
+        )
 
+    @staticmethod
+    def get_active_user_counts(start_date=None, end_date=None):
+        # 기간 내 거래가 있는 사용자별 거래 수: 일별 집계 테이블 한 번의 GROUP BY (배치 분석 대상 선별용)
+        qs = TransactionDailyRollup.objects.all()
+        if start_date:
+            qs = qs.filter(date__gte=to_date(start_date))
+        if end_date:
+            qs = qs.filter(date__lte=to_date(end_date))
         return (
-            qs.annotate(month=TruncMonth("occurred_at"))
-            .values("month")
-            .annotate(
-                total_count=Count("id"),
-                total_income=Sum("amount", filter=Q(direction="income"), default=Decimal("0")),
-                total_expense=Sum("amount", filter=Q(direction="expense"), default=Decimal("0")),
-            )
-            .order_by("month")
+            qs.values("user_id")
+            .annotate(total_count=Sum("count"))
+            .order_by("user_id")
+            .values_list("user_id", "total_count")
         )
 
+    @staticmethod
+    def get_monthly_summary(user, year=None):
+        # 월별 거래 요약: 일별 집계를 월 단위로 합침
+        # month는 해당 월 1일 date (원본 거래를 TruncMonth하던 때의 현지 자정 datetime이 아님),
+        # 일/연 요약과 같은 키 구성이라 avg_amount도 포함
+        qs = TransactionDailyRollup.objects.filter(user=user)
+        if year:
+            qs = qs.filter(date__year=year)
+        return TransactionRepository._summarize_rollups(
+            qs.annotate(month=TruncMonth("date")), "month"
+        )
+
+    @staticmethod
+    def get_yearly_summary(user):
+        # 연별 거래 요약: 일별 집계를 연 단위로 합침 (year = 해당 연도 1월 1일 date)
+        qs = TransactionDailyRollup.objects.filter(user=user)
+        return TransactionRepository._summarize_rollups(qs.annotate(year=TruncYear("date")), "year")
+
     @staticmethod
     def get_account_statistics(user, account_id):
         # aggregate를 사용하여 특정 계좌의 통계 정보를 한 번에 조회
@@ -0,0 +1,176 @@
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Sum, Value
+from django.db.models.functions import Greatest, Least, TruncDate
+
+from apps.utils.dates import local_day_range, to_date
+
+from .models import Transaction, TransactionDailyRollup
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _rollup_filter(account_id, day, direction):
+    return TransactionDailyRollup.objects.filter(
+        account_id=account_id, date=day, direction=direction
+    )
+
+
+def _add(user_id, account_id, day, direction, total, count=1, min_amount=None, max_amount=None):
+    # 기본은 거래 1건, 일괄 등록에서는 같은 (계좌, 날짜, 방향) 묶음의 집계를 한 번에 더함
+    min_amount = total if min_amount is None else min_amount
+    max_amount = total if max_amount is None else max_amount
+    qs = _rollup_filter(account_id, day, direction)
+    updates = {
+        "count": F("count") + count,
+        "total": F("total") + total,
+        "min_amount": Least(F("min_amount"), Value(min_amount)),
+        "max_amount": Greatest(F("max_amount"), Value(max_amount)),
+    }
+    if qs.update(**updates):
+        return
+
+    try:
+        # 그날 첫 거래: row 생성 (동시에 생성되면 unique 충돌 → 다시 UPDATE)
+        with transaction.atomic():
+            TransactionDailyRollup.objects.create(
+                user_id=user_id,
+                account_id=account_id,
+                date=day,
+                direction=direction,
+                count=count,
+                total=total,
+                min_amount=min_amount,
+                max_amount=max_amount,
+            )
+    except IntegrityError:
+        qs.update(**updates)
+
+
+def _remove(account_id, day, direction, amount):
+    qs = _rollup_filter(account_id, day, direction)
+    if not qs.update(count=F("count") - 1, total=F("total") - amount):
+        return
+
+    row = qs.first()
+    if row.count <= 0:
+        row.delete()
+        return
+
+    # 최소/최대는 빼기로 되돌릴 수 없으므로, 경계값이 빠진 경우에만 그날 거래로 다시 계산
+    if amount <= row.min_amount or amount >= row.max_amount:
+        period_start, period_end = local_day_range(day, day)
+        bounds = Transaction.objects.filter(
+            account_id=account_id,
+            direction=direction,
+            occurred_at__gte=period_start,
+            occurred_at__lt=period_end,
+        ).aggregate(min_amount=Min("amount"), max_amount=Max("amount"))
+        qs.update(**bounds)
+
+
+def apply_rollup_delta(*, user_id, account_id, occurred_at, direction, amount, sign):
+    # 거래 1건을 일별 집계에 더하거나(sign=1) 뺌(sign=-1)
+    day = to_date(occurred_at)
+    amount = Decimal(amount)
+    if sign > 0:
+        _add(user_id, account_id, day, direction, amount)
+    else:
+        _remove(account_id, day, direction, amount)
+
+
+def record_transaction_rollup(tx, sign=1):
+    account = tx.account
+    apply_rollup_delta(
+        user_id=account.user_id,
+        account_id=tx.account_id,
+        occurred_at=tx.occurred_at,
+        direction=tx.direction,
+        amount=tx.amount,
+        sign=sign,
+    )
+
+
+def record_rollup_batch(user_id, transactions):
+    """
+    일괄 등록된 거래들을 일별 집계에 반영 (bulk_create는 post_save 시그널을 보내지 않음)
+    - 메모리에서 (계좌, 날짜, 방향)별로 먼저 묶어서 묶음당 UPDATE 1번
+    - 반영한 묶음 수를 반환
+    """
+    groups = {}
+    for tx in transactions:
+        key = (tx.account_id, to_date(tx.occurred_at), tx.direction)
+        amount = Decimal(tx.amount)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = {"count": 1, "total": amount, "min": amount, "max": amount}
+            continue
+        group["count"] += 1
+        group["total"] += amount
+        group["min"] = min(group["min"], amount)
+        group["max"] = max(group["max"], amount)
+
+    for (account_id, day, direction), group in groups.items():
+        _add(
+            user_id,
+            account_id,
+            day,
+            direction,
+            group["total"],
+            count=group["count"],
+            min_amount=group["min"],
+            max_amount=group["max"],
+        )
+    return len(groups)
+
+
+def rebuild_rollups(user_id=None, account_id=None):
+    """
+    거래 원본에서 일별 집계를 다시 만듦 (대상 범위의 기존 row는 지우고 새로 생성)
+    생성한 row 수를 반환
+    """
+    transactions = Transaction.objects.all()
+    rollups = TransactionDailyRollup.objects.all()
+    if user_id is not None:
+        transactions = transactions.filter(account__user_id=user_id)
+        rollups = rollups.filter(user_id=user_id)
+    if account_id is not None:
+        transactions = transactions.filter(account_id=account_id)
+        rollups = rollups.filter(account_id=account_id)
+
+    grouped = (
+        transactions.annotate(day=TruncDate("occurred_at"))
+        .values("account__user_id", "account_id", "day", "direction")
+        .annotate(
+            row_count=Count("id"),
+            row_total=Sum("amount"),
+            row_min=Min("amount"),
+            row_max=Max("amount"),
+        )
+        .order_by()
+    )
+
+    created = 0
+    with transaction.atomic():
+        rollups.delete()
+        batch = []
+        for row in grouped.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+            batch.append(
+                TransactionDailyRollup(
+                    user_id=row["account__user_id"],
+                    account_id=row["account_id"],
+                    date=row["day"],
+                    direction=row["direction"],
+                    count=row["row_count"],
+                    total=row["row_total"],
+                    min_amount=row["row_min"],
+                    max_amount=row["row_max"],
+                )
+            )
+            if len(batch) >= BACKFILL_BATCH_SIZE:
+                created += len(TransactionDailyRollup.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            created += len(TransactionDailyRollup.objects.bulk_create(batch))
+    return created
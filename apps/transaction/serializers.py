@@ -1,7 +1,8 @@
 from rest_framework import serializers
 
 from apps.tag.models import Tag
-from apps.tag.serializers import TagReadSerializer
+from apps.tag.serializers import TagFastReadSerializer, TagReadSerializer
+from apps.utils.serialization import FastReadSerializer
 
 from .models import Transaction
 
@@ -38,6 +39,37 @@ class TransactionResponseSerializer(serializers.ModelSerializer):
         ]
 
 
+# 거래 목록 응답용 빠른 직렬화 (TransactionResponseSerializer와 같은 JSON)
+# 태그는 페이지의 거래 id로 한 번에 조회해서 채움 (휴지통 태그 제외, prefetch_tags와 같은 기준)
+class TransactionFastReadSerializer(FastReadSerializer):
+    model = Transaction
+    fields = TransactionResponseSerializer.Meta.fields
+    sources = {"account_name": "account__name"}
+    extra_fields = ("tags",)
+
+    @classmethod
+    def tags_by_transaction(cls, transaction_ids):
+        through = Transaction.tags.through.objects.filter(
+            transaction_id__in=transaction_ids, tag__deleted_at__isnull=True
+        ).order_by("tag_id")
+        tag_values = ["transaction_id", *(f"tag__{name}" for name in TagFastReadSerializer.fields)]
+        grouped = {}
+        for row in through.values(*tag_values):
+            tag = {name: row[f"tag__{name}"] for name in TagFastReadSerializer.fields}
+            grouped.setdefault(row["transaction_id"], []).append(tag)
+        return {
+            tx_id: TagFastReadSerializer.serialize_rows(tags) for tx_id, tags in grouped.items()
+        }
+
+    @classmethod
+    def serialize_rows(cls, rows):
+        rows = list(rows)
+        tags = cls.tags_by_transaction([row["id"] for row in rows]) if rows else {}
+        for row in rows:
+            row["tags"] = tags.get(row["id"], [])
+        return super().serialize_rows(rows)
+
+
 # 거래 수정 요청 데이터 스펙 (Request Body)
 class TransactionUpdateRequestSerializer(serializers.Serializer):
     amount = serializers.DecimalField(max_digits=14, decimal_places=2, required=False)
@@ -48,13 +80,41 @@ class TransactionUpdateRequestSerializer(serializers.Serializer):
     tags = serializers.PrimaryKeyRelatedField(queryset=Tag.objects.all(), many=True, required=False)
 
 
+# 거래 일괄 등록 1행 스펙 (JSON 배열의 원소 / CSV 1줄)
+# 계좌/태그는 행마다 조회하지 않도록 id만 받고, 소유 여부는 서비스에서 한 번에 확인
+class TransactionImportRowSerializer(serializers.Serializer):
+    account = serializers.IntegerField()
+    amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    direction = serializers.ChoiceField(choices=Transaction.DIRECTION_CHOICES)
+    method = serializers.CharField(max_length=20)
+    description = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    occurred_at = serializers.DateTimeField()
+    tags = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+
+# 거래 일괄 등록 CSV 업로드 스펙 (multipart/form-data)
+class TransactionImportFileSerializer(serializers.Serializer):
+    file = serializers.FileField(
+        help_text="CSV 헤더: account,amount,direction,method,description,occurred_at,tags "
+        "(tags는 ;로 구분한 태그 id)"
+    )
+
+
+# 거래 일괄 등록 응답 스펙
+class TransactionImportResponseSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    ids = serializers.ListField(child=serializers.IntegerField())
+    evaluated_budgets = serializers.IntegerField()
+
+
 """
 거래 관련 API 엔드포인트 스펙 설명
 
 1. 거래 목록 조회
 GET /api/transactions/
-Query Params: account (선택), direction (선택), start_date (선택), end_date (선택)
-Response Body: TransactionResponseSerializer (리스트)
+Query Params: account (선택), direction (선택), start_date (선택), end_date (선택),
+              cursor (선택), page_size (선택)
+Response Body: {"next", "previous", "results": TransactionResponseSerializer (리스트)}
 Status Code: 200 OK, 401 Unauthorized
 
 2. 거래 생성
@@ -78,4 +138,10 @@ Status Code: 200 OK, 400 Bad Request, 404 Not Found, 401 Unauthorized
 DELETE /api/transactions/{id}/
 Response Body: {"message": "거래 삭제 성공"}
 Status Code: 204 No Content, 404 Not Found, 401 Unauthorized
+
+6. 거래 일괄 등록
+POST /api/transactions/import/
+Request Body: TransactionImportRowSerializer (JSON 배열) 또는 multipart CSV 파일(file)
+Response Body: TransactionImportResponseSerializer
+Status Code: 201 Created, 400 Bad Request, 403 Forbidden, 401 Unauthorized
 """
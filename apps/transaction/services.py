@@ -1,12 +1,24 @@
 from decimal import Decimal
 
+from django.conf import settings
 from django.db import transaction
-from rest_framework.exceptions import PermissionDenied, ValidationError
+from django.utils import timezone
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
 from apps.bank_account.models import Account
+from apps.budget.services import (
+    apply_spend_batch,
+    apply_spend_delta,
+    is_expense,
+    record_transaction_spend,
+    trigger_budget_alerts_for_budgets,
+)
 from apps.tag.models import Tag
 
 from .models import Transaction
+from .rollups import apply_rollup_delta, record_rollup_batch, record_transaction_rollup
+
+IMPORT_BATCH_SIZE = 1000
 
 
 def create_transaction(
@@ -66,3 +78,172 @@ def create_transaction(
 
     # 생성된 Transaction 인스턴스를 반환
     return tx
+
+
+def import_transactions(user, rows):
+    """
+    거래 일괄 등록 (은행 내역 가져오기 등)
+    - rows: 검증된 dict 목록 (account, amount, direction, method, description, occurred_at, tags)
+    - 계좌는 id 순서로 한 번씩만 잠그고, occurred_at 순으로 정렬해 balance_after를 한 번에 계산
+    - 거래/태그 연결은 bulk_create, 일별 집계·예산 카운터는 묶어서 반영
+    - 예산 알림은 영향받은 예산당 한 번만 평가
+    - bulk_create는 post_save 시그널을 보내지 않으므로 시그널 처리분을 여기서 직접 수행
+    """
+    if len(rows) > settings.TRANSACTION_IMPORT_MAX_ROWS:
+        raise ValidationError(
+            f"한 번에 최대 {settings.TRANSACTION_IMPORT_MAX_ROWS}건까지 등록할 수 있습니다"
+        )
+    if not rows:
+        return {"created": 0, "ids": [], "evaluated_budgets": 0}
+
+    account_ids = {row["account"] for row in rows}
+    tag_ids = {tag_id for row in rows for tag_id in row.get("tags") or []}
+
+    with transaction.atomic():
+        # 여러 요청이 같은 계좌들을 잠가도 교착되지 않도록 id 순서로 잠금
+        accounts = {
+            account.id: account
+            for account in Account.objects.select_for_update()
+            .filter(pk__in=account_ids, deleted_at__isnull=True)
+            .order_by("pk")
+        }
+        if len(accounts) != len(account_ids):
+            raise ValidationError("계좌가 없습니다")
+        if any(account.user_id != user.id for account in accounts.values()):
+            raise PermissionDenied("계좌 정보가 일치하지 않습니다")
+
+        if tag_ids and Tag.objects.filter(user_id=user.id, id__in=tag_ids).count() != len(tag_ids):
+            raise ValidationError("태그 정보가 일치하지 않습니다")
+
+        # 발생 시각 순으로 잔액을 누적 (같은 시각은 입력 순서 유지)
+        ordered = sorted(rows, key=lambda row: row["occurred_at"])
+        balances = {account_id: account.balance for account_id, account in accounts.items()}
+        objs = []
+        for row in ordered:
+            amount = Decimal(row["amount"])
+            if row["direction"] == "income":
+                balances[row["account"]] += amount
+            else:
+                balances[row["account"]] -= amount
+            objs.append(
+                Transaction(
+                    account_id=row["account"],
+                    amount=amount,
+                    balance_after=balances[row["account"]],
+                    direction=row["direction"],
+                    method=row["method"],
+                    description=row.get("description") or "",
+                    occurred_at=row["occurred_at"],
+                )
+            )
+        created = Transaction.objects.bulk_create(objs, batch_size=IMPORT_BATCH_SIZE)
+
+        TransactionTag = Transaction.tags.through
+        TransactionTag.objects.bulk_create(
+            (
+                TransactionTag(transaction_id=tx.id, tag_id=tag_id)
+                for tx, row in zip(created, ordered)
+                for tag_id in dict.fromkeys(row.get("tags") or [])
+            ),
+            batch_size=IMPORT_BATCH_SIZE,
+        )
+
+        # 계좌 잔액은 계좌당 한 번만 저장
+        for account_id, account in accounts.items():
+            account.balance = balances[account_id]
+            account.save(update_fields=["balance"])
+
+        record_rollup_batch(user.id, created)
+        budget_ids = apply_spend_batch(
+            user_id=user.id,
+            expenses=[
+                (tx.account_id, tx.occurred_at, tx.amount) for tx in created if is_expense(tx)
+            ],
+        )
+        evaluated = trigger_budget_alerts_for_budgets(user.id, budget_ids)
+
+    return {
+        "created": len(created),
+        "ids": [tx.id for tx in created],
+        "evaluated_budgets": evaluated,
+    }
+
+
+def _lock_user_transaction(user, tx_id, *, deleted):
+    # 거래 row만 잠금(of=self) - account 조인 때문에 계좌 row까지 잠그지 않도록
+    tx = (
+        Transaction.all_objects.select_for_update(of=("self",))
+        .select_related("account")
+        .filter(id=tx_id, account__user=user, deleted_at__isnull=not deleted)
+        .first()
+    )
+    if tx is None:
+        raise NotFound("Not found.")
+    return tx
+
+
+def update_transaction(user, tx_id, validated):
+    # 거래 부분 수정 + 예산 지출 카운터/일별 집계 보정을 한 트랜잭션으로 처리
+    with transaction.atomic():
+        tx = _lock_user_transaction(user, tx_id, deleted=False)
+        was_expense = is_expense(tx)
+        old_amount, old_occurred_at, old_direction = tx.amount, tx.occurred_at, tx.direction
+
+        # 허용된 필드들만 업데이트
+        for attr, val in validated.items():
+            if attr == "tags":
+                tx.tags.set(val)
+                continue
+            setattr(tx, attr, val)
+        tx.save()
+
+        # 이전 지출분을 빼고 새 지출분을 더함 (금액/방향/날짜 변경 모두 대응)
+        if was_expense:
+            apply_spend_delta(
+                user_id=user.id,
+                account_id=tx.account_id,
+                occurred_at=old_occurred_at,
+                delta=-Decimal(old_amount),
+            )
+        if is_expense(tx):
+            apply_spend_delta(
+                user_id=user.id,
+                account_id=tx.account_id,
+                occurred_at=tx.occurred_at,
+                delta=Decimal(tx.amount),
+            )
+
+        # 일별 집계도 이전 값을 빼고 새 값을 더함
+        apply_rollup_delta(
+            user_id=user.id,
+            account_id=tx.account_id,
+            occurred_at=old_occurred_at,
+            direction=old_direction,
+            amount=old_amount,
+            sign=-1,
+        )
+        record_transaction_rollup(tx)
+
+    return tx
+
+
+def soft_delete_transaction(user, tx_id):
+    # 휴지통 이동 + 예산 지출 카운터/일별 집계 차감
+    with transaction.atomic():
+        tx = _lock_user_transaction(user, tx_id, deleted=False)
+        tx.deleted_at = timezone.now()
+        tx.save(update_fields=["deleted_at"])
+        record_transaction_spend(tx, sign=-1)
+        record_transaction_rollup(tx, sign=-1)
+    return tx
+
+
+def restore_transaction(user, tx_id):
+    # 휴지통 복구 + 예산 지출 카운터/일별 집계 재반영
+    with transaction.atomic():
+        tx = _lock_user_transaction(user, tx_id, deleted=True)
+        tx.deleted_at = None
+        tx.save(update_fields=["deleted_at"])
+        record_transaction_spend(tx, sign=1)
+        record_transaction_rollup(tx, sign=1)
+    return tx
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Transaction
+from .rollups import record_transaction_rollup
+
+
+@receiver(post_save, sender=Transaction)
+def on_transaction_created(sender, instance, created, **kwargs):
+    # 새 거래는 일별 집계에 바로 반영 (수정/삭제/복구는 services에서 처리)
+    if created and instance.deleted_at is None:
+        record_transaction_rollup(instance)
@@ -1,12 +1,33 @@
+import csv
+import json
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from apps.bank_account.models import Account
+from apps.budget import services as budget_services
+from apps.budget.models import (
+    Budget,
+    BudgetAlertEvent,
+    BudgetAlertRule,
+    BudgetScopeType,
+    BudgetSpend,
+    ThresholdType,
+)
 from apps.members.models import User
-from apps.transaction.models import Transaction
+from apps.tag.models import Tag
+from apps.transaction.models import Transaction, TransactionDailyRollup
+from apps.transaction.repositories import TransactionRepository
+from apps.transaction.serializers import TransactionResponseSerializer
 
 
 # 거래 관련 API를 검증하는 테스트 클래스 정의
@@ -85,10 +106,115 @@ class TransactionAPITests(APITestCase):
 
         # 응답 코드와 반환 건수 확인
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 1)
+        results = response.data["results"]
+        self.assertEqual(len(results), 1)
         # 반환된 거래 방향과 계좌가 기대와 일치하는지 확인
-        self.assertEqual(response.data[0]["direction"], "income")
-        self.assertEqual(response.data[0]["account"], self.account.id)
+        self.assertEqual(results[0]["direction"], "income")
+        self.assertEqual(results[0]["account"], self.account.id)
+
+    # 커서 페이지네이션이 (occurred_at, id) 순서로 중복/누락 없이 이어지는지 확인
+    def test_list_transactions_cursor_pagination(self):
+        # 같은 시각 거래를 섞어서 id 타이브레이크까지 검증
+        same_time = timezone.now() - timedelta(days=1)
+        for i in range(4):
+            Transaction.objects.create(
+                account=self.account,
+                amount=Decimal("10.00"),
+                balance_after=Decimal("1000.00"),
+                direction="expense",
+                method="card",
+                description=f"Same time {i}",
+                occurred_at=same_time,
+            )
+        expected_ids = list(
+            Transaction.objects.filter(account=self.account)
+            .order_by("-occurred_at", "-id")
+            .values_list("id", flat=True)
+        )
+
+        # page_size=2로 첫 페이지 조회
+        url = reverse("transactions-list")
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["previous"])
+
+        # next 링크를 따라가며 전체 id 수집
+        collected = [item["id"] for item in response.data["results"]]
+        next_url = response.data["next"]
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, 200)
+            collected.extend(item["id"] for item in response.data["results"])
+            next_url = response.data["next"]
+        self.assertEqual(collected, expected_ids)
+
+        # 마지막 페이지에서 previous 링크로 되돌아가면 직전 페이지가 나오는지 확인
+        response = self.client.get(response.data["previous"])
+        self.assertEqual([item["id"] for item in response.data["results"]], expected_ids[2:4])
+
+    # 커서와 필터가 함께 적용되는지 확인
+    def test_list_transactions_cursor_with_filters(self):
+        for i in range(3):
+            Transaction.objects.create(
+                account=self.account,
+                amount=Decimal("300.00"),
+                balance_after=Decimal("1300.00"),
+                direction="income",
+                method="bank",
+                description=f"Income {i}",
+                occurred_at=timezone.now() - timedelta(hours=i + 1),
+            )
+
+        url = reverse("transactions-list")
+        response = self.client.get(url, {"direction": "income", "page_size": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(response.data["next"])
+        results = response.data["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["direction"], "income")
+        self.assertIsNone(response.data["next"])
+
+    # end_date 당일 늦은 시각 거래까지 포함되는지 확인 (반열린 구간 [start, end+1일))
+    def test_list_transactions_end_date_includes_whole_day(self):
+        late_night = timezone.make_aware(datetime(2026, 1, 31, 23, 30))
+        Transaction.objects.create(
+            account=self.account,
+            amount=Decimal("10.00"),
+            balance_after=Decimal("890.00"),
+            direction="expense",
+            method="card",
+            description="Late night",
+            occurred_at=late_night,
+        )
+        Transaction.objects.create(
+            account=self.account,
+            amount=Decimal("20.00"),
+            balance_after=Decimal("870.00"),
+            direction="expense",
+            method="card",
+            description="Next month",
+            occurred_at=late_night + timedelta(hours=1),
+        )
+
+        url = reverse("transactions-list")
+        response = self.client.get(url, {"start_date": "2026-01-31", "end_date": "2026-01-31"})
+
+        self.assertEqual(response.status_code, 200)
+        descriptions = [item["description"] for item in response.data["results"]]
+        self.assertEqual(descriptions, ["Late night"])
+
+    # 날짜 형식이 잘못되면 400으로 처리되는지 확인
+    def test_list_transactions_invalid_date_returns_400(self):
+        url = reverse("transactions-list")
+        response = self.client.get(url, {"start_date": "not-a-date"})
+        self.assertEqual(response.status_code, 400)
+
+    # 잘못된 커서는 404로 처리되는지 확인
+    def test_list_transactions_invalid_cursor_returns_404(self):
+        url = reverse("transactions-list")
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
 
     # 단일 거래 조회가 정상 동작하는지 확인
     def test_retrieve_transaction(self):
@@ -211,3 +337,460 @@ class TransactionAPITests(APITestCase):
         response = self.client.get(url)
         # 401 또는 403 여부 확인
         self.assertIn(response.status_code, (401, 403))
+
+
+# 일별 거래 집계(TransactionDailyRollup) 증분 갱신을 검증하는 테스트 클래스
+class TransactionDailyRollupTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="rollup@example.com",
+            password="testpass123",
+            name="Rollup User",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name="Main Account",
+            source_type="bank",
+            balance=Decimal("10000.00"),
+        )
+        self.client.force_authenticate(self.user)
+
+    def _create_tx(self, amount, direction="expense", day=10, hour=12):
+        payload = {
+            "account": self.account.id,
+            "amount": str(amount),
+            "direction": direction,
+            "method": "card",
+            "description": "rollup",
+            "occurred_at": timezone.make_aware(datetime(2026, 3, day, hour, 0)).isoformat(),
+        }
+        response = self.client.post(reverse("transactions-list"), payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        return response.data["id"]
+
+    def _rollup(self, day=10, direction="expense"):
+        return TransactionDailyRollup.objects.filter(
+            account=self.account, date=date(2026, 3, day), direction=direction
+        ).first()
+
+    # 생성 시 건수/합계/최소/최대가 누적되는지 확인
+    def test_create_accumulates_daily_rollup(self):
+        self._create_tx("30.00")
+        self._create_tx("70.00", hour=23)
+        self._create_tx("500.00", direction="income")
+
+        rollup = self._rollup()
+        self.assertEqual(
+            (rollup.count, rollup.total, rollup.min_amount, rollup.max_amount),
+            (2, Decimal("100.00"), Decimal("30.00"), Decimal("70.00")),
+        )
+        self.assertEqual(self._rollup(direction="income").total, Decimal("500.00"))
+
+    # 수정/삭제/복구 시 집계가 보정되고, 경계값이 빠지면 최소/최대를 다시 계산하는지 확인
+    def test_update_delete_restore_adjust_rollup(self):
+        small_id = self._create_tx("10.00")
+        self._create_tx("40.00")
+        large_id = self._create_tx("90.00")
+
+        self.client.delete(reverse("transactions-detail", args=[large_id]))
+        rollup = self._rollup()
+        self.assertEqual((rollup.count, rollup.total), (2, Decimal("50.00")))
+        self.assertEqual(rollup.max_amount, Decimal("40.00"))
+
+        moved = timezone.make_aware(datetime(2026, 3, 11, 9, 0)).isoformat()
+        self.client.patch(
+            reverse("transactions-detail", args=[small_id]), {"occurred_at": moved}, format="json"
+        )
+        rollup = self._rollup()
+        self.assertEqual((rollup.count, rollup.min_amount), (1, Decimal("40.00")))
+        self.assertEqual(self._rollup(day=11).total, Decimal("10.00"))
+
+        self.client.post(reverse("transactions-restore", args=[large_id]))
+        self.assertEqual(self._rollup().max_amount, Decimal("90.00"))
+
+        # 마지막 거래가 빠지면 row 삭제
+        self.client.delete(reverse("transactions-detail", args=[small_id]))
+        self.assertIsNone(self._rollup(day=11))
+
+    # 일/월 요약이 원본 거래 집계와 같은 값인지 확인
+    def test_summaries_match_raw_transactions(self):
+        self._create_tx("25.00", day=1)
+        self._create_tx("75.00", day=1)
+        self._create_tx("300.00", direction="income", day=2)
+
+        daily = list(TransactionRepository.get_daily_summary(self.user, "2026-03-01", "2026-03-31"))
+        self.assertEqual([row["date"] for row in daily], [date(2026, 3, 1), date(2026, 3, 2)])
+        self.assertEqual(daily[0]["total_count"], 2)
+        self.assertEqual(daily[0]["total_expense"], Decimal("100.00"))
+        self.assertEqual(daily[0]["avg_amount"], Decimal("50.00"))
+        self.assertEqual(daily[1]["total_income"], Decimal("300.00"))
+
+        monthly = list(TransactionRepository.get_monthly_summary(self.user, year=2026))
+        self.assertEqual(len(monthly), 1)
+        self.assertEqual(monthly[0]["month"], date(2026, 3, 1))
+        self.assertEqual(monthly[0]["total_count"], 3)
+        self.assertEqual(round(monthly[0]["avg_amount"], 2), Decimal("133.33"))
+
+        yearly = list(TransactionRepository.get_yearly_summary(self.user))
+        self.assertEqual(yearly[0]["total_income"], Decimal("300.00"))
+
+    # 집계가 어긋났을 때 backfill 명령으로 복구되는지 확인
+    def test_backfill_command_rebuilds_rollups(self):
+        self._create_tx("20.00")
+        TransactionDailyRollup.objects.filter(user=self.user).update(count=99, total=0)
+
+        call_command(
+            "backfill_transaction_rollups", "--user-id", str(self.user.id), stdout=StringIO()
+        )
+        rollup = self._rollup()
+        self.assertEqual((rollup.count, rollup.total), (1, Decimal("20.00")))
+
+
+# 거래 일괄 등록(import) API를 검증하는 테스트 클래스
+class TransactionImportTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="import@example.com",
+            password="testpass123",
+            name="Import User",
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            name="Main Account",
+            source_type="bank",
+            balance=Decimal("1000.00"),
+        )
+        self.card = Account.objects.create(
+            user=self.user,
+            name="Card",
+            source_type="card",
+            balance=Decimal("0.00"),
+        )
+        self.tag = Tag.objects.create(user=self.user, name="식비")
+        self.budget = Budget.objects.create(
+            user=self.user,
+            name="4월 전체 예산",
+            period_start=date(2026, 4, 1),
+            period_end=date(2026, 4, 30),
+            amount_limit=Decimal("500.00"),
+            scope_type=BudgetScopeType.ALL,
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("transactions-import-rows")
+
+    def _row(self, amount, day, direction="expense", account=None, **extra):
+        return {
+            "account": (account or self.account).id,
+            "amount": str(amount),
+            "direction": direction,
+            "method": "card",
+            "description": "import",
+            "occurred_at": timezone.make_aware(datetime(2026, 4, day, 12, 0)).isoformat(),
+            **extra,
+        }
+
+    # 입력 순서와 무관하게 occurred_at 순으로 잔액이 누적되고, 태그/집계/예산 카운터가 반영되는지 확인
+    def test_json_import_computes_running_balance(self):
+        rows = [
+            self._row("300.00", day=3, tags=[self.tag.id]),
+            self._row("100.00", day=1),
+            self._row("50.00", day=2, direction="income"),
+            self._row("20.00", day=2, account=self.card),
+        ]
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 4)
+
+        txs = Transaction.objects.filter(account=self.account).order_by("occurred_at")
+        self.assertEqual(
+            [tx.balance_after for tx in txs],
+            [Decimal("900.00"), Decimal("950.00"), Decimal("650.00")],
+        )
+        self.account.refresh_from_db()
+        self.card.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("650.00"))
+        self.assertEqual(self.card.balance, Decimal("-20.00"))
+
+        self.assertEqual(list(txs.last().tags.values_list("id", flat=True)), [self.tag.id])
+        self.assertEqual(
+            TransactionDailyRollup.objects.get(
+                account=self.account, date=date(2026, 4, 3), direction="expense"
+            ).total,
+            Decimal("300.00"),
+        )
+        self.assertEqual(BudgetSpend.objects.get(budget=self.budget).spent, Decimal("420.00"))
+
+    # 쿼리 수가 행 수와 무관하게 일정한지 확인
+    def test_query_count_does_not_grow_with_rows(self):
+        def count_queries(rows):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post(self.url, rows, format="json")
+            self.assertEqual(response.status_code, 201)
+            return len(ctx.captured_queries)
+
+        few = count_queries([self._row("1.00", day=5, tags=[self.tag.id]) for _ in range(3)])
+        many = count_queries([self._row("1.00", day=6, tags=[self.tag.id]) for _ in range(60)])
+        self.assertEqual(few, many)
+
+    # CSV 업로드도 같은 규칙으로 등록되는지 확인
+    def test_csv_import(self):
+        content = (
+            "account,amount,direction,method,description,occurred_at,tags\n"
+            f"{self.account.id},10.00,expense,cash,커피,2026-04-02T09:00:00+09:00,{self.tag.id}\n"
+            f"{self.account.id},5.00,expense,cash,,2026-04-01T09:00:00+09:00,\n"
+        )
+        upload = SimpleUploadedFile("rows.csv", content.encode("utf-8"), content_type="text/csv")
+        response = self.client.post(self.url, {"file": upload}, format="multipart")
+        self.assertEqual(response.status_code, 201)
+
+        txs = list(Transaction.objects.filter(account=self.account).order_by("occurred_at"))
+        self.assertEqual([tx.balance_after for tx in txs], [Decimal("995.00"), Decimal("985.00")])
+        self.assertEqual(txs[1].description, "커피")
+        self.assertEqual(txs[1].tags.count(), 1)
+
+    # 다른 사용자 계좌가 섞이면 전체가 취소되는지 확인
+    def test_other_users_account_rolls_back_everything(self):
+        other = User.objects.create_user(
+            email="import-other@example.com", password="testpass123", name="Other"
+        )
+        other_account = Account.objects.create(
+            user=other, name="Other", source_type="bank", balance=Decimal("0")
+        )
+        rows = [self._row("10.00", day=1), self._row("10.00", day=2, account=other_account)]
+        response = self.client.post(self.url, rows, format="json")
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Transaction.objects.filter(account__user=self.user).exists())
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("1000.00"))
+
+    # 예산 알림은 영향받은 예산당 한 번만 평가되고, 룰은 한 번만 트리거되는지 확인
+    def test_budget_alerts_evaluated_once_per_budget(self):
+        BudgetAlertRule.objects.create(
+            budget=self.budget,
+            threshold_type=ThresholdType.PERCENT,
+            threshold_value=Decimal("80"),
+        )
+        rows = [self._row("100.00", day=day) for day in range(1, 6)]
+
+        with mock.patch.object(
+            budget_services,
+            "evaluate_budget_alerts",
+            wraps=budget_services.evaluate_budget_alerts,
+        ) as evaluate:
+            response = self.client.post(self.url, rows, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["evaluated_budgets"], 1)
+        evaluate.assert_called_once()
+        self.assertEqual(BudgetAlertEvent.objects.filter(budget=self.budget).count(), 1)
+
+
+# 거래 내보내기(CSV/NDJSON 스트리밍) API를 검증하는 테스트 클래스
+class TransactionExportTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="export@example.com",
+            password="testpass123",
+            name="Export User",
+        )
+        other = User.objects.create_user(
+            email="export-other@example.com",
+            password="testpass123",
+            name="Other User",
+        )
+        self.account = Account.objects.create(
+            user=self.user, name="주계좌", source_type="bank", balance=Decimal("0")
+        )
+        other_account = Account.objects.create(
+            user=other, name="Other", source_type="bank", balance=Decimal("0")
+        )
+        self.tag = Tag.objects.create(user=self.user, name="식비")
+
+        def make(account, amount, direction, day):
+            return Transaction.objects.create(
+                account=account,
+                amount=Decimal(amount),
+                balance_after=Decimal("0"),
+                direction=direction,
+                method="card",
+                description="점심, 커피",
+                occurred_at=timezone.make_aware(datetime(2026, 5, day, 12, 0)),
+            )
+
+        self.lunch = make(self.account, "12.50", "expense", 2)
+        self.lunch.tags.set([self.tag])
+        make(self.account, "300.00", "income", 3)
+        make(self.account, "7.00", "expense", 20)
+        make(other_account, "99.00", "expense", 2)
+        self.client.force_authenticate(self.user)
+        self.url = reverse("transactions-export")
+
+    def _content(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode("utf-8-sig")
+
+    # CSV가 목록 조회와 같은 필터/사용자 범위로 최신순 스트리밍되는지 확인
+    def test_csv_export_applies_filters(self):
+        response = self.client.get(
+            self.url, {"direction": "expense", "start_date": "2026-05-01", "end_date": "2026-05-10"}
+        )
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertIn("attachment;", response["Content-Disposition"])
+
+        rows = list(csv.DictReader(StringIO(self._content(response))))
+        self.assertEqual([row["id"] for row in rows], [str(self.lunch.id)])
+        self.assertEqual(rows[0]["amount"], "12.50")
+        self.assertEqual(rows[0]["account_name"], "주계좌")
+        self.assertEqual(rows[0]["description"], "점심, 커피")
+        self.assertEqual(rows[0]["tags"], str(self.tag.id))
+
+    # NDJSON은 한 줄에 거래 하나씩 내려가는지 확인
+    def test_ndjson_export(self):
+        response = self.client.get(self.url, {"output": "ndjson"})
+        lines = self._content(response).splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record["amount"] for record in records], ["7.00", "300.00", "12.50"])
+        self.assertEqual(records[-1]["tags"], [self.tag.id])
+
+    # 지원하지 않는 형식이나 잘못된 날짜는 400
+    def test_invalid_output_or_date_returns_400(self):
+        self.assertEqual(self.client.get(self.url, {"output": "xml"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"start_date": "05/01"}).status_code, 400)
+
+
+# 거래 응답 태그 로딩의 쿼리 수 회귀 테스트 (행/태그 수와 무관하게 일정해야 함)
+class TransactionQueryCountTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="queries@example.com",
+            password="testpass123",
+            name="Query User",
+        )
+        self.account = Account.objects.create(
+            user=self.user, name="Main", source_type="bank", balance=Decimal("0")
+        )
+        self.tags = [Tag.objects.create(user=self.user, name=f"tag-{i}") for i in range(3)]
+        self.deleted_tag = Tag.objects.create(
+            user=self.user, name="deleted", deleted_at=timezone.now()
+        )
+        self.client.force_authenticate(self.user)
+
+    def _seed(self, count, deleted=False):
+        now = timezone.now()
+        txs = Transaction.objects.bulk_create(
+            Transaction(
+                account=self.account,
+                amount=Decimal("1.00"),
+                balance_after=Decimal("0"),
+                direction="expense",
+                method="card",
+                occurred_at=now - timedelta(minutes=i),
+                deleted_at=now if deleted else None,
+            )
+            for i in range(count)
+        )
+        TransactionTag = Transaction.tags.through
+        TransactionTag.objects.bulk_create(
+            TransactionTag(transaction_id=tx.id, tag_id=tag.id)
+            for tx in txs
+            for tag in [*self.tags, self.deleted_tag]
+        )
+        return txs
+
+    def _count(self, method, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    # 목록: 행 수가 늘어도 쿼리 수가 같고, 휴지통 태그는 빠지는지 확인
+    def test_list_query_count_is_constant(self):
+        url = reverse("transactions-list")
+        self._seed(2)
+        few, _ = self._count("get", url)
+        self._seed(30)
+        many, response = self._count("get", url)
+
+        self.assertEqual(few, many)
+        names = {tag["name"] for tag in response.data["results"][0]["tags"]}
+        self.assertEqual(names, {"tag-0", "tag-1", "tag-2"})
+
+    # 휴지통 목록도 행 수와 무관하게 쿼리 수가 같은지 확인
+    def test_trash_query_count_is_constant(self):
+        url = reverse("transactions-trash")
+        self._seed(2, deleted=True)
+        few, _ = self._count("get", url)
+        self._seed(30, deleted=True)
+        many, response = self._count("get", url)
+
+        self.assertEqual(few, many)
+        self.assertEqual(len(response.data), 32)
+
+    # 상세 조회/복구는 태그 수와 무관하게 쿼리 수가 같은지 확인
+    def test_retrieve_and_restore_query_count_is_constant(self):
+        bare = Transaction.objects.create(
+            account=self.account,
+            amount=Decimal("1.00"),
+            balance_after=Decimal("0"),
+            direction="expense",
+            method="card",
+            occurred_at=timezone.now(),
+        )
+        tagged = self._seed(1)[0]
+        bare_count, _ = self._count("get", reverse("transactions-detail", args=[bare.id]))
+        tagged_count, response = self._count(
+            "get", reverse("transactions-detail", args=[tagged.id])
+        )
+        self.assertEqual(bare_count, tagged_count)
+        self.assertEqual(len(response.data["tags"]), 3)
+
+        Transaction.objects.filter(id__in=[bare.id, tagged.id]).update(deleted_at=timezone.now())
+        bare_count, _ = self._count("post", reverse("transactions-restore", args=[bare.id]))
+        tagged_count, response = self._count(
+            "post", reverse("transactions-restore", args=[tagged.id])
+        )
+        self.assertEqual(bare_count, tagged_count)
+        self.assertEqual(len(response.data["tags"]), 3)
+
+
+# 거래 목록 빠른 직렬화 결과를 TransactionResponseSerializer와 비교하는 테스트 클래스
+class TransactionFastReadSerializerTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="fast@example.com",
+            password="testpass123",
+            name="Fast User",
+        )
+        self.account = Account.objects.create(
+            user=self.user, name="주계좌", source_type="bank", balance=Decimal("0")
+        )
+        tags = [
+            Tag.objects.create(user=self.user, name="식비", color="#ff0000"),
+            Tag.objects.create(user=self.user, name="고정"),
+            Tag.objects.create(user=self.user, name="삭제됨", deleted_at=timezone.now()),
+        ]
+        for i, amount in enumerate(("0.50", "1200.00", "33.3")):
+            tx = Transaction.objects.create(
+                account=self.account,
+                amount=Decimal(amount),
+                balance_after=Decimal("-5"),
+                direction="expense",
+                method="card",
+                description=f"거래 {i}",
+                occurred_at=timezone.make_aware(datetime(2026, 6, 1 + i, 8, 30, 15, 250)),
+            )
+            tx.tags.set(tags[: i + 1])
+        self.client.force_authenticate(self.user)
+
+    # 목록 응답이 기존 시리얼라이저 응답과 같은지 확인 (금액 자릿수, 시각 형식, 휴지통 태그 제외)
+    def test_list_matches_response_serializer(self):
+        response = self.client.get(reverse("transactions-list"))
+        self.assertEqual(response.status_code, 200)
+
+        queryset = TransactionRepository.get_transactions_optimized(self.user).order_by(
+            "-occurred_at", "-id"
+        )
+        expected = TransactionResponseSerializer(queryset, many=True).data
+        self.assertEqual(response.json()["results"], json.loads(json.dumps(expected)))
+        self.assertEqual(len(response.json()["results"][0]["tags"]), 2)
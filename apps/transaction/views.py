@@ -1,22 +1,96 @@
+import csv
+import io
+
+from django.conf import settings
+from django.db.models import prefetch_related_objects
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.exceptions import MethodNotAllowed, NotFound
+from rest_framework.exceptions import MethodNotAllowed, ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from apps.utils.dates import local_day_range
 
-from .models import Transaction
+from .exports import CONTENT_TYPES, EXPORT_FORMATS, stream_export
+from .pagination import TransactionCursorPagination
+from .repositories import TransactionRepository
 
 # 요청/응답에 사용할 시리얼라이저들을 가져오기
 from .serializers import (
     TransactionCreateRequestSerializer,
+    TransactionFastReadSerializer,
+    TransactionImportFileSerializer,
+    TransactionImportResponseSerializer,
+    TransactionImportRowSerializer,
     TransactionResponseSerializer,
     TransactionUpdateRequestSerializer,
 )
 
-# 서비스 레이어의 create_transaction 함수를 가져오기
-from .services import create_transaction
+# 서비스 레이어의 거래 생성/수정/삭제/복구 함수를 가져오기
+from .services import (
+    create_transaction,
+    import_transactions,
+    restore_transaction,
+    soft_delete_transaction,
+    update_transaction,
+)
+
+# 목록 조회/내보내기가 공유하는 필터 쿼리 파라미터 (get_queryset 참고)
+FILTER_PARAMETERS = [
+    openapi.Parameter(
+        "account", openapi.IN_QUERY, description="계좌 ID", type=openapi.TYPE_INTEGER
+    ),
+    openapi.Parameter(
+        "direction",
+        openapi.IN_QUERY,
+        description="거래 방향 (income/expense)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "min_amount", openapi.IN_QUERY, description="최소 금액", type=openapi.TYPE_NUMBER
+    ),
+    openapi.Parameter(
+        "max_amount", openapi.IN_QUERY, description="최대 금액", type=openapi.TYPE_NUMBER
+    ),
+    openapi.Parameter(
+        "start_date",
+        openapi.IN_QUERY,
+        description="시작 날짜 (YYYY-MM-DD)",
+        type=openapi.TYPE_STRING,
+    ),
+    openapi.Parameter(
+        "end_date",
+        openapi.IN_QUERY,
+        description="종료 날짜 (YYYY-MM-DD)",
+        type=openapi.TYPE_STRING,
+    ),
+]
+
+
+def _read_import_csv(upload):
+    # CSV 업로드를 행 dict 목록으로 변환 (tags 칸은 ;로 구분한 태그 id)
+    try:
+        text = upload.read().decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValidationError("CSV 파일은 UTF-8 인코딩이어야 합니다.")
+    rows = []
+    for row in csv.DictReader(io.StringIO(text)):
+        tags = (row.pop("tags", None) or "").strip()
+        row = {key: value for key, value in row.items() if key is not None}
+        row["tags"] = [tag.strip() for tag in tags.split(";") if tag.strip()]
+        rows.append(row)
+    return rows
+
+
+def _with_tags(tx):
+    # 서비스에서 돌려받은 단건도 목록과 같은 기준(휴지통 제외 태그)으로 태그를 채움
+    prefetch_related_objects([tx], TransactionRepository.prefetch_tags())
+    return tx
 
 
 # 거래 관련 REST API 뷰셋 정의
@@ -32,6 +106,8 @@ class TransactionViewSet(viewsets.ModelViewSet):
     - GET /api/transactions/{id}/ : 특정 거래 상세 조회
     - PATCH /api/transactions/{id}/ : 거래 부분 수정
     - DELETE /api/transactions/{id}/ : 거래 삭제
+    - POST /api/transactions/import/ : 거래 일괄 등록 (JSON 배열 또는 CSV 업로드)
+    - GET /api/transactions/export/ : 거래 내보내기 (CSV/NDJSON 스트리밍, 목록과 같은 필터)
 
     요청 예시 (POST /api/transactions/):
     {
@@ -63,6 +139,12 @@ class TransactionViewSet(viewsets.ModelViewSet):
     - start_date: 시작 날짜 (예: ?start_date=2026-01-01)
     - end_date: 종료 날짜 (예: ?end_date=2026-01-31)
 
+    페이지네이션 (GET /api/transactions/):
+    - 최신순((occurred_at, id) 내림차순) 커서 페이지네이션
+    - 응답: {"next": "...", "previous": "...", "results": [...]}
+    - cursor: 이전 응답의 next/previous URL에 포함된 불투명 커서
+    - page_size: 페이지 크기 (기본 50, 최대 200)
+
     상태 코드:
     - 200 OK: 조회 성공
     - 201 Created: 거래 생성 성공
@@ -80,11 +162,13 @@ class TransactionViewSet(viewsets.ModelViewSet):
     # 허용할 HTTP 메소드 목록을 제한 (부분 수정 허용)
     http_method_names = ["get", "post", "patch", "delete", "head", "options"]
 
+    # 목록 조회는 (occurred_at, id) 키셋 커서로 페이지 단위 응답
+    pagination_class = TransactionCursorPagination
+
     # 현재 요청 사용자의 계좌에 속한 거래만 조회되도록 제한
     def get_queryset(self):
-        # select_related로 account와 user 정보를 한 번에 가져와 N+1 문제 해결
-        qs = Transaction.objects.select_related("account", "account__user").filter(
-            account__user=self.request.user,
+        # 계좌는 select_related, 태그는 Prefetch로 가져와 행 수와 무관하게 쿼리 수 고정
+        qs = TransactionRepository.get_transactions_optimized(self.request.user).filter(
             deleted_at__isnull=True,
         )
 
@@ -105,10 +189,16 @@ class TransactionViewSet(viewsets.ModelViewSet):
             qs = qs.filter(amount__gte=min_amount)
         if max_amount:
             qs = qs.filter(amount__lte=max_amount)
-        if start_date:
-            qs = qs.filter(occurred_at__gte=start_date)
-        if end_date:
-            qs = qs.filter(occurred_at__lte=end_date)
+
+        # 날짜 필터는 end_date 당일을 포함하는 반열린 구간 [start, end)로 변환
+        try:
+            period_start, period_end = local_day_range(start_date, end_date)
+        except ValueError:
+            raise ValidationError("start_date, end_date는 YYYY-MM-DD 형식이어야 합니다.")
+        if period_start:
+            qs = qs.filter(occurred_at__gte=period_start)
+        if period_end:
+            qs = qs.filter(occurred_at__lt=period_end)
 
         return qs
 
@@ -126,32 +216,18 @@ class TransactionViewSet(viewsets.ModelViewSet):
         operation_summary="거래 목록 조회",
         operation_description="사용자의 모든 거래를 조회합니다. 계좌, 방향, 금액, 날짜 등으로 필터링할 수 있습니다.",
         manual_parameters=[
+            *FILTER_PARAMETERS,
             openapi.Parameter(
-                "account", openapi.IN_QUERY, description="계좌 ID", type=openapi.TYPE_INTEGER
-            ),
-            openapi.Parameter(
-                "direction",
-                openapi.IN_QUERY,
-                description="거래 방향 (income/expense)",
-                type=openapi.TYPE_STRING,
-            ),
-            openapi.Parameter(
-                "min_amount", openapi.IN_QUERY, description="최소 금액", type=openapi.TYPE_NUMBER
-            ),
-            openapi.Parameter(
-                "max_amount", openapi.IN_QUERY, description="최대 금액", type=openapi.TYPE_NUMBER
-            ),
-            openapi.Parameter(
-                "start_date",
+                "cursor",
                 openapi.IN_QUERY,
-                description="시작 날짜 (YYYY-MM-DD)",
+                description="페이지 커서 (이전 응답의 next/previous 값 사용)",
                 type=openapi.TYPE_STRING,
             ),
             openapi.Parameter(
-                "end_date",
+                "page_size",
                 openapi.IN_QUERY,
-                description="종료 날짜 (YYYY-MM-DD)",
-                type=openapi.TYPE_STRING,
+                description="페이지 크기 (기본 50, 최대 200)",
+                type=openapi.TYPE_INTEGER,
             ),
         ],
         responses={
@@ -161,7 +237,12 @@ class TransactionViewSet(viewsets.ModelViewSet):
         tags=["거래 관리"],
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        # 모델 인스턴스/ModelSerializer 대신 values() dict를 바로 직렬화 (응답 JSON은 동일)
+        queryset = TransactionFastReadSerializer.values(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(TransactionFastReadSerializer.serialize_rows(queryset))
+        return self.get_paginated_response(TransactionFastReadSerializer.serialize_rows(page))
 
     @swagger_auto_schema(
         operation_summary="거래 상세 조회",
@@ -209,7 +290,7 @@ class TransactionViewSet(viewsets.ModelViewSet):
         )
 
         # 생성된 거래를 응답용 시리얼라이저로 직렬화하여 반환
-        out = TransactionResponseSerializer(tx, context={"request": request})
+        out = TransactionResponseSerializer(_with_tags(tx), context={"request": request})
         return Response(out.data, status=status.HTTP_201_CREATED)
 
     # PUT(전체 업데이트)은 허용하지 않음
@@ -234,17 +315,11 @@ class TransactionViewSet(viewsets.ModelViewSet):
 
         serializer = TransactionUpdateRequestSerializer(data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        validated = serializer.validated_data
 
-        # 허용된 필드들만 업데이트
-        for attr, val in validated.items():
-            if attr == "tags":
-                instance.tags.set(val)
-                continue
-            setattr(instance, attr, val)
-        instance.save()
+        # 필드 수정과 예산 지출 카운터 보정은 서비스 레이어에서 원자적으로 처리
+        instance = update_transaction(request.user, instance.id, serializer.validated_data)
 
-        out = TransactionResponseSerializer(instance, context={"request": request})
+        out = TransactionResponseSerializer(_with_tags(instance), context={"request": request})
         return Response(out.data, status=status.HTTP_200_OK)
 
     # 거래 삭제 엔드포인트
@@ -261,11 +336,7 @@ class TransactionViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         # 객체를 조회하여 삭제하고 간단 메시지를 반환
         instance = self.get_object()
-        Transaction.objects.filter(
-            id=instance.id,
-            account__user=request.user,
-            deleted_at__isnull=True,
-        ).update(deleted_at=timezone.now())
+        soft_delete_transaction(request.user, instance.id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @swagger_auto_schema(
@@ -281,10 +352,10 @@ class TransactionViewSet(viewsets.ModelViewSet):
     )
     @action(detail=False, methods=["get"], url_path="trash")
     def trash(self, request, *args, **kwargs):
-        qs = Transaction.objects.select_related("account", "account__user").filter(
-            account__user=request.user,
-            deleted_at__isnull=False,
-        )
+        # 기본 매니저는 휴지통 거래를 제외하므로 include_deleted로 조회
+        qs = TransactionRepository.get_transactions_optimized(
+            request.user, include_deleted=True
+        ).filter(deleted_at__isnull=False)
         out = TransactionResponseSerializer(qs, many=True, context={"request": request})
         return Response(out.data, status=status.HTTP_200_OK)
 
@@ -300,14 +371,89 @@ class TransactionViewSet(viewsets.ModelViewSet):
     )
     @action(detail=True, methods=["post"], url_path="restore")
     def restore(self, request, *args, **kwargs):
-        obj_id = kwargs.get("pk")
-        updated = Transaction.objects.filter(
-            id=obj_id,
-            account__user=request.user,
-            deleted_at__isnull=False,
-        ).update(deleted_at=None)
-        if updated == 0:
-            raise NotFound("Not found.")
-        instance = Transaction.objects.select_related("account", "account__user").get(id=obj_id)
-        out = TransactionResponseSerializer(instance, context={"request": request})
+        instance = restore_transaction(request.user, kwargs.get("pk"))
+        out = TransactionResponseSerializer(_with_tags(instance), context={"request": request})
         return Response(out.data, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="거래 일괄 등록",
+        operation_description=(
+            "여러 거래를 한 번에 등록합니다. JSON 배열(application/json) 또는 CSV 파일"
+            "(multipart/form-data, file 필드)을 받습니다.\n"
+            "계좌별 잔액(balance_after)은 occurred_at 순서로 계산되며, "
+            "예산 알림은 영향받은 예산당 한 번만 평가합니다. 한 행이라도 실패하면 전체가 취소됩니다."
+        ),
+        request_body=TransactionImportRowSerializer(many=True),
+        responses={
+            201: openapi.Response("일괄 등록 성공", TransactionImportResponseSerializer),
+            400: "유효성 검증 실패",
+            401: "인증 실패",
+            403: "다른 사용자의 계좌",
+        },
+        tags=["거래 관리"],
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        # 기본 JSON 파서(API_FAST_JSON이면 orjson) + CSV 업로드
+        parser_classes=[api_settings.DEFAULT_PARSER_CLASSES[0], MultiPartParser],
+    )
+    def import_rows(self, request, *args, **kwargs):
+        if request.content_type.startswith("multipart/"):
+            upload = TransactionImportFileSerializer(data=request.data)
+            upload.is_valid(raise_exception=True)
+            rows = _read_import_csv(upload.validated_data["file"])
+        elif isinstance(request.data, list):
+            rows = request.data
+        else:
+            raise ValidationError("거래 목록(JSON 배열) 또는 CSV 파일이 필요합니다.")
+
+        serializer = TransactionImportRowSerializer(
+            data=rows,
+            many=True,
+            allow_empty=False,
+            max_length=settings.TRANSACTION_IMPORT_MAX_ROWS,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        result = import_transactions(request.user, serializer.validated_data)
+        out = TransactionImportResponseSerializer(result)
+        return Response(out.data, status=status.HTTP_201_CREATED)
+
+    @swagger_auto_schema(
+        operation_summary="거래 내보내기",
+        operation_description=(
+            "필터에 맞는 거래 전체를 CSV 또는 NDJSON으로 스트리밍합니다. "
+            "페이지네이션 없이 최신순으로 내려가며, CSV는 일괄 등록 CSV로 다시 가져올 수 있습니다."
+        ),
+        manual_parameters=[
+            *FILTER_PARAMETERS,
+            openapi.Parameter(
+                "output",
+                openapi.IN_QUERY,
+                description="내보내기 형식 (csv(기본)/ndjson)",
+                type=openapi.TYPE_STRING,
+                enum=[*EXPORT_FORMATS],
+            ),
+        ],
+        responses={
+            200: "CSV(text/csv) 또는 NDJSON(application/x-ndjson) 스트림",
+            400: "유효성 검증 실패",
+            401: "인증 실패",
+        },
+        tags=["거래 관리"],
+    )
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request, *args, **kwargs):
+        # ?format= 은 DRF 렌더러 선택에 쓰이므로 형식은 output 파라미터로 받음
+        export_format = request.query_params.get("output") or "csv"
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(f"output은 {', '.join(EXPORT_FORMATS)} 중 하나여야 합니다.")
+
+        # get_queryset을 그대로 써서 목록 조회와 같은 필터/사용자 범위를 적용 (여기서 날짜 검증도 끝남)
+        rows = stream_export(self.get_queryset(), export_format)
+        response = StreamingHttpResponse(rows, content_type=CONTENT_TYPES[export_format])
+        filename = f"transactions-{timezone.localdate():%Y%m%d}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
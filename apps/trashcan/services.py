@@ -4,6 +4,8 @@ from django.db import models
 from django.utils import timezone
 from rest_framework.exceptions import NotFound
 
+from apps.core.response_cache import bump_versions
+
 
 class TrashService:
     """
@@ -20,7 +22,9 @@ class TrashService:
     def _base_qs(cls, model: Type[models.Model], user_id: int):
         if not hasattr(model, "deleted_at"):
             raise RuntimeError(f"{model.__name__} 모델에 deleted_at 필드가 없습니다.")
-        return model.objects.filter(**{f"{cls.user_field_name}_id": user_id})
+        # 기본 매니저가 SoftDeleteManager면 휴지통 행이 빠지므로 all_objects 우선 사용
+        manager = getattr(model, "all_objects", model._default_manager)
+        return manager.filter(**{f"{cls.user_field_name}_id": user_id})
 
     @classmethod
     def list_alive(cls, model: Type[models.Model], user_id: int):
@@ -50,7 +54,9 @@ class TrashService:
             raise NotFound("Not found.")
 
         # deleted_at이 NULL인 경우만 삭제 처리 (중복 호출 방지)
-        qs.filter(deleted_at__isnull=True).update(deleted_at=timezone.now())
+        if qs.filter(deleted_at__isnull=True).update(deleted_at=timezone.now()):
+            # queryset.update는 시그널이 없으므로 조회 캐시 버전을 직접 올림
+            bump_versions(user_id, model._meta.model_name)
 
         # 리턴 타입 유지: 기존처럼 obj 반환
         # (상태가 이미 deleted였든 방금 deleted됐든 최종 상태를 반환)
@@ -68,6 +74,7 @@ class TrashService:
             raise NotFound("Not found.")
 
         # deleted_at이 NOT NULL인 경우만 복구 처리
-        qs.filter(deleted_at__isnull=False).update(deleted_at=None)
+        if qs.filter(deleted_at__isnull=False).update(deleted_at=None):
+            bump_versions(user_id, model._meta.model_name)
 
         return qs.first()
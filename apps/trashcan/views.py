@@ -26,13 +26,18 @@ class RestoreAPIView(APIView):
     """
     POST /<resource>/{id}/restore/
     하위 클래스에서 model 지정하면 됨.
+    URL 인자 이름이 obj_id/id/pk가 아니면 lookup_url_kwarg 지정 (예: "tag_id")
     """
 
     permission_classes = [IsAuthenticated]
     model: type[models.Model] = None
     id_field = "id"
+    lookup_url_kwarg = None
 
     def post(self, request, **kwargs):
-        obj_id = kwargs.get("obj_id") or kwargs.get("id") or kwargs.get("pk")
+        if self.lookup_url_kwarg:
+            obj_id = kwargs.get(self.lookup_url_kwarg)
+        else:
+            obj_id = kwargs.get("obj_id") or kwargs.get("id") or kwargs.get("pk")
         TrashService.restore(self.model, request.user.id, obj_id, id_field=self.id_field)
         return Response(status=200)
@@ -0,0 +1,144 @@
+"""
+Django 캐시 공통 헬퍼
+
+- SharedConnectionPool: Django RedisCache는 스레드마다 캐시 객체(=커넥션 풀)를 따로 만듦.
+  같은 URL·옵션이면 프로세스 안에서 풀 하나를 같이 쓰도록 CACHES OPTIONS의 pool_class로 지정
+- get_or_set: 캐시 미스 시 한 요청만 값을 계산하고(single-flight 락), 나머지는 잠깐 기다렸다가 결과를 읽음
+- memoize: get_or_set 기반 함수 결과 캐시 데코레이터 (func.invalidate(*args)로 무효화)
+- cache_stats: 네임스페이스별 hit/miss/wait 카운터 (프로세스 단위)
+"""
+
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+
+from django.core.cache import cache
+
+try:
+    import redis
+except ImportError:  # Redis를 쓰지 않는 환경(로컬 메모리 캐시)
+    redis = None
+
+_MISSING = object()
+
+# 락 보유자가 값을 채울 때까지 기다리는 최대 시간 / 확인 간격(초)
+SINGLE_FLIGHT_WAIT = 2.0
+SINGLE_FLIGHT_POLL = 0.02
+
+
+if redis is not None:
+
+    class SharedConnectionPool(redis.BlockingConnectionPool):
+        """
+        (URL, 옵션)별로 프로세스당 하나만 만드는 커넥션 풀
+        - max_connections를 넘으면 에러 대신 timeout초 동안 빈 연결을 기다림
+        - fork 이후에는 redis-py가 pid를 확인해서 연결을 새로 만듦
+        """
+
+        _shared = {}
+        _shared_lock = threading.Lock()
+
+        @classmethod
+        def from_url(cls, url, **kwargs):
+            key = (url, tuple(sorted(kwargs.items())))
+            with cls._shared_lock:
+                pool = cls._shared.get(key)
+                if pool is None:
+                    pool = cls._shared[key] = super().from_url(url, **kwargs)
+            return pool
+
+
+class CacheStats:
+    """
+    네임스페이스별 캐시 카운터
+    - hit / miss: 캐시 적중·미스
+    - wait: 다른 요청이 계산 중이라 기다렸다가 결과를 받은 횟수 (single-flight로 줄어든 계산)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(lambda: {"hit": 0, "miss": 0, "wait": 0})
+
+    def record(self, namespace, event):
+        with self._lock:
+            self._counts[namespace][event] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {namespace: dict(counts) for namespace, counts in self._counts.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+
+cache_stats = CacheStats()
+
+
+def make_key(namespace, *parts):
+    # 인자 repr을 해시해서 키 길이를 고정 (Redis/memcached 키 제한 회피)
+    raw = "|".join(repr(part) for part in parts)
+    return f"{namespace}:{hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()}"
+
+
+def get_or_set(key, producer, timeout, *, namespace="default", lock_timeout=30):
+    """
+    캐시에 있으면 반환, 없으면 producer()로 계산해서 저장 후 반환
+    - cache.add로 락을 잡은 요청 하나만 producer를 실행 (캐시 스탬피드 방지)
+    - 락을 못 잡은 요청은 SINGLE_FLIGHT_WAIT초까지 값이 채워지길 기다리고,
+      그래도 없으면(락 보유자 실패/지연) 직접 계산
+    - None도 값으로 캐시함
+    """
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        cache_stats.record(namespace, "hit")
+        return value
+    cache_stats.record(namespace, "miss")
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            value = producer()
+            cache.set(key, value, timeout=timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + SINGLE_FLIGHT_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(SINGLE_FLIGHT_POLL)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            cache_stats.record(namespace, "wait")
+            return value
+        if cache.get(lock_key) is None:
+            # 락 보유자가 값 없이 끝남 (예외 등) → 더 기다리지 않음
+            break
+    return producer()
+
+
+def memoize(namespace, timeout):
+    """
+    함수 결과 캐시 데코레이터 (인자는 repr이 안정적인 값만 사용)
+
+        @memoize("budget:rules", timeout=60)
+        def load_rules(user_id): ...
+
+        load_rules.invalidate(user_id)
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(namespace, args, sorted(kwargs.items()))
+            return get_or_set(key, lambda: func(*args, **kwargs), timeout, namespace=namespace)
+
+        def invalidate(*args, **kwargs):
+            cache.delete(make_key(namespace, args, sorted(kwargs.items())))
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
@@ -0,0 +1,41 @@
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def to_date(value) -> date:
+    """
+    date / datetime / "YYYY-MM-DD" 문자열을 date로 변환
+    - Celery 태스크 인자나 쿼리 파라미터처럼 문자열로 들어오는 경우 대응
+    """
+    if isinstance(value, datetime):
+        return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+    if isinstance(value, date):
+        return value
+    parsed = parse_date(str(value))
+    if parsed is None:
+        # "YYYY-MM-DDTHH:MM:SS" 처럼 시각까지 들어온 경우 날짜만 사용
+        parsed_dt = parse_datetime(str(value))
+        if parsed_dt is None:
+            raise ValueError(f"날짜 형식이 올바르지 않습니다: {value}")
+        return to_date(parsed_dt)
+    return parsed
+
+
+def start_of_day(value) -> datetime:
+    # 현재 타임존(TIME_ZONE) 기준 해당 날짜 00:00 (aware datetime)
+    return timezone.make_aware(datetime.combine(to_date(value), time.min))
+
+
+def local_day_range(start_date=None, end_date=None):
+    """
+    날짜 구간 [start_date, end_date]를 반열린 datetime 구간 [start, end)로 변환
+
+    occurred_at__date__gte/lte 처럼 컬럼을 date로 캐스팅하면 인덱스를 탈 수 없으므로
+    occurred_at__gte=start, occurred_at__lt=end 형태로 비교해야 btree range scan이 가능함.
+    값이 없는 쪽은 None을 반환.
+    """
+    start = start_of_day(start_date) if start_date else None
+    end = start_of_day(to_date(end_date) + timedelta(days=1)) if end_date else None
+    return start, end
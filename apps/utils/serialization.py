@@ -0,0 +1,117 @@
+"""
+목록 응답용 읽기 전용 빠른 직렬화
+
+DRF ModelSerializer는 요청마다 필드를 introspection하고 행×필드마다 Field.to_representation을
+호출함. 목록 API는 values() dict를 받아 모델 필드 타입별로 미리 만들어 둔 변환 함수만 적용해서
+같은 JSON 모양을 만듦.
+
+- DecimalField → 소수 자릿수를 맞춘 문자열 (DRF COERCE_DECIMAL_TO_STRING과 동일)
+- DateTimeField → 현재 타임존 ISO 8601 (UTC면 "Z", DRF DateTimeField와 동일)
+- DateField → ISO 8601, 그 외 필드는 값 그대로
+"""
+
+from decimal import Decimal
+
+from django.db import models
+from django.utils import timezone
+
+
+def _decimal_converter(decimal_places):
+    exponent = Decimal(1).scaleb(-decimal_places)
+
+    def convert(value):
+        if value is None:
+            return None
+        return f"{value.quantize(exponent):f}"
+
+    return convert
+
+
+def _datetime_to_str(value):
+    if value is None:
+        return None
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return text
+
+
+def _date_to_str(value):
+    return None if value is None else value.isoformat()
+
+
+def converter_for(field):
+    # 모델 필드 → 값 변환 함수 (변환이 필요 없으면 None)
+    if isinstance(field, models.DecimalField):
+        return _decimal_converter(field.decimal_places)
+    if isinstance(field, models.DateTimeField):
+        return _datetime_to_str
+    if isinstance(field, models.DateField):
+        return _date_to_str
+    return None
+
+
+class FastReadSerializer:
+    """
+    values() 기반 읽기 전용 직렬화 기본 클래스
+
+    - model: 대상 모델
+    - fields: 응답 키 순서 (대응하는 DRF 시리얼라이저의 Meta.fields와 같게 유지)
+    - sources: 응답 키 → values() 경로가 다른 경우 ({"account_name": "account__name"})
+    - extra_fields: values()로 읽지 않고 serialize_rows 전에 row에 직접 채우는 키 (중첩 목록 등)
+    변환 함수는 클래스마다 처음 쓸 때 한 번만 만듦
+    """
+
+    model = None
+    fields = ()
+    sources = {}
+    extra_fields = ()
+
+    _compiled = None
+
+    @classmethod
+    def _resolve_field(cls, path):
+        model = cls.model
+        *relations, name = path.split("__")
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    @classmethod
+    def compile(cls):
+        if cls.__dict__.get("_compiled") is None:
+            compiled = []
+            for key in cls.fields:
+                if key in cls.extra_fields:
+                    compiled.append((key, key, None))
+                    continue
+                source = cls.sources.get(key, key)
+                compiled.append((key, source, converter_for(cls._resolve_field(source))))
+            cls._compiled = tuple(compiled)
+        return cls._compiled
+
+    @classmethod
+    def value_names(cls):
+        return [source for key, source, _ in cls.compile() if key not in cls.extra_fields]
+
+    @classmethod
+    def values(cls, queryset):
+        # 응답에 필요한 컬럼만 dict로 읽는 queryset (select/prefetch_related는 필요 없음)
+        return queryset.select_related(None).prefetch_related(None).values(*cls.value_names())
+
+    @classmethod
+    def serialize_rows(cls, rows):
+        compiled = cls.compile()
+        return [
+            {
+                key: convert(row[source]) if convert else row[source]
+                for key, source, convert in compiled
+            }
+            for row in rows
+        ]
+
+    @classmethod
+    def serialize(cls, queryset):
+        return cls.serialize_rows(cls.values(queryset))
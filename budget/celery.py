@@ -18,6 +18,10 @@ app.conf.beat_schedule = {
         "task": "apps.analysis.tasks.run_monthly_income_analysis",
         "schedule": crontab(day_of_month=1, hour=10, minute=0),
     },
+    "evict-analysis-images": {
+        "task": "apps.analysis.tasks.evict_analysis_images",
+        "schedule": crontab(hour=4, minute=0),
+    },
 }
 
 
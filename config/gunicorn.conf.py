@@ -0,0 +1,54 @@
+"""
+운영 서빙 설정 (gunicorn -c config/gunicorn.conf.py)
+
+SERVER_MODE로 워커 종류를 고름:
+- gthread (기본): WSGI(config.wsgi) + 워커당 GUNICORN_THREADS개 스레드.
+  느린 요청(큰 거래 목록, 차트 다운로드)이 워커 하나를 통째로 막지 않음
+- asgi: ASGI(config.asgi) + uvicorn 워커. 동기 뷰는 요청마다 별도 스레드에서 실행됨.
+  요청 스레드가 매번 바뀌므로 지속 연결 대신 DB 커넥션 풀(DB_POOL=1)을 기본으로 사용
+- sync: 기존 동기 워커 (요청 1개 = 워커 1개)
+
+워커 수는 CPU 수에서 계산 (GUNICORN_WORKERS로 덮어쓰기 가능)
+- sync: 2 × CPU + 1 / gthread, asgi: CPU + 1 (스레드·이벤트 루프가 동시성을 담당)
+"""
+
+import multiprocessing
+import os
+
+SERVER_MODE = os.getenv("SERVER_MODE", "gthread")
+if SERVER_MODE not in ("gthread", "asgi", "sync"):
+    raise RuntimeError(f"SERVER_MODE는 gthread/asgi/sync 중 하나여야 합니다: {SERVER_MODE}")
+
+cpus = multiprocessing.cpu_count()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(
+    os.getenv("GUNICORN_WORKERS", str(2 * cpus + 1 if SERVER_MODE == "sync" else cpus + 1))
+)
+threads = int(os.getenv("GUNICORN_THREADS", "1" if SERVER_MODE == "sync" else "4"))
+
+if SERVER_MODE == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+    # 워커당 동시에 DB를 쓰는 요청 수 상한 = 풀 크기 (넘으면 DB_POOL_TIMEOUT까지 대기)
+    os.environ.setdefault("DB_POOL", "1")
+    # 풀을 끄더라도 스레드별 지속 연결이 쌓이지 않도록 요청마다 닫음
+    os.environ.setdefault("DB_CONN_MAX_AGE", "0")
+else:
+    wsgi_app = "config.wsgi:application"
+    worker_class = "gthread" if SERVER_MODE == "gthread" else "sync"
+
+# Django 설정(DB 풀 크기 계산)이 같은 값을 보도록 워커 프로세스에 넘김
+os.environ["GUNICORN_WORKERS"] = str(workers)
+os.environ["GUNICORN_THREADS"] = str(threads)
+
+# 메모리 누수/단편화 대비: 요청 N건마다 워커 재시작, 모든 워커가 동시에 재시작하지 않도록 jitter
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", str(max_requests // 10)))
+# 재시작/배포 시 처리 중인 요청을 마칠 때까지 기다리는 시간(초)
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# 빈 값이면 접근 로그 끔 (부하 테스트 등)
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-") or None
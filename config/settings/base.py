@@ -175,6 +175,19 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": ("apps.core.auth.OptionalBearerJWTAuthentication",),
 }
 
+# 1이면 orjson 기반 JSON 렌더러/파서 사용 (응답 바이트는 DRF 기본과 동일, orjson 미설치 시 기본 동작)
+API_FAST_JSON = os.getenv("API_FAST_JSON", "1") == "1"
+if API_FAST_JSON:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "apps.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        "apps.core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),  # Token 유효기간
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -187,6 +200,64 @@ SPECTACULAR_SETTINGS = {
     "VERSION": "1.0.0",
 }
 
+# cache
+# CACHE_URL(redis://...)이 있으면 Redis, 없으면 프로세스 로컬 메모리
+CACHE_URL = os.getenv("CACHE_URL", "")
+# 같은 Redis를 여러 환경(dev/prod)이 함께 써도 키가 섞이지 않도록 환경별 접두사
+CACHE_KEY_PREFIX = os.getenv(
+    "CACHE_KEY_PREFIX",
+    "budget-" + os.getenv("DJANGO_SETTINGS_MODULE", "config.settings.dev").rsplit(".", 1)[-1],
+)
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": CACHE_KEY_PREFIX,
+            "OPTIONS": {
+                # 스레드별 캐시 객체가 프로세스당 풀 하나를 같이 씀 (apps/utils/cache.py)
+                "pool_class": "apps.utils.cache.SharedConnectionPool",
+                # 프로세스당 최대 연결 수, 다 쓰고 있으면 timeout초 동안 빈 연결 대기
+                "max_connections": int(os.getenv("CACHE_MAX_CONNECTIONS", "20")),
+                "timeout": float(os.getenv("CACHE_POOL_TIMEOUT", "2")),
+                "socket_connect_timeout": 1,
+                "socket_timeout": 1,
+                "retry_on_timeout": True,
+                "health_check_interval": 30,
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "KEY_PREFIX": CACHE_KEY_PREFIX,
+        }
+    }
+# 모든 웹 워커/Celery 프로세스가 같은 캐시를 보는지 (로컬 메모리 캐시는 프로세스마다 따로임)
+# 쓰기 쪽에서 값을 갱신/무효화하는 캐시(응답 캐시 버전, 읽지 않은 알림 카운터 등)는 공유 캐시일 때만 사용
+CACHE_SHARED = bool(CACHE_URL)
+# 사용자별 목록 응답 캐시 유지 시간(초). 0이면 응답 캐시/ETag 사용 안 함
+# 로컬 메모리 캐시에서는 다른 워커의 쓰기가 버전을 올리지 못해 오래된 응답이 나가므로 기본값 0
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300" if CACHE_SHARED else "0"))
+# 사용자별 읽지 않은 알림 개수 캐시 유지 시간(초). 만료되면 다음 조회 때 다시 셈 (카운터 어긋남 자동 보정)
+NOTIFICATION_UNREAD_COUNT_TIMEOUT = int(os.getenv("NOTIFICATION_UNREAD_COUNT_TIMEOUT", "600"))
+
+# 실시간 알림 스트림 (SSE, GET /api/notifications/stream/)
+# 프로세스 간 알림 전달용 Redis pub/sub URL. 비우면 같은 프로세스에서 생긴 알림만 전달됨
+NOTIFICATION_PUBSUB_URL = os.getenv("NOTIFICATION_PUBSUB_URL", CACHE_URL)
+NOTIFICATION_PUBSUB_CHANNEL = f"{CACHE_KEY_PREFIX}:notifications"
+# 연결이 조용할 때 보내는 heartbeat 간격(초). 끊긴 연결은 heartbeat 전송 실패로 정리됨
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = int(
+    os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", "15")
+)
+# 연결 최대 유지 시간(초). 지나면 닫고 클라이언트가 Last-Event-ID로 재접속 (0이면 제한 없음)
+NOTIFICATION_STREAM_MAX_SECONDS = int(os.getenv("NOTIFICATION_STREAM_MAX_SECONDS", "600"))
+# 연결당 대기 알림 수 상한. 넘치면 resync 이벤트를 보내고 연결을 닫음
+NOTIFICATION_STREAM_QUEUE_SIZE = int(os.getenv("NOTIFICATION_STREAM_QUEUE_SIZE", "100"))
+# 재접속 시 Last-Event-ID 이후 밀린 알림을 DB에서 다시 보내는 최대 건수
+NOTIFICATION_STREAM_REPLAY_LIMIT = int(os.getenv("NOTIFICATION_STREAM_REPLAY_LIMIT", "50"))
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "django-db")
@@ -195,10 +266,60 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 
+# analysis
+# 주간/월간 배치 분석을 나눠 보낼 사용자 청크 크기 (청크 1개 = Celery 태스크 1개)
+ANALYSIS_FANOUT_CHUNK_SIZE = int(os.getenv("ANALYSIS_FANOUT_CHUNK_SIZE", "200"))
+# 청크의 Analysis/Notification을 모아서 bulk_create (0이면 사용자마다 create + post_save 알림)
+ANALYSIS_BULK_WRITE = os.getenv("ANALYSIS_BULK_WRITE", "1") == "1"
+# 차트 렌더링 전용 프로세스 수 (0이면 호출한 프로세스에서 직접 렌더링)
+ANALYSIS_RENDER_WORKERS = int(os.getenv("ANALYSIS_RENDER_WORKERS", "2"))
+# analysis_images 디렉터리 크기 한도. 넘으면 참조되지 않는 차트 이미지부터 정리
+ANALYSIS_IMAGE_CACHE_MAX_BYTES = int(
+    os.getenv("ANALYSIS_IMAGE_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+)
+
+# transaction
+# 거래 일괄 등록(import) 1회 요청의 최대 행 수
+TRANSACTION_IMPORT_MAX_ROWS = int(os.getenv("TRANSACTION_IMPORT_MAX_ROWS", "10000"))
+
 # bubget
 BUDGET_ALERT_DEDUP_MINUTES = 5
+# 1이면 거래 저장 요청에서 알림 평가를 떼어내 Celery 태스크로 모아서 처리
+# 사용자별 배치 윈도우를 cache.add로 판정하므로 공유 캐시(CACHE_URL)가 필요함 (없으면 budget.W001 경고)
+BUDGET_ALERT_ASYNC = os.getenv("BUDGET_ALERT_ASYNC", "0") == "1"
+# 같은 사용자의 거래 이벤트를 한 태스크로 합치는 대기 시간(초)
+BUDGET_ALERT_BATCH_WINDOW_SECONDS = int(os.getenv("BUDGET_ALERT_BATCH_WINDOW_SECONDS", "5"))
 
 # database
 DB_SSLMODE = os.getenv("DB_SSLMODE", "disable")
 # 운영환경에서는 DB_SSLMODE=require 로 세팅
 DATABASES["default"]["OPTIONS"] = {"sslmode": DB_SSLMODE}
+
+# DB 연결 재사용
+# - 기본: 지속 연결. 요청이 끝나도 DB_CONN_MAX_AGE초 동안 연결(SSL 핸드셰이크 포함)을 유지하고
+#   요청 시작 시 CONN_HEALTH_CHECKS로 끊긴 연결을 걸러냄
+# - DB_POOL=1: psycopg3 커넥션 풀 (Django OPTIONS["pool"]). 프로세스당 풀 하나를 스레드가 나눠 씀
+# 필요한 Postgres 연결 수(max_connections 안쪽으로 맞출 것):
+#   GUNICORN_WORKERS × GUNICORN_THREADS + CELERY_WORKER_CONCURRENCY (+ beat/관리 명령)
+#   Celery prefork 자식은 태스크를 하나씩 처리하므로 프로세스당 연결 1개만 사용
+#   (gunicorn으로 띄우면 config/gunicorn.conf.py가 실제 워커/스레드 수를 환경 변수로 넘겨줌)
+GUNICORN_WORKERS = int(os.getenv("GUNICORN_WORKERS", "2"))
+GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", "1"))
+CELERY_WORKER_CONCURRENCY = int(os.getenv("CELERY_WORKER_CONCURRENCY", str(os.cpu_count() or 1)))
+
+DB_POOL = os.getenv("DB_POOL", "0") == "1"
+if DB_POOL:
+    # 풀과 지속 연결은 함께 쓸 수 없음 (Django 제약)
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+        # 워커 프로세스 안에서 동시에 DB를 쓰는 건 스레드 수만큼
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", str(max(GUNICORN_THREADS, 1)))),
+        # 빈 연결을 기다리는 최대 시간(초), 넘으면 PoolTimeout
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        # 오래 쉬는 연결은 min_size까지 정리
+        "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
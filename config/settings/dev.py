@@ -18,6 +18,14 @@ if not TESTING:
         "debug_toolbar.middleware.DebugToolbarMiddleware",
     ] + MIDDLEWARE  # noqa: F405
 
+# 테스트는 CACHE_URL과 관계없이 로컬 메모리 캐시 사용 (알림 스트림도 프로세스 안에서만 전달)
+# 공유 캐시가 필요한 기능(응답 캐시 등)은 테스트에서 override_settings로 직접 켬
+if TESTING:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    CACHE_SHARED = False
+    RESPONSE_CACHE_TIMEOUT = 0
+    NOTIFICATION_PUBSUB_URL = ""
+
 # django-debug-toolbar를 표시할 IP 주소 설정
 INTERNAL_IPS = [
     "127.0.0.1",
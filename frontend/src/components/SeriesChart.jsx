@@ -0,0 +1,125 @@
+const WIDTH = 600;
+const HEIGHT = 320;
+const PADDING = { top: 24, right: 16, bottom: 56, left: 64 };
+const PIE_COLORS = ["#ff8fb1", "#8fc7ff", "#ffd28f", "#9be3b5", "#c6a8ff", "#ffb38f"];
+
+const formatNumber = (value) => Number(value).toLocaleString("ko-KR");
+
+function PieChart({ labels, values }) {
+  const total = values.reduce((sum, value) => sum + value, 0) || 1;
+  const cx = WIDTH / 2;
+  const cy = HEIGHT / 2;
+  const radius = HEIGHT / 2 - 24;
+  let angle = -Math.PI / 2;
+
+  return labels.map((label, index) => {
+    const slice = (values[index] / total) * Math.PI * 2;
+    const start = angle;
+    angle += slice;
+    const large = slice > Math.PI ? 1 : 0;
+    const x1 = cx + radius * Math.cos(start);
+    const y1 = cy + radius * Math.sin(start);
+    const x2 = cx + radius * Math.cos(angle);
+    const y2 = cy + radius * Math.sin(angle);
+    const mid = start + slice / 2;
+    const path =
+      values.length === 1
+        ? `M ${cx - radius} ${cy} a ${radius} ${radius} 0 1 0 ${radius * 2} 0 a ${radius} ${radius} 0 1 0 ${-radius * 2} 0`
+        : `M ${cx} ${cy} L ${x1} ${y1} A ${radius} ${radius} 0 ${large} 1 ${x2} ${y2} Z`;
+    return (
+      <g key={label}>
+        <path d={path} fill={PIE_COLORS[index % PIE_COLORS.length]} />
+        <text
+          x={cx + (radius + 12) * Math.cos(mid)}
+          y={cy + (radius + 12) * Math.sin(mid)}
+          fontSize="12"
+          textAnchor={Math.cos(mid) >= 0 ? "start" : "end"}
+        >
+          {label} ({((values[index] / total) * 100).toFixed(1)}%)
+        </text>
+      </g>
+    );
+  });
+}
+
+// 서버가 내려준 집계 시리즈(result_data)를 SVG로 직접 그리는 차트
+export default function SeriesChart({ data }) {
+  if (!data || !data.x?.length) {
+    return <div className="empty">표시할 데이터가 없어요.</div>;
+  }
+
+  const labels = data.x;
+  const values = data.y.map(Number);
+
+  if (data.kind === "pie") {
+    return (
+      <svg viewBox={`0 0 ${WIDTH} ${HEIGHT}`} role="img" aria-label={data.title}>
+        <PieChart labels={labels} values={values} />
+      </svg>
+    );
+  }
+
+  const innerWidth = WIDTH - PADDING.left - PADDING.right;
+  const innerHeight = HEIGHT - PADDING.top - PADDING.bottom;
+  const max = Math.max(...values, 0) || 1;
+  const step = innerWidth / labels.length;
+  const xAt = (index) => PADDING.left + step * index + step / 2;
+  const yAt = (value) => PADDING.top + innerHeight - (value / max) * innerHeight;
+  const color = data.color || "#ff8fb1";
+
+  return (
+    <svg viewBox={`0 0 ${WIDTH} ${HEIGHT}`} role="img" aria-label={data.title}>
+      <line
+        x1={PADDING.left}
+        y1={PADDING.top + innerHeight}
+        x2={WIDTH - PADDING.right}
+        y2={PADDING.top + innerHeight}
+        stroke="#ccc"
+      />
+      <text x={PADDING.left - 8} y={PADDING.top + 4} fontSize="11" textAnchor="end">
+        {formatNumber(max)}
+      </text>
+      {data.kind === "line" ? (
+        <>
+          <polyline
+            fill="none"
+            stroke={color}
+            strokeWidth="2"
+            points={values.map((value, index) => `${xAt(index)},${yAt(value)}`).join(" ")}
+          />
+          {values.map((value, index) => (
+            <circle key={labels[index]} cx={xAt(index)} cy={yAt(value)} r="3" fill={color}>
+              <title>{`${labels[index]}: ${formatNumber(value)}`}</title>
+            </circle>
+          ))}
+        </>
+      ) : (
+        values.map((value, index) => (
+          <rect
+            key={labels[index]}
+            x={xAt(index) - step * 0.35}
+            y={yAt(value)}
+            width={step * 0.7}
+            height={PADDING.top + innerHeight - yAt(value)}
+            fill={color}
+            opacity="0.7"
+          >
+            <title>{`${labels[index]}: ${formatNumber(value)}`}</title>
+          </rect>
+        ))
+      )}
+      {labels.map((label, index) => (
+        <text
+          key={label}
+          x={xAt(index)}
+          y={PADDING.top + innerHeight + 14}
+          fontSize="10"
+          textAnchor="end"
+          transform={`rotate(-45 ${xAt(index)} ${PADDING.top + innerHeight + 14})`}
+        >
+          {label}
+        </text>
+      ))}
+    </svg>
+  );
+}
@@ -1,6 +1,7 @@
 import { useEffect, useState } from "react";
 
 import { apiFetch, apiOrigin, buildQuery } from "../api.js";
+import SeriesChart from "../components/SeriesChart.jsx";
 
 export default function AnalysisPage() {
   const [analyses, setAnalyses] = useState([]);
@@ -13,6 +14,7 @@ export default function AnalysisPage() {
     type: "weekly",
     period_start: "",
     period_end: "",
+    output: "png",
   });
 
   const fetchAnalyses = async () => {
@@ -100,6 +102,12 @@ export default function AnalysisPage() {
               method: "POST",
               body: runForm,
             });
+            if (!data.task_id) {
+              // output=json은 비동기 작업 없이 바로 결과가 내려옴
+              setMessage("분석 완료! 차트를 바로 확인하세요.");
+              fetchAnalyses();
+              return;
+            }
             setTaskId(data.task_id);
             setTaskStatus("PENDING");
             setMessage(`분석 요청 완료! 작업 ID: ${data.task_id}`);
@@ -149,6 +157,17 @@ export default function AnalysisPage() {
             required
           />
         </label>
+        <label>
+          결과 형식
+          <select
+            value={runForm.output}
+            onChange={(event) => setRunForm({ ...runForm, output: event.target.value })}
+          >
+            <option value="png">이미지 (PNG)</option>
+            <option value="svg">벡터 이미지 (SVG)</option>
+            <option value="json">바로 보기 (JSON)</option>
+          </select>
+        </label>
         <button type="submit">분석 요청</button>
         {taskId && (
           <div className="hint">
@@ -184,8 +203,10 @@ export default function AnalysisPage() {
                 삭제
               </button>
             </div>
-            {analysis.result_image && (
+            {analysis.result_image ? (
               <img src={resolveImage(analysis.result_image)} alt="분석 그래프" />
+            ) : (
+              analysis.result_data && <SeriesChart data={analysis.result_data} />
             )}
           </article>
         ))}
@@ -13,6 +13,7 @@ const initialForm = {
 
 export default function TransactionsPage() {
   const [transactions, setTransactions] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [accounts, setAccounts] = useState([]);
   const [tags, setTags] = useState([]);
   const [categories, setCategories] = useState([]);
@@ -44,11 +45,14 @@ export default function TransactionsPage() {
     }
   };
 
-  const fetchTransactions = async () => {
+  const cursorFromLink = (link) => (link ? new URL(link).searchParams.get("cursor") : null);
+
+  const fetchTransactions = async (cursor = null) => {
     try {
-      const query = new URLSearchParams(cleanPayload(filters)).toString();
+      const query = new URLSearchParams(cleanPayload({ ...filters, ...(cursor ? { cursor } : {}) })).toString();
       const data = await apiFetch(`/transactions/${query ? `?${query}` : ""}`);
-      setTransactions(data);
+      setTransactions((prev) => (cursor ? [...prev, ...data.results] : data.results));
+      setNextCursor(cursorFromLink(data.next));
     } catch (error) {
       setMessage(`거래 불러오기 실패: ${error.message}`);
     }
@@ -220,7 +224,7 @@ export default function TransactionsPage() {
             value={filters.end_date}
             onChange={(event) => setFilters({ ...filters, end_date: event.target.value })}
           />
-          <button type="button" onClick={fetchTransactions}>
+          <button type="button" onClick={() => fetchTransactions()}>
             적용하기
           </button>
         </div>
@@ -253,6 +257,11 @@ export default function TransactionsPage() {
             ))}
             {!transactions.length && <li className="empty">거래가 아직 없어요.</li>}
           </ul>
+          {nextCursor && (
+            <button className="ghost" type="button" onClick={() => fetchTransactions(nextCursor)}>
+              더 보기
+            </button>
+          )}
         </div>
 
         <form className="card form" onSubmit={handleSubmit}>
@@ -0,0 +1,157 @@
+"""
+예산 알림 중복 확인 비교: 메시지 문자열 조회(기존) vs dedup_key 유니크 인덱스 INSERT
+
+사용자 알림을 --notifications건 만든 뒤
+1) 이미 보낸 알림을 다시 보낼 때 중복 확인 지연
+   (기존: user+message+created_at 조회 / 신규: 캐시 윈도우(cache.add), 캐시 표시가 없을 때 INSERT 충돌)
+2) 스레드 --threads개가 같은 알림을 동시에 보낼 때 실제로 저장된 건수
+를 비교. 기존 방식은 조회와 저장 사이에 다른 스레드가 끼어들 수 있어 여러 건이 저장될 수 있음.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_alert_dedup.py --notifications 50000 --threads 8
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def legacy_send(Notification, user_id, message, dedup_minutes):
+    # 변경 전 send_budget_alert의 중복 확인 방식
+    from django.utils import timezone
+
+    since = timezone.now() - timedelta(minutes=dedup_minutes)
+    if Notification.objects.filter(
+        user_id=user_id, message=message, created_at__gte=since
+    ).exists():
+        return None
+    return Notification.objects.create(user_id=user_id, message=message)
+
+
+def race(threads, send):
+    from django.db import connection
+
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        try:
+            send()
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notifications", type=int, default=50000, help="사용자 알림 수")
+    parser.add_argument("--requests", type=int, default=200, help="중복 확인 반복 횟수")
+    parser.add_argument("--threads", type=int, default=8, help="동시 전송 스레드 수")
+    parser.add_argument("--rounds", type=int, default=10, help="동시 전송 반복 횟수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from django.core.cache import cache
+
+    from apps.budget.models import ThresholdType
+    from apps.members.models import User
+    from apps.notification.models import Notification
+    from apps.notification.services import (
+        _budget_alert_message,
+        _budget_alert_sent_key,
+        send_budget_alert,
+    )
+
+    user = User.objects.create_user(
+        email=f"bench-alert-dedup-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    dedup_minutes = settings.BUDGET_ALERT_DEDUP_MINUTES
+    payload = {
+        "user_id": user.id,
+        "budget_name": "벤치 예산",
+        "spent": Decimal("850"),
+        "budget_limit": Decimal("1000"),
+        "threshold_type": ThresholdType.PERCENT,
+        "threshold_value": Decimal("80"),
+    }
+    message = _budget_alert_message(
+        payload["budget_name"],
+        payload["spent"],
+        payload["budget_limit"],
+        payload["threshold_type"],
+        payload["threshold_value"],
+    )
+    try:
+        Notification.objects.bulk_create(
+            (Notification(user=user, message=f"{message} #{i}") for i in range(args.notifications)),
+            batch_size=5000,
+        )
+        legacy_send(Notification, user.id, message, dedup_minutes)
+        send_budget_alert(budget_id=1, rule_id=1, **payload)
+        print(f"notifications={args.notifications} dedup_minutes={dedup_minutes}")
+
+        for label, send in (
+            (
+                "legacy message lookup",
+                lambda: legacy_send(Notification, user.id, message, dedup_minutes),
+            ),
+            ("cache window", lambda: send_budget_alert(budget_id=1, rule_id=1, **payload)),
+            (
+                # 다른 워커처럼 캐시 표시가 없을 때: 유니크 인덱스 INSERT 충돌로 걸러짐
+                "dedup_key insert",
+                lambda: (
+                    cache.delete(_budget_alert_sent_key(user.id, 1, 1)),
+                    send_budget_alert(budget_id=1, rule_id=1, **payload),
+                )[1],
+            ),
+        ):
+            timings = []
+            for _ in range(args.requests):
+                started = time.perf_counter()
+                if send() is not None:
+                    raise SystemExit(f"{label}: 중복 알림이 저장됨")
+                timings.append((time.perf_counter() - started) * 1000)
+            print(f"{label:<22} duplicate check p50={statistics.median(timings):6.2f}ms")
+
+        legacy_saved = new_saved = 0
+        for round_no in range(args.rounds):
+            round_message = f"{message} race {round_no}"
+            race(
+                args.threads,
+                lambda: legacy_send(Notification, user.id, round_message, dedup_minutes),
+            )
+            legacy_saved += Notification.objects.filter(user=user, message=round_message).count()
+            before = Notification.objects.filter(user=user).count()
+            race(
+                args.threads,
+                lambda: send_budget_alert(budget_id=2, rule_id=100 + round_no, **payload),
+            )
+            new_saved += Notification.objects.filter(user=user).count() - before
+        print(
+            f"{args.threads} concurrent sends x {args.rounds} rounds: "
+            f"legacy saved={legacy_saved} dedup_key saved={new_saved} (expected {args.rounds})"
+        )
+    finally:
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+배치 분석 저장 단계 비교: 사용자마다 Analysis.create + post_save 알림(기존) vs 청크 bulk_create
+
+--users명의 분석 결과(렌더링이 끝난 상태)를 만들어 두고 저장 단계만 측정.
+기존 방식은 사용자마다 INSERT 2번(Analysis, 시그널의 Notification)과 커밋 2번이 나감.
+bulk 방식은 run_analysis_chunk가 쓰는 _bulk_write_analyses로 트랜잭션 하나에서 INSERT 2번.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_analysis_bulk_write.py --users 200 --rounds 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200, help="청크 사용자 수")
+    parser.add_argument("--rounds", type=int, default=5, help="방식별 반복 횟수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+
+    from apps.analysis.models import Analysis
+    from apps.analysis.tasks import _bulk_write_analyses
+    from apps.members.models import User
+    from apps.notification.models import Notification
+
+    stamp = int(time.time())
+    users = User.objects.bulk_create(
+        User(email=f"bench-analysis-write-{stamp}-{i}@example.com", name="Bench")
+        for i in range(args.users)
+    )
+    today = timezone.localdate()
+
+    def build():
+        # finish_analysis 직전 상태 (렌더링 끝난 저장 전 레코드)
+        return [
+            Analysis(
+                user=user,
+                about="total_expense",
+                type="weekly",
+                period_start=today,
+                period_end=today,
+                description="총 지출: 1,000원",
+                result_data={"kind": "line", "x": [str(today)], "y": [1000.0]},
+                output="json",
+                fingerprint=f"bench-{user.id}",
+            )
+            for user in users
+        ]
+
+    def per_row(analyses):
+        for analysis in analyses:
+            analysis.save()
+
+    try:
+        print(f"users={args.users} rounds={args.rounds}")
+        for label, write in (("per-user create", per_row), ("bulk_create", _bulk_write_analyses)):
+            timings = []
+            for _ in range(args.rounds):
+                analyses = build()
+                with CaptureQueriesContext(connection) as ctx:
+                    started = time.perf_counter()
+                    write(analyses)
+                    timings.append((time.perf_counter() - started) * 1000)
+                saved = Notification.objects.filter(user__in=users).count()
+                assert saved == args.users, saved
+                Analysis.all_objects.filter(user__in=users).delete()
+                Notification.all_objects.filter(user__in=users).delete()
+            print(
+                f"{label:<16} p50={statistics.median(timings):8.1f}ms "
+                f"({statistics.median(timings) / args.users:.3f}ms/user) "
+                f"queries={len(ctx.captured_queries)}"
+            )
+    finally:
+        User.objects.filter(id__in=[user.id for user in users]).delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Analyzer 집계 경로 비교: 거래 행 전체를 pandas로 가져와 groupby vs DB GROUP BY 결과만 가져오기
+
+사용 예 (1년치 합성 거래를 단계적으로 늘려가며 측정, 측정 후 벤치 사용자 삭제):
+    uv run python scripts/benchmarks/bench_analyzer.py --sizes 10000,100000,1000000 --memory
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+METHODS = ["card", "cash", "transfer", "식비", "교통", "쇼핑"]
+BATCH_SIZE = 10000
+
+
+def measure(func, trace_memory):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    if not trace_memory:
+        return result, elapsed, None
+
+    # tracemalloc은 실행 시간을 크게 늘리므로 시간 측정과 분리해서 한 번 더 실행
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / (1024 * 1024)
+
+
+def format_memory(mib):
+    return "-" if mib is None else f"{mib:.2f}MiB"
+
+
+def rows_dataframe(transactions):
+    # 비교 기준: 거래 1건 = 1행 DataFrame (pandas groupby 전에 모든 행을 가져옴)
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {
+                "date": transaction.occurred_at.date(),
+                "amount": transaction.amount,
+                "direction": transaction.direction,
+                "method": transaction.method,
+                "description": transaction.description,
+                "account_name": transaction.account.name,
+                "balance_after": transaction.balance_after,
+            }
+            for transaction in transactions
+        ]
+    )
+
+
+def insert_transactions(accounts, count, start):
+    from apps.transaction.models import Transaction
+
+    # 시그널(예산 카운터)을 거치지 않도록 bulk_create로 직접 적재
+    rng = random.Random(count)
+    inserted = 0
+    while inserted < count:
+        size = min(BATCH_SIZE, count - inserted)
+        Transaction.objects.bulk_create(
+            Transaction(
+                account=rng.choice(accounts),
+                amount=Decimal(rng.randint(1000, 200000)),
+                balance_after=Decimal(rng.randint(0, 5000000)),
+                direction="expense" if rng.random() < 0.8 else "income",
+                method=rng.choice(METHODS),
+                description="bench",
+                occurred_at=start + timedelta(seconds=rng.randint(0, 364 * 24 * 3600)),
+            )
+            for _ in range(size)
+        )
+        inserted += size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="누적 거래 수 목록")
+    parser.add_argument(
+        "--analysis-type",
+        default="category_expense",
+        choices=["total_expense", "total_income", "category_expense", "account_balance"],
+    )
+    parser.add_argument("--memory", action="store_true", help="tracemalloc 최대 메모리도 측정")
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.utils import timezone
+
+    from apps.analysis.analyzers import Analyzer
+    from apps.bank_account.models import Account
+    from apps.members.models import User
+    from apps.transaction.models import Transaction
+
+    user = User.objects.create_user(
+        email=f"bench-analyzer-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        accounts = [
+            Account.objects.create(user=user, name=f"bench-{i}", source_type="bank", balance=0)
+            for i in range(3)
+        ]
+        end_date = timezone.localdate()
+        start_date = end_date - timedelta(days=364)
+        start = timezone.make_aware(datetime.combine(start_date, datetime.min.time()))
+        analyzer = Analyzer(user)
+
+        def row_path():
+            df = rows_dataframe(analyzer.get_transactions_in_period(start_date, end_date))
+            expense = df[df["direction"] == "expense"]
+            return expense.groupby("method")["amount"].sum().reset_index()
+
+        def aggregated_path():
+            return analyzer.create_aggregated_dataframe(args.analysis_type, start_date, end_date)
+
+        print(f"analysis_type={args.analysis_type} (row path는 category_expense 기준 groupby)")
+        total = 0
+        for size in sizes:
+            insert_transactions(accounts, size - total, start)
+            total = size
+
+            row_df, row_time, row_mem = measure(row_path, args.memory)
+            agg_df, agg_time, agg_mem = measure(aggregated_path, args.memory)
+            print(
+                f"n={size:>8,}  rows: {row_time:7.2f}s {format_memory(row_mem):>10} ({len(row_df)} rows)  "
+                f"aggregated: {agg_time:7.3f}s {format_memory(agg_mem):>8} ({len(agg_df)} rows)  "
+                f"speedup x{row_time / agg_time:,.0f}"
+            )
+    finally:
+        Transaction.all_objects.filter(account__user=user).delete()
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+거래 생성 API 지연 시간 비교: 예산 알림 동기 평가 vs Celery 배치 평가
+
+사용 예 (워커 없이 in-memory 브로커로 enqueue 비용만 측정):
+    CELERY_BROKER_URL=memory:// uv run python scripts/benchmarks/bench_budget_alerts.py --requests 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_requests(client, url, account_id, count):
+    from django.utils import timezone
+
+    occurred_at = timezone.make_aware(datetime.combine(date.today(), datetime.min.time()))
+    payload = {
+        "account": account_id,
+        "amount": "1.00",
+        "direction": "expense",
+        "method": "card",
+        "description": "bench",
+        "occurred_at": occurred_at.isoformat(),
+    }
+    timings = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = client.post(url, payload, format="json")
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 201:
+            raise SystemExit(f"거래 생성 실패: {response.status_code} {response.data}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100, help="모드별 요청 수")
+    parser.add_argument("--budgets", type=int, default=5, help="벤치 사용자 예산 수")
+    parser.add_argument("--rules", type=int, default=3, help="예산당 알림 룰 수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from django.utils import timezone
+    from rest_framework.reverse import reverse
+    from rest_framework.test import APIClient
+
+    from apps.bank_account.models import Account
+    from apps.budget.models import Budget, BudgetAlertRule, BudgetScopeType, ThresholdType
+    from apps.members.models import User
+
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    user = User.objects.create_user(
+        email=f"bench-alerts-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        account = Account.objects.create(
+            user=user, name="Bench", source_type="bank", balance=Decimal("0")
+        )
+        today = timezone.localdate()
+        for i in range(args.budgets):
+            budget = Budget.objects.create(
+                user=user,
+                name=f"bench-{i}",
+                period_start=today.replace(day=1),
+                period_end=today,
+                # 한도를 크게 잡아 룰이 울리지 않게 함 → 매 요청마다 전체 평가가 일어남
+                amount_limit=Decimal("1000000000"),
+                scope_type=BudgetScopeType.ALL,
+            )
+            BudgetAlertRule.objects.bulk_create(
+                BudgetAlertRule(
+                    budget=budget,
+                    threshold_type=ThresholdType.PERCENT,
+                    threshold_value=Decimal(50 + j * 10),
+                )
+                for j in range(args.rules)
+            )
+
+        client = APIClient()
+        client.force_authenticate(user)
+        url = reverse("transactions-list")
+
+        for label, async_mode in (("sync", False), ("async", True)):
+            settings.BUDGET_ALERT_ASYNC = async_mode
+            timings = run_requests(client, url, account.id, args.requests)
+            print(
+                f"{label:>5}: n={len(timings)} "
+                f"mean={statistics.mean(timings):.2f}ms "
+                f"p50={percentile(timings, 50):.2f}ms "
+                f"p95={percentile(timings, 95):.2f}ms"
+            )
+    finally:
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+캐시 스탬피드 비교: 단순 get → 계산 → set vs single-flight get_or_set
+
+같은 키가 만료된 순간 스레드 N개가 동시에 조회하는 상황을 만들고, 값 계산(producer) 호출 수와
+전체 소요 시간을 비교. 캐시는 설정된 백엔드를 그대로 사용 (CACHE_URL이 있으면 Redis).
+
+사용 예:
+    uv run python scripts/benchmarks/bench_cache.py --threads 32 --cost-ms 200
+    CACHE_URL=redis://localhost:6379/1 uv run python scripts/benchmarks/bench_cache.py
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def stampede(threads, fetch):
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        fetch()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--cost-ms", type=int, default=200, help="값 계산 1회 비용(ms)")
+    parser.add_argument("--rounds", type=int, default=5, help="만료 → 동시 조회 반복 횟수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from django.core.cache import cache
+
+    from apps.utils.cache import cache_stats, get_or_set
+
+    calls = {"count": 0}
+    calls_lock = threading.Lock()
+
+    def producer():
+        with calls_lock:
+            calls["count"] += 1
+        time.sleep(args.cost_ms / 1000)
+        return {"total": 42}
+
+    def naive():
+        value = cache.get("bench:cache:naive")
+        if value is None:
+            value = producer()
+            cache.set("bench:cache:naive", value, 60)
+        return value
+
+    def single_flight():
+        return get_or_set("bench:cache:flight", producer, 60, namespace="bench")
+
+    print(f"cache backend: {settings.CACHES['default']['BACKEND']}")
+    for label, fetch, key in (
+        ("naive", naive, "bench:cache:naive"),
+        ("single-flight", single_flight, "bench:cache:flight"),
+    ):
+        calls["count"] = 0
+        elapsed = 0.0
+        for _ in range(args.rounds):
+            cache.delete(key)
+            elapsed += stampede(args.threads, fetch)
+        print(
+            f"{label:<14} producer calls={calls['count'] / args.rounds:6.1f}/round "
+            f"elapsed={elapsed / args.rounds * 1000:7.1f}ms/round"
+        )
+    print(f"stats: {cache_stats.snapshot().get('bench')}")
+
+
+if __name__ == "__main__":
+    main()
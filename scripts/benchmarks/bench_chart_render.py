@@ -0,0 +1,102 @@
+"""
+차트 렌더링 처리량(charts/s) 비교
+
+- pyplot: 기존 방식 (전역 pyplot 상태로 plt.figure → savefig → close, 순차 실행)
+- oo-inline: Figure/FigureCanvasAgg 객체 API, 현재 프로세스에서 순차 실행
+- pool: 워밍업된 렌더링 프로세스 풀에 한꺼번에 제출 (--workers 개 동시 렌더링)
+
+사용 예:
+    uv run python scripts/benchmarks/bench_chart_render.py --charts 200 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def make_specs(count):
+    start = date(2026, 1, 1)
+    days = [start + timedelta(days=i) for i in range(30)]
+    return [
+        {
+            "kind": "line",
+            "title": f"총 지출 분석 #{i}",
+            "xlabel": "날짜",
+            "ylabel": "지출 금액",
+            "x": days,
+            "y": [float((i * 7 + d * 13) % 50000) for d in range(len(days))],
+        }
+        for i in range(count)
+    ]
+
+
+def render_pyplot(spec, path):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(spec["x"], spec["y"], marker="o")
+    plt.title(spec["title"])
+    plt.xlabel(spec["xlabel"])
+    plt.ylabel(spec["ylabel"])
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    plt.savefig(path, bbox_inches="tight", dpi=150)
+    plt.close()
+
+
+def report(label, count, elapsed):
+    print(f"{label:>10}: {count} charts in {elapsed:6.2f}s → {count / elapsed:6.1f} charts/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--charts", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+
+    from apps.analysis import rendering
+
+    specs = make_specs(args.charts)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"chart_{i}.png") for i in range(len(specs))]
+
+        started = time.perf_counter()
+        for spec, path in zip(specs, paths):
+            render_pyplot(spec, path)
+        report("pyplot", len(specs), time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for spec, path in zip(specs, paths):
+            rendering.render_to_file(spec, path)
+        report("oo-inline", len(specs), time.perf_counter() - started)
+
+        settings.ANALYSIS_RENDER_WORKERS = args.workers
+        pool = rendering.get_pool()
+        # 풀 워밍업(프로세스 기동 + matplotlib import)은 측정에서 제외
+        for future in [pool.submit(rendering.setup_matplotlib) for _ in range(args.workers)]:
+            future.result()
+
+        started = time.perf_counter()
+        futures = [rendering.submit_render(spec, path) for spec, path in zip(specs, paths)]
+        for future in futures:
+            future.result()
+        report(f"pool x{args.workers}", len(specs), time.perf_counter() - started)
+        rendering.shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
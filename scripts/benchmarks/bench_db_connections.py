@@ -0,0 +1,163 @@
+"""
+DB 연결 재사용 부하 테스트: 요청마다 새 연결 vs 지속 연결(CONN_MAX_AGE) vs psycopg 커넥션 풀
+
+gunicorn 워커처럼 WSGI 앱을 직접 호출하고(request_started/finished 시그널로 연결 정리까지 동일),
+스레드 N개로 GET /api/tags/ 를 반복 요청해서 지연 시간 분포와 처리량을 비교.
+모드마다 설정이 달라야 하므로 모드별로 하위 프로세스를 띄워 측정함.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_db_connections.py --requests 500 --threads 4
+    DB_SSLMODE=require uv run python scripts/benchmarks/bench_db_connections.py
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import django
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+MODES = {
+    "new-conn": {"DB_POOL": "0", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "0", "DB_CONN_MAX_AGE": "60"},
+    "pool": {"DB_POOL": "1"},
+}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_load(user_id, requests, threads):
+    # 하위 프로세스: 설정된 모드로 WSGI 요청을 보내고 결과를 JSON으로 출력
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from django.core.wsgi import get_wsgi_application
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from apps.members.models import User
+
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.MIDDLEWARE = [name for name in settings.MIDDLEWARE if "debug_toolbar" not in name]
+    token = str(AccessToken.for_user(User.objects.get(pk=user_id)))
+    app = get_wsgi_application()
+
+    def call():
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": "/api/tags/",
+            "QUERY_STRING": "",
+            "SERVER_NAME": "bench",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "bench",
+            "HTTP_AUTHORIZATION": f"Bearer {token}",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": io.BytesIO(b""),
+            "wsgi.errors": sys.stderr,
+        }
+        status = []
+        started = time.perf_counter()
+        body = app(environ, lambda code, headers: status.append(code))
+        b"".join(body)
+        body.close()  # WSGI 서버처럼 close → request_finished → 연결 정리
+        elapsed = (time.perf_counter() - started) * 1000
+        if not status[0].startswith("200"):
+            raise SystemExit(f"요청 실패: {status[0]}")
+        return elapsed
+
+    call()  # 워밍업 (URL/앱 로딩)
+    timings = []
+    lock = threading.Lock()
+    per_thread = requests // threads
+
+    def worker():
+        local = [call() for _ in range(per_thread)]
+        with lock:
+            timings.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"timings": timings, "elapsed": elapsed}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500, help="모드별 요청 수")
+    parser.add_argument("--threads", type=int, default=4, help="동시 요청 스레드 수")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--user-id", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_load(args.user_id, args.requests, args.threads)
+        return
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from apps.members.models import User
+    from apps.tag.models import Tag
+
+    user = User.objects.create_user(
+        email=f"bench-db-conn-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        Tag.objects.bulk_create(Tag(user=user, name=f"bench {i}") for i in range(20))
+        print(f"sslmode={os.getenv('DB_SSLMODE', 'disable')} threads={args.threads}")
+        for mode, overrides in MODES.items():
+            env = {
+                **os.environ,
+                **overrides,
+                "GUNICORN_THREADS": str(args.threads),
+                # 응답 캐시가 DB 조회를 가리지 않도록 끔
+                "RESPONSE_CACHE_TIMEOUT": "0",
+            }
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--child",
+                    mode,
+                    "--user-id",
+                    str(user.id),
+                    "--requests",
+                    str(args.requests),
+                    "--threads",
+                    str(args.threads),
+                ],
+                env=env,
+                cwd=ROOT,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            timings = result["timings"]
+            print(
+                f"{mode:<11} p50={statistics.median(timings):6.2f}ms "
+                f"p95={percentile(timings, 95):6.2f}ms "
+                f"throughput={len(timings) / result['elapsed']:7.1f} req/s"
+            )
+    finally:
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
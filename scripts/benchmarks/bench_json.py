@@ -0,0 +1,138 @@
+"""
+JSON 렌더링/파싱 처리량 비교: DRF JSONRenderer/JSONParser vs orjson 기반 FastJSON
+
+거래 목록 응답(TransactionFastReadSerializer 출력)과 일괄 등록 요청 본문을 실제 DB 행으로 만들어 측정.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_json.py --sizes 1000,10000
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def seed(account, tags, count):
+    from django.utils import timezone
+
+    from apps.transaction.models import Transaction
+
+    now = timezone.now()
+    txs = Transaction.objects.bulk_create(
+        Transaction(
+            account=account,
+            amount=Decimal(i % 100000) / 100,
+            balance_after=Decimal(1000000 - i),
+            direction="expense" if i % 4 else "income",
+            method="card",
+            description=f"편의점 결제 {i}",
+            occurred_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    )
+    TransactionTag = Transaction.tags.through
+    TransactionTag.objects.bulk_create(
+        TransactionTag(transaction_id=tx.id, tag_id=tags[i % len(tags)].id)
+        for i, tx in enumerate(txs)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000", help="쉼표로 구분한 거래 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from apps.bank_account.models import Account
+    from apps.core.parsers import FastJSONParser
+    from apps.core.renderers import FastJSONRenderer, orjson
+    from apps.members.models import User
+    from apps.tag.models import Tag
+    from apps.transaction.models import Transaction
+    from apps.transaction.repositories import TransactionRepository
+    from apps.transaction.serializers import TransactionFastReadSerializer
+
+    if orjson is None:
+        raise SystemExit("orjson이 설치되어 있지 않습니다 (uv sync)")
+
+    user = User.objects.create_user(
+        email=f"bench-json-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        account = Account.objects.create(
+            user=user, name="주거래 통장", source_type="bank", balance=Decimal("0")
+        )
+        tags = [Tag.objects.create(user=user, name=name) for name in ("식비", "교통", "고정지출")]
+        seeded = 0
+        for size in (int(value) for value in args.sizes.split(",")):
+            seed(account, tags, size - seeded)
+            seeded = size
+            queryset = TransactionRepository.get_transactions_optimized(user).order_by(
+                "-occurred_at", "-id"
+            )[:size]
+            payload = {"next": None, "previous": None}
+            payload["results"] = TransactionFastReadSerializer.serialize(queryset)
+
+            default_bytes = JSONRenderer().render(payload)
+            fast_bytes = FastJSONRenderer().render(payload)
+            assert default_bytes == fast_bytes, "렌더링 결과가 다릅니다"
+
+            render_default = best_of(lambda: JSONRenderer().render(payload), args.repeat)
+            render_fast = best_of(lambda: FastJSONRenderer().render(payload), args.repeat)
+
+            # 일괄 등록 요청 본문 (JSON 배열) 파싱
+            body = JSONRenderer().render(
+                [
+                    {
+                        "account": row["account"],
+                        "amount": row["amount"],
+                        "direction": row["direction"],
+                        "method": row["method"],
+                        "description": row["description"],
+                        "occurred_at": row["occurred_at"],
+                        "tags": [tag["id"] for tag in row["tags"]],
+                    }
+                    for row in payload["results"]
+                ]
+            )
+            parse_default = best_of(lambda: JSONParser().parse(io.BytesIO(body)), args.repeat)
+            parse_fast = best_of(lambda: FastJSONParser().parse(io.BytesIO(body)), args.repeat)
+
+            print(
+                f"n={size:>6,} payload={len(default_bytes) / 1024:>8,.0f}KiB  "
+                f"render drf={render_default * 1000:7.1f}ms fast={render_fast * 1000:6.1f}ms "
+                f"(x{render_default / render_fast:.1f})  "
+                f"parse drf={parse_default * 1000:7.1f}ms fast={parse_fast * 1000:6.1f}ms "
+                f"(x{parse_default / parse_fast:.1f})"
+            )
+    finally:
+        Transaction.all_objects.filter(account__user=user).delete()
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+실시간 알림 스트림(SSE) 부하 테스트: 프로세스 하나가 유지할 수 있는 유휴 연결 수
+
+config/gunicorn.conf.py로 SERVER_MODE=asgi 워커 1개를 띄우고, --connections개의 SSE 연결을
+--users명에게 나눠 연결한 채로 --hold초 동안 둠. 그 동안
+- 워커 프로세스 RSS / 스레드 수 / 열린 fd 수 (연결 전 대비 연결당 증가량)
+- heartbeat 수신 여부 (연결마다 NOTIFICATION_STREAM_HEARTBEAT_SECONDS 간격)
+- 새 알림 생성(POST /api/notifications/) → 해당 사용자 연결들에 도착하기까지 지연
+을 측정. 알림 전달은 프로세스 내 전달(NOTIFICATION_PUBSUB_URL 비움)로 측정함.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_notification_stream.py --connections 2000 --hold 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import django
+import psutil
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+BENCH_SETTINGS = """
+from config.settings.dev import *  # noqa
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "debug_toolbar"]  # noqa: F405
+MIDDLEWARE = [name for name in MIDDLEWARE if "debug_toolbar" not in name]  # noqa: F405
+"""
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def worker_process(master_pid):
+    children = psutil.Process(master_pid).children()
+    return children[0] if children else None
+
+
+def process_usage(proc):
+    return proc.memory_info().rss / 1024 / 1024, proc.num_threads(), proc.num_fds()
+
+
+class StreamClient:
+    """
+    SSE 연결 하나: 응답 헤더를 확인한 뒤 heartbeat/알림 도착만 기록
+    """
+
+    def __init__(self, user_index):
+        self.user_index = user_index
+        self.pings = 0
+        self.received = {}
+        self.writer = None
+
+    async def connect(self, port, token):
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.writer.write(
+            (
+                "GET /api/notifications/stream/ HTTP/1.1\r\n"
+                "Host: bench\r\n"
+                f"Authorization: Bearer {token}\r\n"
+                "Accept: text/event-stream\r\n\r\n"
+            ).encode()
+        )
+        await self.writer.drain()
+        header = await reader.readuntil(b"\r\n\r\n")
+        if not header.startswith(b"HTTP/1.1 200"):
+            raise RuntimeError(header.split(b"\r\n", 1)[0].decode())
+        return reader
+
+    async def read(self, reader):
+        buffer = b""
+        while chunk := await reader.read(4096):
+            buffer += chunk
+            self.pings += chunk.count(b": ping")
+            while b"\n\n" in buffer:
+                event, buffer = buffer.split(b"\n\n", 1)
+                for line in event.split(b"\n"):
+                    if line.startswith(b"data: {"):
+                        data = json.loads(line[6:])
+                        self.received[data["message"]] = time.perf_counter()
+
+
+async def post_notification(port, token, user_id, message):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps({"user": user_id, "message": message}).encode()
+    writer.write(
+        (
+            "POST /api/notifications/ HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n"
+            f"Authorization: Bearer {token}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode()
+        + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    writer.close()
+    if b" 201 " not in status_line:
+        raise RuntimeError(f"알림 생성 실패: {status_line!r}")
+
+
+async def run(args, port, master_pid, users, tokens):
+    worker = worker_process(master_pid)
+    rss_before, threads_before, fds_before = process_usage(worker)
+
+    clients = [StreamClient(i % len(users)) for i in range(args.connections)]
+    readers = []
+    connect_limit = asyncio.Semaphore(args.connect_concurrency)
+    started = time.perf_counter()
+
+    async def open_stream(client):
+        async with connect_limit:
+            reader = await client.connect(port, tokens[client.user_index])
+        readers.append(asyncio.create_task(client.read(reader)))
+
+    results = await asyncio.gather(*(open_stream(c) for c in clients), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    connect_seconds = time.perf_counter() - started
+    connected = args.connections - len(errors)
+    print(
+        f"connected={connected}/{args.connections} in {connect_seconds:.1f}s errors={len(errors)}"
+    )
+    if errors:
+        print(f"  first error: {errors[0]!r}")
+
+    await asyncio.sleep(args.hold)
+    rss, threads, fds = process_usage(worker)
+    per_connection_kb = (rss - rss_before) * 1024 / max(connected, 1)
+    print(
+        f"worker rss={rss_before:.1f}MB -> {rss:.1f}MB ({per_connection_kb:.1f}KB/conn) "
+        f"threads={threads_before} -> {threads} fds={fds_before} -> {fds}"
+    )
+    alive = [c for c in clients if c.writer is not None]
+    pings = [c.pings for c in alive]
+    expected = args.hold / args.heartbeat
+    print(
+        f"heartbeats per conn over {args.hold}s: min={min(pings)} "
+        f"median={statistics.median(pings)} (expected ~{expected:.0f})"
+    )
+
+    # 사용자 일부에게 알림을 하나씩 만들고, 그 사용자의 모든 연결에 도착하기까지 지연 측정
+    latencies = []
+    for i in range(min(args.samples, len(users))):
+        message = f"bench-{i}"
+        sent = time.perf_counter()
+        await post_notification(port, tokens[i], users[i], message)
+        targets = [c for c in alive if c.user_index == i]
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and any(message not in c.received for c in targets):
+            await asyncio.sleep(0.005)
+        latencies.extend(
+            (c.received[message] - sent) * 1000 for c in targets if message in c.received
+        )
+        missing = sum(message not in c.received for c in targets)
+        if missing:
+            print(f"  {message}: {missing}/{len(targets)}개 연결에 도착하지 않음")
+    if latencies:
+        print(
+            f"fan-out latency ({len(latencies)} deliveries, "
+            f"{args.connections // len(users)} conns/user): "
+            f"p50={statistics.median(latencies):.1f}ms p95={percentile(latencies, 95):.1f}ms"
+        )
+
+    for client in alive:
+        client.writer.close()
+    for task in readers:
+        task.cancel()
+    await asyncio.gather(*readers, return_exceptions=True)
+    await asyncio.sleep(2)
+    rss, threads, fds = process_usage(worker)
+    print(f"after close: rss={rss:.1f}MB threads={threads} fds={fds}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=2000, help="동시 SSE 연결 수")
+    parser.add_argument("--users", type=int, default=100, help="연결을 나눠 가질 사용자 수")
+    parser.add_argument("--hold", type=float, default=30, help="유휴 상태로 유지할 시간(초)")
+    parser.add_argument("--heartbeat", type=int, default=5, help="heartbeat 간격(초)")
+    parser.add_argument("--samples", type=int, default=20, help="알림 전달 지연을 잴 사용자 수")
+    parser.add_argument("--connect-concurrency", type=int, default=50, help="동시 연결 시도 수")
+    args = parser.parse_args()
+
+    # 연결 수만큼 fd가 필요하므로 soft limit을 hard limit까지 올림 (서버 프로세스도 상속)
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from apps.members.models import User
+
+    stamp = int(time.time())
+    users = [
+        User.objects.create_user(
+            email=f"bench-stream-{stamp}-{i}@example.com", password="bench-pass-123", name="Bench"
+        )
+        for i in range(args.users)
+    ]
+    settings_dir = tempfile.TemporaryDirectory()
+    server = None
+    try:
+        tokens = [str(AccessToken.for_user(user)) for user in users]
+        with open(os.path.join(settings_dir.name, "bench_stream_settings.py"), "w") as fp:
+            fp.write(BENCH_SETTINGS)
+        port = free_port()
+        env = {
+            **os.environ,
+            "SERVER_MODE": "asgi",
+            "GUNICORN_BIND": f"127.0.0.1:{port}",
+            "GUNICORN_WORKERS": "1",
+            "GUNICORN_ACCESSLOG": "",
+            "GUNICORN_MAX_REQUESTS": "0",
+            "GUNICORN_TIMEOUT": "0",
+            "NOTIFICATION_PUBSUB_URL": "",
+            "NOTIFICATION_STREAM_HEARTBEAT_SECONDS": str(args.heartbeat),
+            "DJANGO_SETTINGS_MODULE": "bench_stream_settings",
+            "PYTHONPATH": os.pathsep.join([settings_dir.name, ROOT]),
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "config/gunicorn.conf.py"],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.3)
+        time.sleep(1)
+        print(
+            f"cpus={os.cpu_count()} connections={args.connections} users={args.users} "
+            f"heartbeat={args.heartbeat}s hold={args.hold}s"
+        )
+        asyncio.run(run(args, port, server.pid, [user.id for user in users], tokens))
+    finally:
+        if server is not None:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+        settings_dir.cleanup()
+        for user in users:
+            user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+알림함 폴링 비교: 전체 읽지 않은 알림 목록 vs 키셋 첫 페이지/깊은 페이지 vs 개수 COUNT vs 캐시 카운터
+
+--users명의 사용자에게 알림을 나눠 만들고(--unread-ratio만큼 읽지 않음), 벤치 사용자 한 명 기준으로 측정.
+기존 응답(페이지네이션 없는 읽지 않은 목록)은 같은 쿼리를 직렬화까지 해서 재현함.
+"모두 읽음"은 알림마다 PATCH /{id}/read/ 하던 방식과 일괄 처리 API(UPDATE 1번)를 비교.
+마지막에 읽지 않은 목록 첫 페이지 쿼리의 EXPLAIN을 출력해서 부분 인덱스를 타는지 확인.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_notifications.py --notifications 20000 --requests 100
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(label, count, func):
+    func()  # 워밍업
+    timings = []
+    for _ in range(count):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(
+        f"{label:<28} p50={statistics.median(timings):8.2f}ms p95={percentile(timings, 95):8.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--notifications", type=int, default=20000, help="벤치 사용자 알림 수")
+    parser.add_argument("--users", type=int, default=5, help="알림을 가진 사용자 수")
+    parser.add_argument("--unread-ratio", type=float, default=0.2, help="읽지 않은 알림 비율")
+    parser.add_argument("--requests", type=int, default=100, help="모드별 요청 수")
+    parser.add_argument("--mark-read", type=int, default=500, help="모두 읽음 비교에 쓸 알림 수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from django.db import connection
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+
+    from apps.members.models import User
+    from apps.notification.models import Notification
+    from apps.notification.pagination import NotificationCursorPagination
+    from apps.notification.serializers import NotificationSerializer
+    from apps.notification.services import get_unread_count
+
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    settings.MIDDLEWARE = [name for name in settings.MIDDLEWARE if "debug_toolbar" not in name]
+    # 프로세스 하나에서만 읽고 쓰므로 로컬 메모리 캐시여도 카운터 경로를 측정
+    settings.CACHE_SHARED = True
+    stamp = int(time.time())
+    users = [
+        User.objects.create_user(
+            email=f"bench-notif-{stamp}-{i}@example.com", password="bench-pass-123", name="Bench"
+        )
+        for i in range(args.users)
+    ]
+    user = users[0]
+    try:
+        now = timezone.now()
+        unread_every = max(1, round(1 / args.unread_ratio)) if args.unread_ratio else 0
+        for owner in users:
+            Notification.objects.bulk_create(
+                (
+                    Notification(
+                        user=owner,
+                        message=f"bench {i}",
+                        is_read=not (unread_every and i % unread_every == 0),
+                    )
+                    for i in range(args.notifications)
+                ),
+                batch_size=5000,
+            )
+        # auto_now_add라 bulk_create 후 시각을 id 순으로 흩뿌림
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE notification_notification SET created_at = %s - (id * interval '1 second') "
+                "WHERE user_id = ANY(%s)",
+                [now, [owner.id for owner in users]],
+            )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE notification_notification")
+
+        unread = Notification.objects.filter(user=user, is_read=False, deleted_at__isnull=True)
+        print(
+            f"notifications/user={args.notifications} users={args.users} "
+            f"unread/user={unread.count()}"
+        )
+
+        client = APIClient()
+        client.force_authenticate(user)
+        measure(
+            "unread list (unpaginated)",
+            args.requests,
+            lambda: NotificationSerializer(unread.all(), many=True).data,
+        )
+        measure(
+            "unread list (first page)",
+            args.requests,
+            lambda: client.get("/api/notifications/unread/"),
+        )
+        # 깊은 페이지: 가장 오래된 읽지 않은 알림 직전 커서
+        response = client.get("/api/notifications/unread/")
+        page_size = NotificationCursorPagination.page_size
+        for _ in range(max(0, unread.count() // page_size - 2)):
+            if not response.data["next"]:
+                break
+            response = client.get(response.data["next"])
+        deep_url = response.data["next"] or "/api/notifications/unread/"
+        measure("unread list (deep page)", args.requests, lambda: client.get(deep_url))
+        measure("unread COUNT(*)", args.requests, lambda: unread.all().count())
+        measure(
+            "unread-count (cached)",
+            args.requests,
+            lambda: client.get("/api/notifications/unread-count/"),
+        )
+        assert get_unread_count(user.id) == unread.count()
+
+        # 모두 읽음: 같은 알림 묶음을 읽지 않음으로 되돌려 가며 두 방식을 비교
+        target_ids = list(unread.values_list("id", flat=True)[: args.mark_read])
+        target = Notification.objects.filter(id__in=target_ids)
+        started = time.perf_counter()
+        for pk in target_ids:
+            client.patch(f"/api/notifications/{pk}/read/")
+        per_item = (time.perf_counter() - started) * 1000
+        target.update(is_read=False)
+        started = time.perf_counter()
+        response = client.post("/api/notifications/mark-read/", {"ids": target_ids}, format="json")
+        bulk = (time.perf_counter() - started) * 1000
+        target.update(is_read=False)
+        print(
+            f"mark {len(target_ids)} read: per-item={per_item:8.1f}ms "
+            f"bulk={bulk:6.1f}ms (updated={response.data['updated']})"
+        )
+
+        page = unread.order_by(*NotificationCursorPagination.ordering)[
+            : NotificationCursorPagination.page_size + 1
+        ]
+        print("\nEXPLAIN unread first page:")
+        print(page.explain())
+    finally:
+        for owner in users:
+            owner.delete()
+
+
+if __name__ == "__main__":
+    main()
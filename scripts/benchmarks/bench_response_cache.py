@@ -0,0 +1,104 @@
+"""
+목록 API 지연 시간 비교: 캐시 없음 vs 사용자별 응답 캐시 적중 vs ETag 재검증(304)
+
+캐시는 설정된 백엔드를 그대로 사용 (CACHE_URL이 있으면 Redis, 없으면 로컬 메모리).
+
+사용 예:
+    uv run python scripts/benchmarks/bench_response_cache.py --rows 200 --requests 200
+    CACHE_URL=redis://localhost:6379/1 uv run python scripts/benchmarks/bench_response_cache.py
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_requests(client, url, count, **headers):
+    timings = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = client.get(url, **headers)
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code not in (200, 304):
+            raise SystemExit(f"조회 실패: {url} {response.status_code}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200, help="리소스별 행 수")
+    parser.add_argument("--requests", type=int, default=200, help="모드별 요청 수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from rest_framework.test import APIClient
+
+    from apps.bank_account.models import Account
+    from apps.category.models import Category
+    from apps.members.models import User
+    from apps.tag.models import Tag
+
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    # dev 설정의 debug toolbar가 요청마다 패널을 렌더링하면 측정값이 묻히므로 미들웨어에서 뺌
+    settings.MIDDLEWARE = [name for name in settings.MIDDLEWARE if "debug_toolbar" not in name]
+    user = User.objects.create_user(
+        email=f"bench-response-cache-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        Account.objects.bulk_create(
+            Account(user=user, name=f"bench {i}", source_type="bank", balance=Decimal(i))
+            for i in range(args.rows)
+        )
+        Category.objects.bulk_create(
+            Category(user=user, name=f"bench {i}", kind=Category.Kind.EXPENSE)
+            for i in range(args.rows)
+        )
+        Tag.objects.bulk_create(Tag(user=user, name=f"bench {i}") for i in range(args.rows))
+
+        client = APIClient()
+        client.force_authenticate(user)
+        print(f"cache backend: {settings.CACHES['default']['BACKEND']}")
+        for url in ("/api/accounts/", "/api/categories/", "/api/tags/"):
+            settings.RESPONSE_CACHE_TIMEOUT = 0
+            uncached = run_requests(client, url, args.requests)
+
+            settings.RESPONSE_CACHE_TIMEOUT = 300
+            etag = client.get(url)["ETag"]
+            hit = run_requests(client, url, args.requests)
+            not_modified = run_requests(client, url, args.requests, HTTP_IF_NONE_MATCH=etag)
+
+            print(
+                f"{url:<18} "
+                + "  ".join(
+                    f"{label}: p50={statistics.median(values):6.2f}ms "
+                    f"p95={percentile(values, 95):6.2f}ms"
+                    for label, values in (
+                        ("no-cache", uncached),
+                        ("hit", hit),
+                        ("304", not_modified),
+                    )
+                )
+            )
+    finally:
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+목록 직렬화 처리량 비교: DRF ModelSerializer(many=True) vs values() 기반 빠른 직렬화
+
+- serialize: DB에서 읽어 둔 행을 직렬화만 하는 시간 (rows/s)
+  (거래의 태그는 빠른 직렬화 안에서 조회하므로 fast 쪽에 태그 쿼리 1번이 포함됨)
+- end-to-end: 쿼리 + 직렬화 (rows/s)
+
+사용 예:
+    uv run python scripts/benchmarks/bench_serializers.py --sizes 1000,10000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def seed(user, count):
+    # 모델별로 count건씩 생성 (거래는 태그 2개씩 연결)
+    from django.utils import timezone
+
+    from apps.bank_account.models import Account
+    from apps.category.models import Category
+    from apps.tag.models import Tag
+    from apps.transaction.models import Transaction
+
+    accounts = Account.objects.bulk_create(
+        Account(user=user, name=f"bench {i}", source_type="bank", balance=Decimal(i))
+        for i in range(count)
+    )
+    Category.objects.bulk_create(
+        Category(user=user, name=f"bench {i}", kind=Category.Kind.EXPENSE) for i in range(count)
+    )
+    tags = Tag.objects.bulk_create(Tag(user=user, name=f"bench {i}") for i in range(count))
+    now = timezone.now()
+    txs = Transaction.objects.bulk_create(
+        Transaction(
+            account=accounts[i % len(accounts)],
+            amount=Decimal(i % 1000) + Decimal("0.25"),
+            balance_after=Decimal("0"),
+            direction="expense",
+            method="card",
+            description=f"bench {i}",
+            occurred_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    )
+    TransactionTag = Transaction.tags.through
+    TransactionTag.objects.bulk_create(
+        TransactionTag(transaction_id=tx.id, tag_id=tags[(i + k) % len(tags)].id)
+        for i, tx in enumerate(txs)
+        for k in range(2)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1000,10000", help="쉼표로 구분한 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from apps.bank_account.models import Account
+    from apps.bank_account.serializers import AccountFastReadSerializer, AccountResponseSerializer
+    from apps.category.repositories import CategoryRepository
+    from apps.category.serializers import CategoryFastReadSerializer, CategoryReadSerializer
+    from apps.members.models import User
+    from apps.tag.repositories import TagRepository
+    from apps.tag.serializers import TagFastReadSerializer, TagReadSerializer
+    from apps.transaction.models import Transaction
+    from apps.transaction.repositories import TransactionRepository
+    from apps.transaction.serializers import (
+        TransactionFastReadSerializer,
+        TransactionResponseSerializer,
+    )
+
+    for size in (int(value) for value in args.sizes.split(",")):
+        user = User.objects.create_user(
+            email=f"bench-serializers-{size}-{int(time.time())}@example.com",
+            password="bench-pass-123",
+            name="Bench",
+        )
+        try:
+            seed(user, size)
+            cases = [
+                (
+                    "transaction",
+                    lambda: TransactionRepository.get_transactions_optimized(user),
+                    TransactionResponseSerializer,
+                    TransactionFastReadSerializer,
+                ),
+                (
+                    "account",
+                    lambda: Account.objects.filter(user=user),
+                    AccountResponseSerializer,
+                    AccountFastReadSerializer,
+                ),
+                (
+                    "category",
+                    lambda: CategoryRepository.list_alive(user.id),
+                    CategoryReadSerializer,
+                    CategoryFastReadSerializer,
+                ),
+                (
+                    "tag",
+                    lambda: TagRepository.list_alive(user.id),
+                    TagReadSerializer,
+                    TagFastReadSerializer,
+                ),
+            ]
+            for label, queryset, drf_serializer, fast_serializer in cases:
+                instances = list(queryset())
+                rows = list(fast_serializer.values(queryset()))
+
+                drf = best_of(lambda: drf_serializer(instances, many=True).data, args.repeat)
+                fast = best_of(
+                    lambda: fast_serializer.serialize_rows([dict(row) for row in rows]),
+                    args.repeat,
+                )
+                drf_e2e = best_of(lambda: drf_serializer(queryset(), many=True).data, args.repeat)
+                fast_e2e = best_of(lambda: fast_serializer.serialize(queryset()), args.repeat)
+                print(
+                    f"n={size:>6,} {label:<11} "
+                    f"serialize drf={size / drf:>9,.0f} fast={size / fast:>9,.0f} rows/s "
+                    f"(x{drf / fast:.1f})  "
+                    f"end-to-end drf={size / drf_e2e:>9,.0f} fast={size / fast_e2e:>9,.0f} rows/s "
+                    f"(x{drf_e2e / fast_e2e:.1f})"
+                )
+        finally:
+            Transaction.all_objects.filter(account__user=user).delete()
+            user.delete()
+
+
+if __name__ == "__main__":
+    main()
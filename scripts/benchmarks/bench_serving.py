@@ -0,0 +1,207 @@
+"""
+서빙 모드 부하 테스트: gunicorn sync vs gthread vs asgi(uvicorn 워커)
+
+모드마다 config/gunicorn.conf.py로 gunicorn을 실제로 띄우고, 클라이언트 스레드 N개가 keep-alive로
+GET /api/transactions/ 를 정해진 시간 동안 반복 요청해서 처리량과 지연 시간을 비교.
+--slow-every로 일부 요청을 큰 페이지(page_size=200)로 섞어 느린 요청이 워커를 막는 영향도 볼 수 있음.
+
+debug toolbar/DEBUG를 끈 임시 설정 모듈로 띄우며, 클라이언트도 같은 머신에서 돌기 때문에
+CPU가 적으면 절대값보다 모드 간 비율을 볼 것.
+
+사용 예:
+    uv run python scripts/benchmarks/bench_serving.py --clients 16 --duration 15
+    uv run python scripts/benchmarks/bench_serving.py --modes gthread,asgi --workers 2 --slow-every 5
+"""
+
+import argparse
+import http.client
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+BENCH_SETTINGS = """
+from config.settings.dev import *  # noqa
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != "debug_toolbar"]  # noqa: F405
+MIDDLEWARE = [name for name in MIDDLEWARE if "debug_toolbar" not in name]  # noqa: F405
+"""
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, token, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            conn.request("GET", "/api/tags/", headers={"Authorization": f"Bearer {token}"})
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.3)
+    raise SystemExit("gunicorn이 준비되지 않았습니다")
+
+
+def run_clients(port, token, clients, duration, slow_every):
+    timings, errors = [], [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        local, count = [], 0
+        while time.monotonic() < deadline:
+            count += 1
+            page_size = 200 if slow_every and count % slow_every == 0 else 50
+            started = time.perf_counter()
+            try:
+                conn.request("GET", f"/api/transactions/?page_size={page_size}", headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                ok = False
+            if ok:
+                local.append((time.perf_counter() - started) * 1000)
+            else:
+                with lock:
+                    errors[0] += 1
+        conn.close()
+        with lock:
+            timings.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return timings, errors[0], time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", default="sync,gthread,asgi", help="쉼표로 구분한 SERVER_MODE")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn 워커 수 (모드 공통)")
+    parser.add_argument("--threads", type=int, default=4, help="gthread 워커당 스레드 수")
+    parser.add_argument("--clients", type=int, default=16, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=15, help="모드별 측정 시간(초)")
+    parser.add_argument("--transactions", type=int, default=5000, help="벤치 사용자 거래 수")
+    parser.add_argument("--slow-every", type=int, default=0, help="N번째 요청마다 page_size=200")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.utils import timezone
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from apps.bank_account.models import Account
+    from apps.members.models import User
+    from apps.transaction.models import Transaction
+
+    user = User.objects.create_user(
+        email=f"bench-serving-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    settings_dir = tempfile.TemporaryDirectory()
+    try:
+        account = Account.objects.create(
+            user=user, name="Bench", source_type="bank", balance=Decimal("0")
+        )
+        now = timezone.now()
+        Transaction.objects.bulk_create(
+            (
+                Transaction(
+                    account=account,
+                    amount=Decimal(i % 1000 + 1),
+                    balance_after=Decimal("0"),
+                    direction="expense",
+                    method="card",
+                    description=f"bench {i}",
+                    occurred_at=now - timedelta(minutes=i),
+                )
+                for i in range(args.transactions)
+            ),
+            batch_size=2000,
+        )
+        token = str(AccessToken.for_user(user))
+        with open(os.path.join(settings_dir.name, "bench_serving_settings.py"), "w") as fp:
+            fp.write(BENCH_SETTINGS)
+
+        print(
+            f"cpus={os.cpu_count()} workers={args.workers} clients={args.clients} "
+            f"duration={args.duration}s slow_every={args.slow_every}"
+        )
+        for mode in args.modes.split(","):
+            port = free_port()
+            env = {
+                **os.environ,
+                "SERVER_MODE": mode,
+                "GUNICORN_BIND": f"127.0.0.1:{port}",
+                "GUNICORN_WORKERS": str(args.workers),
+                "GUNICORN_THREADS": str(args.threads if mode != "sync" else 1),
+                "GUNICORN_ACCESSLOG": "",
+                "DJANGO_SETTINGS_MODULE": "bench_serving_settings",
+                "PYTHONPATH": os.pathsep.join([settings_dir.name, ROOT]),
+            }
+            server = subprocess.Popen(
+                [sys.executable, "-m", "gunicorn", "-c", "config/gunicorn.conf.py"],
+                cwd=ROOT,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_ready(port, token)
+                timings, errors, elapsed = run_clients(
+                    port, token, args.clients, args.duration, args.slow_every
+                )
+            finally:
+                server.send_signal(signal.SIGTERM)
+                server.wait(timeout=60)
+            if not timings:
+                print(f"{mode:<8} 성공한 요청 없음 (errors={errors})")
+                continue
+            print(
+                f"{mode:<8} throughput={len(timings) / elapsed:7.1f} req/s "
+                f"p50={statistics.median(timings):7.1f}ms p95={percentile(timings, 95):7.1f}ms "
+                f"p99={percentile(timings, 99):7.1f}ms errors={errors}"
+            )
+    finally:
+        settings_dir.cleanup()
+        Transaction.all_objects.filter(account__user=user).delete()
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+거래 내보내기 메모리/시간 비교: 시리얼라이저(many=True) 전체 직렬화 vs CSV/NDJSON 스트리밍
+
+사용 예:
+    uv run python scripts/benchmarks/bench_transaction_export.py --sizes 10000,100000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def seed(account, count, batch_size=5000):
+    from django.utils import timezone
+
+    from apps.transaction.models import Transaction
+
+    start = timezone.now() - timedelta(days=365)
+    for offset in range(0, count, batch_size):
+        Transaction.objects.bulk_create(
+            Transaction(
+                account=account,
+                amount=Decimal(i % 1000 + 1),
+                balance_after=Decimal("0"),
+                direction="expense" if i % 3 else "income",
+                method="card",
+                description=f"bench {i}",
+                occurred_at=start + timedelta(minutes=i),
+            )
+            for i in range(offset, min(offset + batch_size, count))
+        )
+
+
+def measure(func):
+    # (소요 시간, 최대 추가 메모리 MiB)
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000", help="쉼표로 구분한 거래 수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from apps.bank_account.models import Account
+    from apps.members.models import User
+    from apps.transaction.exports import stream_export
+    from apps.transaction.models import Transaction
+    from apps.transaction.serializers import TransactionResponseSerializer
+
+    user = User.objects.create_user(
+        email=f"bench-export-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        account = Account.objects.create(
+            user=user, name="Bench", source_type="bank", balance=Decimal("0")
+        )
+        seeded = 0
+        for size in (int(value) for value in args.sizes.split(",")):
+            seed(account, size - seeded)
+            seeded = size
+            qs = Transaction.objects.select_related("account").filter(account__user=user)
+
+            def serialize():
+                TransactionResponseSerializer(qs, many=True).data
+
+            def stream(export_format):
+                for _ in stream_export(qs, export_format):
+                    pass
+
+            results = [
+                ("serializer", measure(serialize)),
+                ("csv", measure(lambda: stream("csv"))),
+                ("ndjson", measure(lambda: stream("ndjson"))),
+            ]
+            print(
+                f"n={size:>9,}  "
+                + "  ".join(
+                    f"{label}: {elapsed:6.2f}s {peak:8.1f}MiB" for label, (elapsed, peak) in results
+                )
+            )
+    finally:
+        Transaction.all_objects.filter(account__user=user).delete()
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+거래 N건 등록 비용 비교: create_transaction 건별 반복 vs import_transactions 일괄 등록
+
+사용 예:
+    uv run python scripts/benchmarks/bench_transaction_import.py --rows 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def build_rows(account_ids, count, seed=0):
+    from django.utils import timezone
+
+    rng = random.Random(seed)
+    start = timezone.now() - timedelta(days=90)
+    return [
+        {
+            "account": rng.choice(account_ids),
+            "amount": Decimal(rng.randint(100, 100000)) / 100,
+            "direction": rng.choice(("expense", "expense", "income")),
+            "method": rng.choice(("card", "cash", "transfer")),
+            "description": "bench",
+            "occurred_at": start + timedelta(minutes=rng.randint(0, 90 * 24 * 60)),
+        }
+        for _ in range(count)
+    ]
+
+
+def measure(label, func, count):
+    from django.db import connection, reset_queries
+
+    reset_queries()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:>8}: rows={count:,} {elapsed:8.2f}s "
+        f"({count / elapsed:,.0f} rows/s, queries={len(connection.queries):,})"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000, help="등록할 거래 수")
+    parser.add_argument("--accounts", type=int, default=3, help="거래를 나눠 넣을 계좌 수")
+    parser.add_argument("--budgets", type=int, default=3, help="벤치 사용자 예산 수")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+    from django.conf import settings
+    from django.utils import timezone
+
+    from apps.bank_account.models import Account
+    from apps.budget.models import Budget, BudgetAlertRule, BudgetScopeType, ThresholdType
+    from apps.members.models import User
+    from apps.transaction.models import Transaction
+    from apps.transaction.services import create_transaction, import_transactions
+
+    # 쿼리 수 집계를 위해 connection.queries 기록
+    settings.DEBUG = True
+    settings.TRANSACTION_IMPORT_MAX_ROWS = max(settings.TRANSACTION_IMPORT_MAX_ROWS, args.rows)
+
+    user = User.objects.create_user(
+        email=f"bench-import-{int(time.time())}@example.com",
+        password="bench-pass-123",
+        name="Bench",
+    )
+    try:
+        accounts = [
+            Account.objects.create(
+                user=user, name=f"Bench {i}", source_type="bank", balance=Decimal("0")
+            )
+            for i in range(args.accounts)
+        ]
+        today = timezone.localdate()
+        for i in range(args.budgets):
+            budget = Budget.objects.create(
+                user=user,
+                name=f"bench-{i}",
+                period_start=today - timedelta(days=120),
+                period_end=today,
+                amount_limit=Decimal("1000000000"),
+                scope_type=BudgetScopeType.ALL,
+            )
+            BudgetAlertRule.objects.create(
+                budget=budget,
+                threshold_type=ThresholdType.PERCENT,
+                threshold_value=Decimal("90"),
+            )
+
+        rows = build_rows([account.id for account in accounts], args.rows)
+
+        def per_row():
+            for row in rows:
+                create_transaction(
+                    user,
+                    account_id=row["account"],
+                    amount=row["amount"],
+                    direction=row["direction"],
+                    method=row["method"],
+                    description=row["description"],
+                    occurred_at=row["occurred_at"],
+                )
+
+        serial = measure("per-row", per_row, len(rows))
+        Transaction.all_objects.filter(account__user=user).delete()
+
+        bulk = measure("import", lambda: import_transactions(user, rows), len(rows))
+        print(f"speedup x{serial / bulk:.1f}")
+    finally:
+        Transaction.all_objects.filter(account__user=user).delete()
+        user.delete()
+
+
+if __name__ == "__main__":
+    main()
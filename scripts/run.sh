@@ -6,5 +6,6 @@ uv run python manage.py migrate --noinput
 if [ "${DEBUG}" = "1" ]; then
   uv run python manage.py runserver 0.0.0.0:8000
 else
-  uv run gunicorn config.wsgi:application --bind 0.0.0.0:8000 --workers 2
+  # SERVER_MODE=gthread(기본)|asgi|sync, 워커/스레드 수는 config/gunicorn.conf.py 참고
+  uv run gunicorn -c config/gunicorn.conf.py
 fi